@@ -30,7 +30,9 @@ from .coordinates import (
     convert_enu_to_horizontal,
     convert_lla_to_ecef,
     convert_perifocal_to_eci,
+    get_eci_coordinate,
     get_perifocal_coordinate,
+    get_perifocal_coordinates,
 )
 from .covariance import Covariance
 from .earth import (
@@ -45,6 +47,7 @@ from .frame import (
     Reference,
     Transform,
     TransformProvider,
+    cache_transform_provider,
 )
 from .frames import (
     ECEF,
@@ -64,14 +67,17 @@ from .hohmann import (
 from .interpolation import (
     BarycentricLagrange3DPositionInterpolator,
     Base3DInterpolator,
+    BaseHermite3DInterpolator,
     Hermite3DKinematicInterpolator,
     Hermite3DPositionInterpolator,
 )
 from .kepler import (
+    get_eccentric_anomalies,
     get_eccentric_anomaly,
     get_semi_latus_rectum,
     get_semi_major_axis,
     get_true_anomaly,
+    get_true_anomaly_from_eccentric_anomaly,
 )
 from .light import (
     convert_distance_to_light_travel_time,
@@ -122,6 +128,7 @@ from .transforms import (
     teme_to_eci_transform_provider,
 )
 from .vector import (
+    Axis,
     Vector,
     add,
     angle,
@@ -169,6 +176,7 @@ __all__: list[str] = [
     "add",
     "angle",
     "c",
+    "cache_transform_provider",
     "convert_distance_to_light_travel_time",
     "convert_ecef_to_eci",
     "convert_ecef_to_enu",
@@ -190,7 +198,9 @@ __all__: list[str] = [
     "ecef_to_eci_transform_provider",
     "eci_to_ecef_transform_provider",
     "eme2000_to_eci_transform_provider",
+    "get_eccentric_anomalies",
     "get_eccentric_anomaly",
+    "get_eci_coordinate",
     "get_gravitational_acceleration",
     "get_hohmann_transfer_eccentricity",
     "get_hohmann_transfer_parameters",
@@ -200,10 +210,12 @@ __all__: list[str] = [
     "get_modified_julian_date_from_parts",
     "get_orbital_radius",
     "get_perifocal_coordinate",
+    "get_perifocal_coordinates",
     "get_perifocal_velocity",
     "get_semi_latus_rectum",
     "get_semi_major_axis",
     "get_true_anomaly",
+    "get_true_anomaly_from_eccentric_anomaly",
     "get_rotation_matrix_x",
     "get_rotation_matrix_y",
     "get_rotation_matrix_z",
@@ -221,8 +233,10 @@ __all__: list[str] = [
     "rotate",
     "subtract",
     "Acceleration",
+    "Axis",
     "BarycentricLagrange3DPositionInterpolator",
     "Base3DInterpolator",
+    "BaseHermite3DInterpolator",
     "Body",
     "CartesianCoordinate",
     "Covariance",
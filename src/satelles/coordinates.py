@@ -6,8 +6,9 @@
 # **************************************************************************************
 
 from datetime import datetime
+from functools import lru_cache
 from math import asin, atan2, cos, degrees, pi, pow, radians, sin, sqrt
-from typing import TypedDict
+from typing import List, Sequence, Tuple, TypedDict
 
 from celerity.constants import c as SPEED_OF_LIGHT
 from celerity.coordinates import (
@@ -23,8 +24,11 @@ from celerity.temporal import (
 
 from .common import CartesianCoordinate, TopocentricCoordinate
 from .earth import EARTH_EQUATORIAL_RADIUS, EARTH_FLATTENING_FACTOR
+from .kepler import (
+    get_eccentric_anomalies,
+    get_true_anomaly_from_eccentric_anomaly,
+)
 from .orbit import get_orbital_radius
-from .vector import rotate
 
 # **************************************************************************************
 
@@ -67,8 +71,11 @@ def get_perifocal_coordinate(
         eccentricity=eccentricity,
     )
 
-    x_perifocal = r * cos(radians(true_anomaly))
-    y_perifocal = r * sin(radians(true_anomaly))
+    # Convert the true anomaly to radians once, and share it across both components:
+    ν = radians(true_anomaly)
+
+    x_perifocal = r * cos(ν)
+    y_perifocal = r * sin(ν)
 
     # The z-coordinate is always zero in the perifocal frame:
     return CartesianCoordinate(x=x_perifocal, y=y_perifocal, z=0.0)
@@ -77,6 +84,101 @@ def get_perifocal_coordinate(
 # **************************************************************************************
 
 
+def get_perifocal_coordinates(
+    semi_major_axis: float,
+    mean_anomalies: Sequence[float],
+    eccentricity: float,
+) -> List[CartesianCoordinate]:
+    """
+    Calculate the positions in the perifocal coordinate system for an ensemble of
+    epochs along the same orbit.
+
+    This is equivalent to calling get_perifocal_coordinate for each mean anomaly, but
+    solves Kepler's equation only once per epoch, deriving both the orbital radius and
+    the true anomaly from the same eccentric anomaly.
+
+    Args:
+        semi_major_axis: The semi-major axis (a) (in meters).
+        mean_anomalies: The mean anomalies (M) (in degrees).
+        eccentricity: The orbital eccentricity (e), (unitless).
+
+    Raises:
+        ValueError: If the eccentricity is not within the range [0, 1).
+
+    Returns:
+        List[CartesianCoordinate]: The positions in the perifocal coordinate system
+            (x, y, z), in the same order as the input mean anomalies.
+    """
+    # Solve Kepler's equation once across the whole ensemble:
+    anomalies = get_eccentric_anomalies(mean_anomalies, eccentricity)
+
+    coordinates: List[CartesianCoordinate] = []
+
+    for E in anomalies:
+        # Calculate the orbital radius (r) for the body:
+        r = semi_major_axis * (1 - eccentricity * cos(radians(E)))
+
+        # Derive the true anomaly (ν) from the eccentric anomaly already solved for:
+        ν = radians(get_true_anomaly_from_eccentric_anomaly(E, eccentricity))
+
+        # The z-coordinate is always zero in the perifocal frame:
+        coordinates.append(CartesianCoordinate(x=r * cos(ν), y=r * sin(ν), z=0.0))
+
+    return coordinates
+
+
+# **************************************************************************************
+
+
+@lru_cache(maxsize=128)
+def _get_perifocal_to_eci_rotation_matrix(
+    argument_of_perigee: float,
+    inclination: float,
+    raan: float,
+) -> Tuple[float, float, float, float, float, float, float, float, float]:
+    """
+    Compute the row-major coefficients of the composed perifocal to ECI rotation
+    matrix R = Rz(Ω) · Rx(i) · Rz(ω).
+
+    The orientation elements of an orbit are constant between epochs, so the matrix
+    is cached and repeated conversions for the same orbit skip the trigonometry.
+
+    Args:
+        argument_of_perigee (float): The argument of perigee (ω) (in degrees).
+        inclination (float): The inclination (i) (in degrees).
+        raan (float): The right ascension of ascending node (Ω) (in degrees).
+
+    Returns:
+        Tuple[float, ...]: The nine coefficients (r11, r12, r13, ..., r33).
+    """
+    ω = radians(argument_of_perigee)
+
+    i = radians(inclination)
+
+    Ω = radians(raan)
+
+    cω, sω = cos(ω), sin(ω)
+
+    ci, si = cos(i), sin(i)
+
+    cΩ, sΩ = cos(Ω), sin(Ω)
+
+    return (
+        cΩ * cω - sΩ * ci * sω,
+        -cΩ * sω - sΩ * ci * cω,
+        sΩ * si,
+        sΩ * cω + cΩ * ci * sω,
+        -sΩ * sω + cΩ * ci * cω,
+        -cΩ * si,
+        si * sω,
+        si * cω,
+        ci,
+    )
+
+
+# **************************************************************************************
+
+
 def convert_perifocal_to_eci(
     perifocal: CartesianCoordinate,
     argument_of_perigee: float,
@@ -95,17 +197,75 @@ def convert_perifocal_to_eci(
     Returns:
         CartesianCoordinate: The ECI coordinates (x, y, z).
     """
-    # Rotate by argument of perigee around the z-axis:
-    rotated_z = rotate(perifocal, argument_of_perigee, "z")
+    # Compose the rotations by argument of perigee around the z-axis, inclination
+    # around the x-axis and RAAN around the z-axis into a single matrix:
+    r11, r12, r13, r21, r22, r23, r31, r32, r33 = _get_perifocal_to_eci_rotation_matrix(
+        argument_of_perigee, inclination, raan
+    )
+
+    x, y, z = perifocal["x"], perifocal["y"], perifocal["z"]
+
+    # Apply the composed rotation in a single pass:
+    return CartesianCoordinate(
+        x=r11 * x + r12 * y + r13 * z,
+        y=r21 * x + r22 * y + r23 * z,
+        z=r31 * x + r32 * y + r33 * z,
+    )
+
+
+# **************************************************************************************
 
-    # Rotate by inclination around the x-axis:
-    rotated_x = rotate(rotated_z, inclination, "x")
 
-    # Rotate by Right Ascension of Ascending Node (RAAN) around the z-axis:
-    eci = rotate(rotated_x, raan, "z")
+def get_eci_coordinate(
+    semi_major_axis: float,
+    mean_anomaly: float,
+    true_anomaly: float,
+    eccentricity: float,
+    argument_of_perigee: float,
+    inclination: float,
+    raan: float,
+) -> CartesianCoordinate:
+    """
+    Calculate the Earth-Centered Inertial (ECI) position of a satellite directly from
+    its orbital elements.
 
-    # The ECI coordinates are now in the rotated frame:
-    return eci
+    This is equivalent to converting the result of get_perifocal_coordinate with
+    convert_perifocal_to_eci, but computes the in-plane components as local values
+    and applies the composed rotation in the same step.
+
+    Args:
+        semi_major_axis: The semi-major axis (a) (in meters).
+        mean_anomaly: The mean anomaly (M) (in degrees).
+        true_anomaly: The true anomaly (ν) (in degrees).
+        eccentricity: The orbital eccentricity (e), (unitless).
+        argument_of_perigee: The argument of perigee (ω) (in degrees).
+        inclination: The inclination (i) (in degrees).
+        raan: The right ascension of ascending node (Ω) (in degrees).
+
+    Returns:
+        CartesianCoordinate: The ECI coordinates (x, y, z).
+    """
+    # Calculate the orbital radius (r) for the body:
+    r = get_orbital_radius(
+        semi_major_axis=semi_major_axis,
+        mean_anomaly=mean_anomaly,
+        eccentricity=eccentricity,
+    )
+
+    ν = radians(true_anomaly)
+
+    # The in-plane perifocal components (the z-component is always zero):
+    x, y = r * cos(ν), r * sin(ν)
+
+    r11, r12, _, r21, r22, _, r31, r32, _ = _get_perifocal_to_eci_rotation_matrix(
+        argument_of_perigee, inclination, raan
+    )
+
+    return CartesianCoordinate(
+        x=r11 * x + r12 * y,
+        y=r21 * x + r22 * y,
+        z=r31 * x + r32 * y,
+    )
 
 
 # **************************************************************************************
@@ -129,17 +289,19 @@ def convert_eci_to_perifocal(
     Returns:
         CartesianCoordinate: The perifocal coordinates (x, y, z).
     """
-    # Inverse rotate by Right Ascension of Ascending Node (RAAN) around the z-axis:
-    rotated_z = rotate(eci, -raan, "z")
-
-    # Inverse rotate by inclination around the x-axis:
-    rotated_x = rotate(rotated_z, -inclination, "x")
+    # The inverse of the composed rotation matrix is its transpose:
+    r11, r12, r13, r21, r22, r23, r31, r32, r33 = _get_perifocal_to_eci_rotation_matrix(
+        argument_of_perigee, inclination, raan
+    )
 
-    # Inverse rotate by argument of perigee around the z-axis:
-    perifocal = rotate(rotated_x, -argument_of_perigee, "z")
+    x, y, z = eci["x"], eci["y"], eci["z"]
 
-    # The perifocal coordinates are now in the inversely rotated frame:
-    return perifocal
+    # Apply the transposed rotation in a single pass:
+    return CartesianCoordinate(
+        x=r11 * x + r21 * y + r31 * z,
+        y=r12 * x + r22 * y + r32 * z,
+        z=r13 * x + r23 * y + r33 * z,
+    )
 
 
 # **************************************************************************************
@@ -8,10 +8,12 @@
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Callable, List, Optional
+from functools import lru_cache
+from typing import Callable, FrozenSet, Iterable, List, Optional, Tuple
 
 from .body import Body
 from .common import CartesianCoordinate
+from .matrix import Matrix3x3, multiply
 from .origin import Origin
 from .quaternion import Quaternion
 
@@ -49,30 +51,62 @@ class Reference(Enum):
         """
         Whether this reference frame is inertial (non-rotating) or not.
         """
-        return self in {
-            Reference.ECI,
-            Reference.ICRF,
-            Reference.EME2000,
-            Reference.TEME,
-        }
+        return self in INERTIAL_REFERENCES
 
     @property
     def is_rotating(self) -> bool:
         """
         Whether this reference frame is rotating with the Earth or not.
         """
-        return self in {
-            Reference.ECEF,
-            Reference.ITRF,
-            Reference.TOPOCENTRIC,
-        }
+        return self in ROTATING_REFERENCES
 
 
 # **************************************************************************************
 
+# The reference frames that are inertial (non-rotating), built once at import:
+INERTIAL_REFERENCES: FrozenSet[Reference] = frozenset(
+    {
+        Reference.ECI,
+        Reference.ICRF,
+        Reference.EME2000,
+        Reference.TEME,
+    }
+)
 
-@dataclass(frozen=True)
-class Transform:
+# **************************************************************************************
+
+# The reference frames that rotate with the Earth, built once at import:
+ROTATING_REFERENCES: FrozenSet[Reference] = frozenset(
+    {
+        Reference.ECEF,
+        Reference.ITRF,
+        Reference.TOPOCENTRIC,
+    }
+)
+
+# **************************************************************************************
+
+
+class _TransformMemo:
+    """
+    Private storage for the values memoised by a Transform.
+
+    The memo lives in a slot of this base class rather than in a dataclass field, so it
+    is not part of the transform's fields (e.g., for dataclasses.fields() or asdict()).
+    """
+
+    __slots__ = ("_rotation_matrix",)
+
+    # The rotation matrix equivalent to the (immutable) rotation, derived lazily on first
+    # use and then reused for every subsequent position the transform is applied to:
+    _rotation_matrix: Optional[Matrix3x3]
+
+
+# **************************************************************************************
+
+
+@dataclass(frozen=True, slots=True)
+class Transform(_TransformMemo):
     """
     A class representing a coordinate transformation between reference frames.
     """
@@ -83,6 +117,63 @@ class Transform:
     # The translation vector from source to target frame:
     translation: CartesianCoordinate
 
+    @property
+    def rotation_matrix(self) -> Matrix3x3:
+        """
+        The 3x3 rotation matrix equivalent to this transform's rotation.
+        """
+        # The memo slot is unset until the matrix is first derived:
+        matrix = getattr(self, "_rotation_matrix", None)
+
+        if matrix is None:
+            matrix = self.rotation.to_rotation_matrix()
+            # The dataclass is frozen, so bypass __setattr__ to memoise the matrix:
+            object.__setattr__(self, "_rotation_matrix", matrix)
+
+        return matrix
+
+    def _rotate_xyz(self, x: float, y: float, z: float) -> Tuple[float, float, float]:
+        """
+        Rotate the vector (x, y, z) into the target-frame axes.
+
+        Args:
+            x (float): The x component of the vector in the source frame.
+            y (float): The y component of the vector in the source frame.
+            z (float): The z component of the vector in the source frame.
+
+        Returns:
+            Tuple[float, float, float]: The rotated (x, y, z) components.
+        """
+        (r00, r01, r02), (r10, r11, r12), (r20, r21, r22) = self.rotation_matrix
+
+        return (
+            r00 * x + r01 * y + r02 * z,
+            r10 * x + r11 * y + r12 * z,
+            r20 * x + r21 * y + r22 * z,
+        )
+
+    def _apply_xyz(self, x: float, y: float, z: float) -> Tuple[float, float, float]:
+        """
+        Apply this transform to the position (x, y, z) in the source frame.
+
+        Args:
+            x (float): The x component of the position in the source frame.
+            y (float): The y component of the position in the source frame.
+            z (float): The z component of the position in the source frame.
+
+        Returns:
+            Tuple[float, float, float]: The (x, y, z) components in the target frame.
+        """
+        rx, ry, rz = self._rotate_xyz(x, y, z)
+
+        translation = self.translation
+
+        return (
+            rx + translation["x"],
+            ry + translation["y"],
+            rz + translation["z"],
+        )
+
     def apply_to_position(self, position: CartesianCoordinate) -> CartesianCoordinate:
         """
         Apply this transform to a position vector in the source frame.
@@ -93,38 +184,85 @@ class Transform:
         Returns:
             CartesianCoordinate: The position vector in the target frame.
         """
-        # Rotate the position into the target-frame axes:
-        rotated = self.rotation.rotate_vector(position)
-
-        # Apply the translation in the target frame:
-        return CartesianCoordinate(
-            x=rotated["x"] + self.translation["x"],
-            y=rotated["y"] + self.translation["y"],
-            z=rotated["z"] + self.translation["z"],
-        )
+        # Rotate the position into the target-frame axes, and apply the translation in
+        # the target frame:
+        x, y, z = self._apply_xyz(position["x"], position["y"], position["z"])
+
+        return CartesianCoordinate(x=x, y=y, z=z)
+
+    def apply_to_positions(
+        self, positions: Iterable[CartesianCoordinate]
+    ) -> List[CartesianCoordinate]:
+        """
+        Apply this transform to many position vectors in the source frame.
+
+        The rotation matrix and translation are resolved once and reused for every
+        position, which is cheaper than calling apply_to_position for each position.
+
+        Args:
+            positions (Iterable[CartesianCoordinate]): The position vectors in the
+                source frame.
+
+        Returns:
+            List[CartesianCoordinate]: The position vectors in the target frame, in the
+                same order as the input positions.
+        """
+        (r00, r01, r02), (r10, r11, r12), (r20, r21, r22) = self.rotation_matrix
+
+        tx, ty, tz = self.translation["x"], self.translation["y"], self.translation["z"]
+
+        transformed: List[CartesianCoordinate] = []
+
+        for position in positions:
+            x, y, z = position["x"], position["y"], position["z"]
+
+            transformed.append(
+                CartesianCoordinate(
+                    x=r00 * x + r01 * y + r02 * z + tx,
+                    y=r10 * x + r11 * y + r12 * z + ty,
+                    z=r20 * x + r21 * y + r22 * z + tz,
+                )
+            )
+
+        return transformed
 
     def inverse(self) -> "Transform":
         """
         Return the inverse transform (target -> source).
+
+        Note: the inverse is derived afresh on each call rather than memoised, as the
+        translation is a mutable mapping that may change after it is derived.
         """
         # Invert the rotation:
         rotation = self.rotation.inverse()
 
-        # Rotate the inverse position into the target frame:
-        translated = rotation.rotate_vector(self.translation)
+        # The inverse rotation matrix is the transpose of this rotation matrix:
+        (r00, r01, r02), (r10, r11, r12), (r20, r21, r22) = self.rotation_matrix
+
+        tx, ty, tz = self.translation["x"], self.translation["y"], self.translation["z"]
 
-        # Invert the translation:
+        # Rotate the translation back into the source frame, and invert it:
         translation = CartesianCoordinate(
-            x=-translated["x"],
-            y=-translated["y"],
-            z=-translated["z"],
+            x=-(r00 * tx + r10 * ty + r20 * tz),
+            y=-(r01 * tx + r11 * ty + r21 * tz),
+            z=-(r02 * tx + r12 * ty + r22 * tz),
         )
 
-        return Transform(
+        inverse = Transform(
             rotation=rotation,
             translation=translation,
         )
 
+        # Seed the inverse with the transposed rotation matrix, so that it does not need
+        # to be derived again from the inverted quaternion:
+        object.__setattr__(
+            inverse,
+            "_rotation_matrix",
+            ((r00, r10, r20), (r01, r11, r21), (r02, r12, r22)),
+        )
+
+        return inverse
+
     def compose(self, other: "Transform") -> "Transform":
         """
         Compose two transforms (this: B->C, other: A->B) to get a new transform (A->C).
@@ -135,20 +273,33 @@ class Transform:
         Returns:
             Transform: The composed transform from source of other to target of this.
         """
-        # Rotate other's translation into this transform's target frame:
-        translated = self.rotation.rotate_vector(other.translation)
+        offset = other.translation
 
-        translation = CartesianCoordinate(
-            x=translated["x"] + self.translation["x"],
-            y=translated["y"] + self.translation["y"],
-            z=translated["z"] + self.translation["z"],
-        )
+        # Rotate other's translation into this transform's target frame, and offset it
+        # by this transform's translation:
+        x, y, z = self._apply_xyz(offset["x"], offset["y"], offset["z"])
+
+        translation = CartesianCoordinate(x=x, y=y, z=z)
 
-        return Transform(
+        composed = Transform(
             rotation=self.rotation * other.rotation,
             translation=translation,
         )
 
+        # When both rotation matrices have already been derived, seed the composed
+        # transform with their product, so that applying it to positions does not need
+        # to derive the matrix again from the composed quaternion:
+        matrix = getattr(self, "_rotation_matrix", None)
+
+        other_matrix = getattr(other, "_rotation_matrix", None)
+
+        if matrix is not None and other_matrix is not None:
+            object.__setattr__(
+                composed, "_rotation_matrix", multiply(matrix, other_matrix)
+            )
+
+        return composed
+
 
 # **************************************************************************************
 
@@ -157,7 +308,51 @@ TransformProvider = Callable[[datetime], Transform]
 # **************************************************************************************
 
 
-@dataclass(frozen=True)
+def cache_transform_provider(
+    provider: TransformProvider, maxsize: Optional[int] = 1024
+) -> TransformProvider:
+    """
+    Wrap a transform provider so that transforms are memoised by the requested time.
+
+    Frame graph traversals request the same frame-to-parent transforms repeatedly for
+    the same epoch (e.g., when transforming many satellites at one instant), so caching
+    avoids recomputing the underlying rotation for every request.
+
+    The cached transform for each epoch is shared, but its translation is a mutable
+    dictionary, so every caller receives a copy with its own translation. The rotation
+    and its rotation matrix are immutable, and are shared between the copies.
+
+    Args:
+        provider (TransformProvider): The transform provider to wrap.
+        maxsize (Optional[int]): The maximum number of cached epochs, or None for an
+            unbounded cache. Defaults to 1024.
+
+    Returns:
+        TransformProvider: The memoised transform provider.
+    """
+    cached = lru_cache(maxsize=maxsize)(provider)
+
+    def provide(when: datetime) -> Transform:
+        transform = cached(when)
+
+        copy = Transform(
+            rotation=transform.rotation,
+            translation=CartesianCoordinate(**transform.translation),
+        )
+
+        # Seed the copy with the cached transform's matrix, so it is derived only once
+        # per epoch:
+        object.__setattr__(copy, "_rotation_matrix", transform.rotation_matrix)
+
+        return copy
+
+    return provide
+
+
+# **************************************************************************************
+
+
+@dataclass(frozen=True, slots=True)
 class Frame:
     """
     A class representing a reference frame for positions and velocities.
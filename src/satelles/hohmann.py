@@ -5,10 +5,9 @@
 
 # **************************************************************************************
 
+from dataclasses import dataclass, fields
 from math import degrees, pi, sqrt
-from typing import Annotated
-
-from pydantic import BaseModel, Field
+from typing import Any, Dict, Mapping
 
 from .constants import GRAVITATIONAL_CONSTANT
 from .earth import EARTH_MASS
@@ -16,90 +15,105 @@ from .earth import EARTH_MASS
 # **************************************************************************************
 
 
-class HohmannTransferParameters(BaseModel):
+@dataclass(frozen=True, slots=True)
+class HohmannTransferParameters:
     """
     Represents the computed parameters of a Hohmann transfer between two circular orbits.
     """
 
-    # Initial orbit radius (in meters):
-    r1: Annotated[
-        float,
-        Field(
-            gt=0,
-            description="Initial circular orbit radius in meters",
-        ),
-    ]
-
-    # Final orbit radius (in meters):
-    r2: Annotated[
-        float,
-        Field(
-            gt=0,
-            description="Final circular orbit radius in meters",
-        ),
-    ]
-
-    # Transfer orbit semi-major axis (in meters):
-    a: Annotated[
-        float,
-        Field(
-            gt=0,
-            description="Semi-major axis of the transfer ellipse in meters",
-        ),
-    ]
-
-    # Transfer orbit eccentricity (dimensionless):
-    e: Annotated[
-        float,
-        Field(
-            ge=0,
-            lt=1,
-            description="Eccentricity of the transfer ellipse",
-        ),
-    ]
-
-    # Delta-v for the first burn at periapsis (in meters per second)
-    Δv1: Annotated[
-        float,
-        Field(
-            description="Delta-v for departure burn in meters per second",
-        ),
-    ]
-
-    # Delta-v for the second burn at apoapsis (in meters per second)
-    Δv2: Annotated[
-        float,
-        Field(
-            description="Delta-v for arrival/circularization burn in meters per second"
-        ),
-    ]
-
-    # Total delta-v (in meters per second)
-    Δv: Annotated[
-        float,
-        Field(
-            ge=0,
-            description="Total delta-v required in meters per second",
-        ),
-    ]
-    # Transfer time (in seconds)
-    T: Annotated[
-        float,
-        Field(
-            gt=0,
-            description="Time of flight for the transfer in seconds",
-        ),
-    ]
-
-    # Phase angle required for rendezvous (in degrees)
-    φ: Annotated[
-        float,
-        Field(
-            ge=-180,
-            le=180,
-            description="Required phase angle for rendezvous in degrees",
-        ),
-    ]
+    # Initial circular orbit radius (in meters):
+    r1: float
+
+    # Final circular orbit radius (in meters):
+    r2: float
+
+    # Semi-major axis of the transfer ellipse (in meters):
+    a: float
+
+    # Eccentricity of the transfer ellipse (dimensionless):
+    e: float
+
+    # Delta-v for the departure burn at periapsis (in meters per second):
+    Δv1: float
+
+    # Delta-v for the arrival/circularization burn at apoapsis (in meters per second):
+    Δv2: float
+
+    # Total delta-v required (in meters per second):
+    Δv: float
+
+    # Time of flight for the transfer (in seconds):
+    T: float
+
+    # Required phase angle for rendezvous (in degrees):
+    φ: float
+
+    def __post_init__(self) -> None:
+        """
+        Validate the transfer parameters.
+
+        Raises:
+            ValueError: If any parameter lies outside of its physically valid range.
+        """
+        # The orbit radii must be strictly positive:
+        if not self.r1 > 0:
+            raise ValueError("Initial orbit radius r1 must be positive.")
+
+        if not self.r2 > 0:
+            raise ValueError("Final orbit radius r2 must be positive.")
+
+        # The transfer ellipse semi-major axis must be strictly positive:
+        if not self.a > 0:
+            raise ValueError("Transfer semi-major axis a must be positive.")
+
+        # The transfer orbit must be elliptical, e.g., 0 <= e < 1:
+        if not 0 <= self.e < 1:
+            raise ValueError("Transfer eccentricity e must be in the range [0, 1).")
+
+        # The total delta-v must be non-negative:
+        if not self.Δv >= 0:
+            raise ValueError("Total delta-v Δv must be non-negative.")
+
+        # The time of flight must be strictly positive:
+        if not self.T > 0:
+            raise ValueError("Transfer time T must be positive.")
+
+        # The phase angle must lie within [-180, 180] degrees:
+        if not -180 <= self.φ <= 180:
+            raise ValueError("Phase angle φ must be in the range [-180, 180] degrees.")
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "HohmannTransferParameters":
+        """
+        Create the transfer parameters from a mapping, e.g., a deserialised API payload.
+
+        Each value is coerced to a float, and the parameters are then validated on
+        construction. Any keys that are not transfer parameters are ignored.
+
+        Args:
+            data: A mapping of parameter names to values.
+
+        Raises:
+            ValueError: If a parameter is missing, cannot be coerced to a float, or lies
+                outside of its physically valid range.
+
+        Returns:
+            HohmannTransferParameters: The validated transfer parameters.
+        """
+        values: Dict[str, float] = {}
+
+        for f in fields(cls):
+            if f.name not in data:
+                raise ValueError(f"Missing Hohmann transfer parameter: {f.name}.")
+
+            try:
+                values[f.name] = float(data[f.name])
+            except (TypeError, ValueError) as error:
+                raise ValueError(
+                    f"Hohmann transfer parameter {f.name} must be a number."
+                ) from error
+
+        return cls(**values)
 
 
 # **************************************************************************************
@@ -145,17 +159,17 @@ def get_hohmann_transfer_eccentricity(
     Returns:
         The eccentricity (e) of the transfer orbit (dimensionless).
     """
-    # Guard against identical orbit radii which would lead to 0 eccentricity:
-    if r1 == r2:
-        return 0.0
+    s = r1 + r2
 
     # Guard against invalid inputs that would lead to division by zero:
-    if r1 + r2 == 0:
+    if s == 0:
         raise ValueError(
             "The sum of r1 and r2 must be greater than zero to calculate eccentricity."
         )
 
-    return abs(r2 - r1) / (r1 + r2)
+    # The closed form is symmetric in r1 and r2, and is exactly zero for identical
+    # orbit radii, so neither ascent, descent nor the circular case need a branch:
+    return abs(r2 - r1) / s
 
 
 # **************************************************************************************
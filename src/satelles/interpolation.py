@@ -6,14 +6,60 @@
 # **************************************************************************************
 
 from abc import ABC, abstractmethod
-from math import nan
-from typing import List, Tuple
+from bisect import bisect_left, bisect_right
+from functools import wraps
+from math import fsum, nan
+from operator import attrgetter, mul
+from typing import Any, Callable, Dict, Iterable, List, Tuple, TypeVar
 
 from .differentiation import compute_finite_difference_weights
 from .models import Position, Velocity
 
 # **************************************************************************************
 
+T = TypeVar("T", Position, Velocity)
+
+# **************************************************************************************
+
+
+def cache_last_query(
+    method: Callable[[Any, float], T],
+) -> Callable[[Any, float], T]:
+    """
+    Cache the result of the most recent query of an interpolator method.
+
+    Callers often query the same time repeatedly (e.g., the same epoch across several
+    consumers), so remembering the last input and output skips the interval search and
+    the interpolation for a repeated query. The results are immutable, so the cached
+    instance can be safely returned as-is.
+
+    Args:
+        method: The interpolator method to wrap, taking the query time 'at'.
+
+    Returns:
+        The wrapped method.
+    """
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self: Any, at: float) -> T:
+        last = self._last_queries.get(name)
+
+        # If the query time matches the last query, return the cached result:
+        if last is not None and last[0] == at:
+            return last[1]
+
+        result = method(self, at)
+
+        self._last_queries[name] = (at, result)
+
+        return result
+
+    return wrapper
+
+
+# **************************************************************************************
+
 
 class Base3DInterpolator(ABC):
     """
@@ -44,10 +90,71 @@ class Base3DInterpolator(ABC):
             )
 
         # Keep the raw list of positions sorted by time; avoids duplicating time/coordinate arrays:
-        self.positions: List[Position] = sorted(positions, key=lambda p: p.at)
+        self.positions: List[Position] = sorted(positions, key=attrgetter("at"))
 
         # Keep the raw list of velocities sorted by time; avoids duplicating time/coordinate arrays:
-        self.velocities: List[Velocity] = sorted(velocities, key=lambda v: v.at)
+        self.velocities: List[Velocity] = sorted(velocities, key=attrgetter("at"))
+
+        # Store the sample times, coordinates and velocities as flat, structure-of-arrays
+        # tuples so the hot evaluation loops avoid repeated attribute lookups on each
+        # Position and Velocity:
+        self._t: Tuple[float, ...] = tuple(position.at for position in self.positions)
+        self._x: Tuple[float, ...] = tuple(position.x for position in self.positions)
+        self._y: Tuple[float, ...] = tuple(position.y for position in self.positions)
+        self._z: Tuple[float, ...] = tuple(position.z for position in self.positions)
+
+        self._vx: Tuple[float, ...] = tuple(velocity.vx for velocity in self.velocities)
+        self._vy: Tuple[float, ...] = tuple(velocity.vy for velocity in self.velocities)
+        self._vz: Tuple[float, ...] = tuple(velocity.vz for velocity in self.velocities)
+
+        # Map each sample time to the index of its first sample, so queries landing
+        # exactly on a sample are detected with a single lookup rather than a scan over
+        # the sample times:
+        self._knots: Dict[float, int] = {}
+
+        for i, at in enumerate(self._t):
+            self._knots.setdefault(at, i)
+
+        # The most recent (at, result) query of each interpolation method:
+        self._last_queries: Dict[str, Tuple[float, Any]] = {}
+
+        # The index of the most recently bracketed sample interval; query times are
+        # typically monotonic, so consecutive queries usually fall in the same interval:
+        self._last_i: int = 0
+
+    def _get_interval(self, at: float) -> int:
+        """
+        Get the index i of the first sample interval [t_i, t_i+1] containing the query
+        time 'at', by bisection over the sorted sample times.
+
+        The most recently bracketed interval, and the interval following it, are checked
+        first, so monotonic runs of queries (e.g., a batch of times on a uniform grid)
+        step through the intervals without bisecting.
+
+        Args:
+            at (float): The query time, within the bounds of the sample times.
+
+        Returns:
+            int: The index of the start of the interval.
+        """
+        t = self._t
+
+        i = self._last_i
+
+        n = len(t)
+
+        # Check whether the query time still falls within the last bracketed interval:
+        if i + 1 < n and t[i] < at <= t[i + 1]:
+            return i
+
+        # Otherwise, check whether it has advanced into the following interval:
+        if i + 2 < n and t[i + 1] < at <= t[i + 2]:
+            self._last_i = i + 1
+            return i + 1
+
+        i = self._last_i = max(bisect_left(t, at) - 1, 0)
+
+        return i
 
     @abstractmethod
     def get_interpolated_position(self, at: float) -> Position:
@@ -79,6 +186,30 @@ class Base3DInterpolator(ABC):
             "get_interpolated_velocity() must be implemented in the subclass."
         )
 
+    def get_interpolated_positions(self, ats: Iterable[float]) -> List[Position]:
+        """
+        Get the interpolated positions at each of the specified times.
+
+        Args:
+            ats (Iterable[float]): The times at which to interpolate the positions.
+
+        Returns:
+            List[Position]: The interpolated positions, in the order of the times given.
+        """
+        return [self.get_interpolated_position(at) for at in ats]
+
+    def get_interpolated_velocities(self, ats: Iterable[float]) -> List[Velocity]:
+        """
+        Get the interpolated velocities at each of the specified times.
+
+        Args:
+            ats (Iterable[float]): The times at which to interpolate the velocities.
+
+        Returns:
+            List[Velocity]: The interpolated velocities, in the order of the times given.
+        """
+        return [self.get_interpolated_velocity(at) for at in ats]
+
 
 # **************************************************************************************
 
@@ -98,10 +229,7 @@ class BarycentricLagrange3DPositionInterpolator(Base3DInterpolator):
     """
 
     def __init__(self, positions: List[Position], stencil_size: int = 10):
-        self.positions: List[Position] = sorted(
-            positions,
-            key=lambda position: position.at,
-        )
+        self.positions: List[Position] = sorted(positions, key=attrgetter("at"))
 
         # Prepare and compute velocity estimates at each sample via finite differences:
         self.velocities: List[Velocity] = self._get_derived_velocities()
@@ -113,29 +241,10 @@ class BarycentricLagrange3DPositionInterpolator(Base3DInterpolator):
 
         super().__init__(self.positions, self.velocities)
 
-    def _prepare_basis_weights(self) -> List[float]:
-        """
-        Prepare and compute barycentric weights for the given positions.
-
-        These weights reflect only the time geometry, so they can be reused across x, y,
-        and z interpolation without recomputing time lists.
-
-        Returns:
-            List[float]: List of barycentric weights corresponding to each sample.
-        """
-        weights: List[float] = [1.0] * len(self.positions)
-
-        for i, position_i in enumerate(self.positions):
-            at = position_i.at
-            product = 1.0
-            for j, position_j in enumerate(self.positions):
-                if j == i:
-                    continue
-                product *= at - position_j.at
-
-            weights[i] = 1.0 / product
-
-        return weights
+        # The local barycentric weights depend only on the sample times of a stencil,
+        # and the stencil size is fixed, so they are computed once per stencil start
+        # index and reused by every later query that resolves to the same stencil:
+        self._local_weights: Dict[int, Tuple[List[float], float]] = {}
 
     def _get_local_stencil(self, at: float) -> range:
         """
@@ -150,15 +259,16 @@ class BarycentricLagrange3DPositionInterpolator(Base3DInterpolator):
         Returns:
             range: The index range of the local stencil.
         """
-        n = len(self.positions)
+        t = self._t
 
-        # Find the rightmost position with at <= query time:
-        idx = 0
+        n = len(t)
 
-        for i in range(n):
-            if self.positions[i].at > at:
-                break
-            idx = i
+        idx = self._last_i
+
+        # Find the rightmost position with at <= query time, checking the last bracketed
+        # position first and otherwise falling back to bisection:
+        if not (idx + 1 < n and t[idx] <= at < t[idx + 1]):
+            idx = self._last_i = max(bisect_right(t, at) - 1, 0)
 
         # Centre the stencil around the insertion point:
         half = self.stencil_size // 2
@@ -188,23 +298,28 @@ class BarycentricLagrange3DPositionInterpolator(Base3DInterpolator):
             Tuple[List[float], float]: Barycentric weights for the local subset and
                 the inverse capacity scaling factor.
         """
-        local_positions = [self.positions[i] for i in stencil]
+        cached = self._local_weights.get(stencil.start)
+
+        if cached is not None:
+            return cached
+
+        local_t = self._t[stencil.start : stencil.stop]
 
-        n = len(local_positions)
+        n = len(local_t)
 
         # Compute the inverse capacity scaling factor for this local stencil
         # (Berrut & Trefethen 2004, p. 510). Scaling by 4 / (t_max - t_min) keeps
         # intermediate products near unity, preventing floating-point overflow and
         # underflow during weight computation:
-        t_min = local_positions[0].at
-        t_max = local_positions[-1].at
+        t_min = local_t[0]
+        t_max = local_t[-1]
 
         inverse_capacity = 4.0 / (t_max - t_min) if t_max != t_min else 1.0
 
         weights: List[float] = [0.0] * n
 
         for i in range(n):
-            at_i = local_positions[i].at
+            at_i = local_t[i]
 
             product = 1.0
 
@@ -212,14 +327,16 @@ class BarycentricLagrange3DPositionInterpolator(Base3DInterpolator):
                 if j == i:
                     continue
 
-                product *= inverse_capacity * (at_i - local_positions[j].at)
+                product *= inverse_capacity * (at_i - local_t[j])
 
             if product == 0.0:
                 raise ValueError("Interpolation points must be distinct.")
 
             weights[i] = 1.0 / product
 
-        return weights, inverse_capacity
+        cached = self._local_weights[stencil.start] = (weights, inverse_capacity)
+
+        return cached
 
     def _get_derived_velocities(self) -> List[Velocity]:
         """
@@ -236,12 +353,19 @@ class BarycentricLagrange3DPositionInterpolator(Base3DInterpolator):
         if n < 2:
             raise ValueError("Need at least two positions to estimate velocities.")
 
+        # Unpack the sample times and coordinates once, so the stencil loops below read
+        # from flat tuples rather than loading attributes from each Position:
+        t = tuple(position.at for position in self.positions)
+        x = tuple(position.x for position in self.positions)
+        y = tuple(position.y for position in self.positions)
+        z = tuple(position.z for position in self.positions)
+
         velocities: List[Velocity] = []
 
-        for i, position in enumerate(self.positions):
-            neighbors = list(range(max(0, i - 2), min(n, i + 3)))
+        for i, at in enumerate(t):
+            neighbors = range(max(0, i - 2), min(n, i + 3))
 
-            xs = [self.positions[j].at for j in neighbors]
+            xs = t[neighbors.start : neighbors.stop]
 
             # we need at least two points to estimate a derivative
             if len(xs) < 2:
@@ -250,21 +374,21 @@ class BarycentricLagrange3DPositionInterpolator(Base3DInterpolator):
                 )
 
             # compute the weights for the first derivative (order=1)
-            weights = compute_finite_difference_weights(xs, position.at, order=1)
+            weights = compute_finite_difference_weights(list(xs), at, order=1)
 
             # now form vx, vy, vz in one shot:
             vx = vy = vz = 0.0
 
             for weight, j in zip(weights, neighbors):
-                p = self.positions[j]
-                vx += weight * p.x
-                vy += weight * p.y
-                vz += weight * p.z
+                vx += weight * x[j]
+                vy += weight * y[j]
+                vz += weight * z[j]
 
-            velocities.append(Velocity(at=position.at, vx=vx, vy=vy, vz=vz))
+            velocities.append(Velocity(at=at, vx=vx, vy=vy, vz=vz))
 
         return velocities
 
+    @cache_last_query
     def get_interpolated_position(self, at: float) -> Position:
         """
         Get the interpolated position at the specified time 'at'.
@@ -275,34 +399,49 @@ class BarycentricLagrange3DPositionInterpolator(Base3DInterpolator):
         Returns:
             Position: The interpolated position at the specified time.
         """
-        x = y = z = 0.0
+        t, xs, ys, zs = self._t, self._x, self._y, self._z
 
-        denominator = 0.0
+        i = self._knots.get(at)
 
         # If we are at an exact position time, return a new Position instance:
-        for position in self.positions:
-            if at == position.at:
-                return Position(
-                    x=position.x,
-                    y=position.y,
-                    z=position.z,
-                    at=position.at,
-                )
+        if i is not None:
+            return Position(
+                x=xs[i],
+                y=ys[i],
+                z=zs[i],
+                at=t[i],
+            )
 
         stencil = self._get_local_stencil(at)
 
-        positions = [self.positions[i] for i in stencil]
+        start, stop = stencil.start, stencil.stop
+
+        # A two point stencil interpolates linearly, so skip the barycentric weights:
+        if stop - start == 2:
+            u = (at - t[start]) / (t[stop - 1] - t[start])
+
+            return Position(
+                x=xs[start] + u * (xs[stop - 1] - xs[start]),
+                y=ys[start] + u * (ys[stop - 1] - ys[start]),
+                z=zs[start] + u * (zs[stop - 1] - zs[start]),
+                at=at,
+            )
 
         weights, inverse_capacity = self._compute_local_weights(stencil)
 
-        for position, weight in zip(positions, weights):
-            factor = weight / (inverse_capacity * (at - position.at))
+        factors = [
+            weight / (inverse_capacity * (at - at_i))
+            for weight, at_i in zip(weights, t[start:stop])
+        ]
 
-            x += factor * position.x
-            y += factor * position.y
-            z += factor * position.z
+        # Form each weighted sum in a single pass over the flat coordinate slices, with
+        # exactly rounded summation as the terms alternate in sign near the stencil
+        # nodes and would otherwise lose precision to cancellation:
+        denominator = fsum(factors)
 
-            denominator += factor
+        x = fsum(map(mul, factors, xs[start:stop]))
+        y = fsum(map(mul, factors, ys[start:stop]))
+        z = fsum(map(mul, factors, zs[start:stop]))
 
         x = x / denominator if denominator != 0 else nan
         y = y / denominator if denominator != 0 else nan
@@ -318,6 +457,7 @@ class BarycentricLagrange3DPositionInterpolator(Base3DInterpolator):
             at=at,
         )
 
+    @cache_last_query
     def get_interpolated_velocity(self, at: float) -> Velocity:
         """
         Get the interpolated velocity at the specified time 'at'.
@@ -328,128 +468,81 @@ class BarycentricLagrange3DPositionInterpolator(Base3DInterpolator):
         Returns:
             Velocity: The interpolated velocity at the specified time.
         """
-        # If exactly at a knot, return the precomputed finite-difference velocity:
-        for i, position in enumerate(self.positions):
-            if at == position.at:
-                v = self.velocities[i]
-                return Velocity(
-                    at=at,
-                    vx=v.vx,
-                    vy=v.vy,
-                    vz=v.vz,
-                )
+        t, xs, ys, zs = self._t, self._x, self._y, self._z
 
-        # Compute the interpolated position at 'at':
-        interpolated = self.get_interpolated_position(at)
+        i = self._knots.get(at)
 
-        vx = vy = vz = nan
+        # If exactly at a knot, return the precomputed finite-difference velocity:
+        if i is not None:
+            return Velocity(
+                at=at,
+                vx=self._vx[i],
+                vy=self._vy[i],
+                vz=self._vz[i],
+            )
 
+        # Resolve the local stencil and its weights once, and share them between the
+        # position and derivative passes below:
         stencil = self._get_local_stencil(at)
 
-        positions = [self.positions[i] for i in stencil]
-
         weights, inverse_capacity = self._compute_local_weights(stencil)
 
-        numerator_vx = numerator_vy = numerator_vz = 0.0
+        # Use the real (unscaled) time difference for the derivative, since dp/dt has
+        # units of position/time:
+        dts = [at - t[i] for i in stencil]
 
-        denominator = 0.0
+        # Use the capacity-scaled time difference for the barycentric weight ratio
+        # (matching the scale used in weight computation):
+        factors = [weight / (inverse_capacity * dt) for weight, dt in zip(weights, dts)]
 
-        # The derivative of the barycentric Lagrange interpolant can be expressed in
-        # terms of the same weights and positions, so we can re-use the local
-        # weights and time geometry:
-        for position, weight in zip(positions, weights):
-            # Use the real (unscaled) time difference for the derivative, since
-            # dp/dt has units of position/time:
-            dt = at - position.at
+        start, stop = stencil.start, stencil.stop
 
-            # Use the capacity-scaled time difference for the barycentric weight
-            # ratio (matching the scale used in weight computation):
-            scaled_time_difference = inverse_capacity * dt
+        denominator = fsum(factors)
 
-            factor = weight / scaled_time_difference
+        if denominator == 0:
+            return Velocity(at=at, vx=nan, vy=nan, vz=nan)
 
-            denominator += factor
+        # Compute the interpolated position at 'at' from the shared factors:
+        x = fsum(map(mul, factors, xs[start:stop])) / denominator
+        y = fsum(map(mul, factors, ys[start:stop])) / denominator
+        z = fsum(map(mul, factors, zs[start:stop])) / denominator
 
-            numerator_vx += (factor / dt) * (interpolated.x - position.x)
-            numerator_vy += (factor / dt) * (interpolated.y - position.y)
-            numerator_vz += (factor / dt) * (interpolated.z - position.z)
+        numerator_vx = numerator_vy = numerator_vz = 0.0
 
-        vx = numerator_vx / denominator if denominator != 0 else nan
-        vy = numerator_vy / denominator if denominator != 0 else nan
-        vz = numerator_vz / denominator if denominator != 0 else nan
+        # The derivative of the barycentric Lagrange interpolant can be expressed in
+        # terms of the same weights and positions, so we can re-use the local
+        # weights and time geometry:
+        for i, factor, dt in zip(stencil, factors, dts):
+            g = factor / dt
+
+            numerator_vx += g * (x - xs[i])
+            numerator_vy += g * (y - ys[i])
+            numerator_vz += g * (z - zs[i])
 
         return Velocity(
             at=at,
-            vx=vx,
-            vy=vy,
-            vz=vz,
+            vx=numerator_vx / denominator,
+            vy=numerator_vy / denominator,
+            vz=numerator_vz / denominator,
         )
 
 
 # **************************************************************************************
 
 
-class Hermite3DPositionInterpolator(Base3DInterpolator):
+class BaseHermite3DInterpolator(Base3DInterpolator):
     """
-    Cubic Hermite interpolation for 3D positions.
-
-    This class implements cubic Hermite interpolation for 3D positions represented
-    by the `Position` class, which includes x, y, z coordinates and a time attribute `at`.
-    Velocity at sample points is estimated via finite differences to shape the curve smoothly.
-    """
-
-    def __init__(self, positions: List[Position]):
-        self.positions: List[Position] = positions
-
-        # Prepare and compute velocity estimates at each sample via finite differences:
-        self.velocities: List[Velocity] = self._get_derived_velocities()
-
-        super().__init__(self.positions, self.velocities)
-
-    def _get_derived_velocities(self) -> List[Velocity]:
-        """
-        Prepare and compute velocity estimates for each position.
-
-        Returns:
-            List[Velocity]: List of estimated velocities corresponding to each position.
-
-        Raises:
-            ValueError: If there are not enough position points to estimate a derivative.
-        """
-        n = len(self.positions)
-
-        if n < 2:
-            raise ValueError("Need at least two positions to estimate velocities.")
-
-        velocities: List[Velocity] = []
-
-        for i, position in enumerate(self.positions):
-            neighbors = list(range(max(0, i - 2), min(n, i + 3)))
+    Base class for cubic Hermite interpolators.
 
-            xs = [self.positions[j].at for j in neighbors]
+    The cubic Hermite evaluation only depends on the sample positions and the sample
+    velocities, so it is shared by every Hermite interpolator; subclasses differ only
+    in how the sample velocities are obtained (e.g., estimated from the positions by
+    finite differences, or given directly).
 
-            # we need at least two points to estimate a derivative
-            if len(xs) < 2:
-                raise ValueError(
-                    "Not enough position points to estimate position derivative (velocity)."
-                )
-
-            # compute the weights for the first derivative (order=1)
-            weights = compute_finite_difference_weights(xs, position.at, order=1)
-
-            # now form vx, vy, vz in one shot:
-            vx = vy = vz = 0.0
-
-            for weight, j in zip(weights, neighbors):
-                p = self.positions[j]
-                vx += weight * p.x
-                vy += weight * p.y
-                vz += weight * p.z
-
-            velocities.append(Velocity(at=position.at, vx=vx, vy=vy, vz=vz))
-
-        return velocities
+    This class is not intended to be instantiated directly.
+    """
 
+    @cache_last_query
     def get_interpolated_position(self, at: float) -> Position:
         """
         Get the interpolated position at the specified time 'at'.
@@ -457,83 +550,82 @@ class Hermite3DPositionInterpolator(Base3DInterpolator):
         Args:
             at (float): The time at which to interpolate the position.
 
+        Raises:
+            ValueError: If 'at' is before the first sample time or after the last sample
+            time of the provided positions.
+
         Returns:
             Position: The interpolated position at the specified time.
         """
         # Raise error if 'at' is before the first sample time:
-        if at < self.positions[0].at:
+        if at < self._t[0]:
             raise ValueError(
-                f"Cannot interpolate before the first sample time: {self.positions[0].at}"
+                f"Cannot interpolate before the first sample time: {self._t[0]}"
             )
 
         # Raise error if 'at' is after the last sample time:
-        if at > self.positions[-1].at:
+        if at > self._t[-1]:
             raise ValueError(
-                f"Cannot interpolate after the last sample time: {self.positions[-1].at}"
+                f"Cannot interpolate after the last sample time: {self._t[-1]}"
             )
 
-        # Initialize position coordinates to NaN as the fallback:
-        x = y = z = nan
+        t, xs, ys, zs = self._t, self._x, self._y, self._z
 
-        # Find the interval that contains 'at':
-        for i in range(len(self.positions) - 1):
-            position = self.positions[i]
-            position_next = self.positions[i + 1]
-            t_i, t_j = position.at, position_next.at
-
-            # Skip intervals that do not contain the query time:
-            if not (t_i <= at <= t_j):
-                continue
-
-            # Calculate the normalized time (tau) within the interval [t0, t1]:
-            dt = position_next.at - t_i
-
-            if abs(dt) < 1e-10:
-                # If the time difference is too small, use the first position:
-                return Position(
-                    x=position.x,
-                    y=position.y,
-                    z=position.z,
-                    at=t_i,
-                )
+        vxs, vys, vzs = self._vx, self._vy, self._vz
 
-            τ = (at - t_i) / dt
+        knot = self._knots.get(at)
 
-            # Calculate Hermite basis functions for cubic interpolation:
-            h00 = 2 * τ**3 - 3 * τ**2 + 1
-            h10 = τ**3 - 2 * τ**2 + τ
-            h01 = -2 * τ**3 + 3 * τ**2
-            h11 = τ**3 - τ**2
+        # If we are at an exact position time, return the sample position:
+        if knot is not None:
+            return Position(x=xs[knot], y=ys[knot], z=zs[knot], at=at)
 
-            # Retrieve precomputed velocity estimates:
-            v0 = self.velocities[i]
-            v1 = self.velocities[i + 1]
+        # Find the interval that contains 'at':
+        i = self._get_interval(at)
 
-            # Interpolate the position using the Hermite basis functions:
-            x = (
-                h00 * position.x
-                + h10 * v0.vx * dt
-                + h01 * position_next.x
-                + h11 * v1.vx * dt
-            )
+        t_i, t_j = t[i], t[i + 1]
 
-            y = (
-                h00 * position.y
-                + h10 * v0.vy * dt
-                + h01 * position_next.y
-                + h11 * v1.vy * dt
-            )
+        # Calculate the normalized time (tau) within the interval [t0, t1]:
+        dt = t_j - t_i
 
-            z = (
-                h00 * position.z
-                + h10 * v0.vz * dt
-                + h01 * position_next.z
-                + h11 * v1.vz * dt
+        if abs(dt) < 1e-10:
+            # If the time difference is too small, use the first position:
+            return Position(
+                x=xs[i],
+                y=ys[i],
+                z=zs[i],
+                at=t_i,
             )
-            break
+
+        τ = (at - t_i) / dt
+
+        τ2 = τ * τ
+
+        u = τ - 1.0
+
+        # Calculate Hermite basis functions for cubic interpolation in factored form,
+        # sharing τ² across the basis rather than evaluating the powers of τ in turn:
+        h01 = τ2 * (3.0 - 2.0 * τ)
+        h00 = 1.0 - h01
+        h10 = τ * u * u
+        h11 = τ2 * u
+
+        # Scale the tangent basis functions by the interval once for all three axes:
+        h10 *= dt
+        h11 *= dt
+
+        j = i + 1
+
+        # Interpolate the position using the Hermite basis functions and the
+        # precomputed velocity estimates:
+        x = h00 * xs[i] + h10 * vxs[i] + h01 * xs[j] + h11 * vxs[j]
+
+        y = h00 * ys[i] + h10 * vys[i] + h01 * ys[j] + h11 * vys[j]
+
+        z = h00 * zs[i] + h10 * vzs[i] + h01 * zs[j] + h11 * vzs[j]
 
         return Position(x=x, y=y, z=z, at=at)
 
+    @cache_last_query
     def get_interpolated_velocity(self, at: float) -> Velocity:
         """
         Get the interpolated velocity at the specified time 'at'.
@@ -545,94 +637,58 @@ class Hermite3DPositionInterpolator(Base3DInterpolator):
             Velocity: The interpolated velocity at the specified time.
         """
         # Raise error if 'at' is before the first sample time:
-        if at < self.positions[0].at:
+        if at < self._t[0]:
             raise ValueError(
-                f"Cannot interpolate before the first sample time: {self.positions[0].at}"
+                f"Cannot interpolate before the first sample time: {self._t[0]}"
             )
 
         # Raise error if 'at' is after the last sample time:
-        if at > self.positions[-1].at:
+        if at > self._t[-1]:
             raise ValueError(
-                f"Cannot interpolate after the last sample time: {self.positions[-1].at}"
+                f"Cannot interpolate after the last sample time: {self._t[-1]}"
             )
 
-        vx = vy = vz = nan
+        t, xs, ys, zs = self._t, self._x, self._y, self._z
+
+        vxs, vys, vzs = self._vx, self._vy, self._vz
+
+        knot = self._knots.get(at)
+
+        # If exactly at a knot, return the corresponding sample velocity:
+        if knot is not None:
+            return Velocity(at=at, vx=vxs[knot], vy=vys[knot], vz=vzs[knot])
 
         # Find the interval that contains 'at':
-        for i in range(len(self.positions) - 1):
-            position = self.positions[i]
-            position_next = self.positions[i + 1]
-            t_i, t_j = position.at, position_next.at
-
-            # Skip intervals that do not contain the query time:
-            if not (t_i <= at <= t_j):
-                continue
-
-            # Calculate the normalized time (tau) within the interval [t0, t1]:
-            dt = position_next.at - t_i
-
-            if abs(dt) < 1e-10:
-                v0 = self.velocities[i]
-                return Velocity(
-                    at=t_i,
-                    vx=v0.vx,
-                    vy=v0.vy,
-                    vz=v0.vz,
-                )
+        i = self._get_interval(at)
 
-            # If exactly at a knot, return the corresponding sample velocity:
-            if at == t_i:
-                v0 = self.velocities[i]
-                return Velocity(
-                    at=t_i,
-                    vx=v0.vx,
-                    vy=v0.vy,
-                    vz=v0.vz,
-                )
+        t_i, t_j = t[i], t[i + 1]
 
-            if at == t_j:
-                v1 = self.velocities[i + 1]
-                return Velocity(
-                    at=t_j,
-                    vx=v1.vx,
-                    vy=v1.vy,
-                    vz=v1.vz,
-                )
+        # Calculate the normalized time (tau) within the interval [t0, t1]:
+        dt = t_j - t_i
 
-            τ = (at - t_i) / dt
+        if abs(dt) < 1e-10:
+            return Velocity(at=t_i, vx=vxs[i], vy=vys[i], vz=vzs[i])
 
-            # Calculate derivatives of the Hermite basis functions with respect to tau:
-            h00 = 6.0 * τ * τ - 6.0 * τ
-            h10 = 3.0 * τ * τ - 4.0 * τ + 1.0
-            h01 = -6.0 * τ * τ + 6.0 * τ
-            h11 = 3.0 * τ * τ - 2.0 * τ
+        j = i + 1
 
-            # Apply the chain rule to convert derivatives from tau to time:
-            idt = 1.0 / dt
+        τ = (at - t_i) / dt
 
-            v0 = self.velocities[i]
-            v1 = self.velocities[i + 1]
+        u = τ - 1.0
 
-            # Interpolate the velocity components using the Hermite derivative form:
-            vx = idt * (
-                h00 * position.x
-                + h10 * (dt * v0.vx)
-                + h01 * position_next.x
-                + h11 * (dt * v1.vx)
-            )
-            vy = idt * (
-                h00 * position.y
-                + h10 * (dt * v0.vy)
-                + h01 * position_next.y
-                + h11 * (dt * v1.vy)
-            )
-            vz = idt * (
-                h00 * position.z
-                + h10 * (dt * v0.vz)
-                + h01 * position_next.z
-                + h11 * (dt * v1.vz)
-            )
-            break
+        # Calculate derivatives of the Hermite basis functions with respect to tau, in
+        # factored form (the position basis derivatives are equal and opposite):
+        h00 = 6.0 * τ * u
+        h10 = (3.0 * τ - 1.0) * u
+        h11 = τ * (3.0 * τ - 2.0)
+
+        # Apply the chain rule to convert the position terms from tau to time; the
+        # tangent terms carry a factor of dt which cancels against it:
+        h00 /= dt
+
+        # Interpolate the velocity components using the Hermite derivative form:
+        vx = h00 * (xs[i] - xs[j]) + h10 * vxs[i] + h11 * vxs[j]
+        vy = h00 * (ys[i] - ys[j]) + h10 * vys[i] + h11 * vys[j]
+        vz = h00 * (zs[i] - zs[j]) + h10 * vzs[i] + h11 * vzs[j]
 
         return Velocity(at=at, vx=vx, vy=vy, vz=vz)
 
@@ -640,211 +696,92 @@ class Hermite3DPositionInterpolator(Base3DInterpolator):
 # **************************************************************************************
 
 
-class Hermite3DKinematicInterpolator(Base3DInterpolator):
+class Hermite3DPositionInterpolator(BaseHermite3DInterpolator):
     """
-    Cubic Hermite interpolation for 3D positions and velocities.
+    Cubic Hermite interpolation for 3D positions.
 
     This class implements cubic Hermite interpolation for 3D positions represented
-    by the `Position` and `Velocity` classes, which includes x, y, z vector coordinates
-    and a time attribute `at`.
+    by the `Position` class, which includes x, y, z coordinates and a time attribute `at`.
+    Velocity at sample points is estimated via finite differences to shape the curve smoothly.
     """
 
-    def __init__(
-        self,
-        positions: List[Position],
-        velocities: List[Velocity],
-    ):
-        super().__init__(positions, velocities)
-
-    def get_interpolated_position(self, at: float) -> Position:
-        """
-        Get the interpolated position at the specified time 'at'.
+    def __init__(self, positions: List[Position]):
+        self.positions: List[Position] = positions
 
-        Args:
-            at (float): The time at which to interpolate the position.
+        # Prepare and compute velocity estimates at each sample via finite differences:
+        self.velocities: List[Velocity] = self._get_derived_velocities()
 
-        Raises:
-            ValueError: If 'at' is before the first sample time or after the last sample
-            time of the provided positions.
+        super().__init__(self.positions, self.velocities)
 
-        Returns:
-            Position: The interpolated position at the specified time.
+    def _get_derived_velocities(self) -> List[Velocity]:
         """
-        # Raise error if 'at' is before the first sample time:
-        if at < self.positions[0].at:
-            raise ValueError(
-                f"Cannot interpolate before the first sample time: {self.positions[0].at}"
-            )
-
-        # Raise error if 'at' is after the last sample time:
-        if at > self.positions[-1].at:
-            raise ValueError(
-                f"Cannot interpolate after the last sample time: {self.positions[-1].at}"
-            )
-
-        # Initialize position coordinates to NaN as the fallback:
-        x = y = z = nan
-
-        # Find the interval that contains 'at':
-        for i in range(len(self.positions) - 1):
-            position = self.positions[i]
-            position_next = self.positions[i + 1]
-            t_i, t_j = position.at, position_next.at
-
-            # Skip intervals that do not contain the query time:
-            if not (t_i <= at <= t_j):
-                continue
-
-            # Calculate the normalized time (tau) within the interval [t0, t1]:
-            dt = position_next.at - t_i
-
-            if abs(dt) < 1e-10:
-                # If the time difference is too small, use the first position:
-                return Position(
-                    x=position.x,
-                    y=position.y,
-                    z=position.z,
-                    at=t_i,
-                )
-
-            τ = (at - t_i) / dt
-
-            # Calculate Hermite basis functions for cubic interpolation:
-            h00 = 2 * τ**3 - 3 * τ**2 + 1
-            h10 = τ**3 - 2 * τ**2 + τ
-            h01 = -2 * τ**3 + 3 * τ**2
-            h11 = τ**3 - τ**2
+        Prepare and compute velocity estimates for each position.
 
-            # Retrieve precomputed velocity estimates:
-            v0 = self.velocities[i]
-            v1 = self.velocities[i + 1]
+        Returns:
+            List[Velocity]: List of estimated velocities corresponding to each position.
 
-            # Interpolate the position using the Hermite basis functions:
-            x = (
-                h00 * position.x
-                + h10 * v0.vx * dt
-                + h01 * position_next.x
-                + h11 * v1.vx * dt
-            )
+        Raises:
+            ValueError: If there are not enough position points to estimate a derivative.
+        """
+        n = len(self.positions)
 
-            y = (
-                h00 * position.y
-                + h10 * v0.vy * dt
-                + h01 * position_next.y
-                + h11 * v1.vy * dt
-            )
+        if n < 2:
+            raise ValueError("Need at least two positions to estimate velocities.")
 
-            z = (
-                h00 * position.z
-                + h10 * v0.vz * dt
-                + h01 * position_next.z
-                + h11 * v1.vz * dt
-            )
-            break
+        # Unpack the sample times and coordinates once, so the stencil loops below read
+        # from flat tuples rather than loading attributes from each Position:
+        t = tuple(position.at for position in self.positions)
+        x = tuple(position.x for position in self.positions)
+        y = tuple(position.y for position in self.positions)
+        z = tuple(position.z for position in self.positions)
 
-        return Position(x=x, y=y, z=z, at=at)
+        velocities: List[Velocity] = []
 
-    def get_interpolated_velocity(self, at: float) -> Velocity:
-        """
-        Get the interpolated velocity at the specified time 'at'.
+        for i, at in enumerate(t):
+            neighbors = range(max(0, i - 2), min(n, i + 3))
 
-        Args:
-            at (float): The time at which to interpolate the velocity.
+            xs = t[neighbors.start : neighbors.stop]
 
-        Returns:
-            Velocity: The interpolated velocity at the specified time.
-        """
-        # Raise error if 'at' is before the first sample time:
-        if at < self.positions[0].at:
-            raise ValueError(
-                f"Cannot interpolate before the first sample time: {self.positions[0].at}"
-            )
+            # we need at least two points to estimate a derivative
+            if len(xs) < 2:
+                raise ValueError(
+                    "Not enough position points to estimate position derivative (velocity)."
+                )
 
-        # Raise error if 'at' is after the last sample time:
-        if at > self.positions[-1].at:
-            raise ValueError(
-                f"Cannot interpolate after the last sample time: {self.positions[-1].at}"
-            )
+            # compute the weights for the first derivative (order=1)
+            weights = compute_finite_difference_weights(list(xs), at, order=1)
 
-        vx = vy = vz = nan
+            # now form vx, vy, vz in one shot:
+            vx = vy = vz = 0.0
 
-        # Find the interval that contains 'at':
-        for i in range(len(self.positions) - 1):
-            position = self.positions[i]
-            position_next = self.positions[i + 1]
-            t_i, t_j = position.at, position_next.at
-
-            # Skip intervals that do not contain the query time:
-            if not (t_i <= at <= t_j):
-                continue
-
-            # Calculate the normalized time (tau) within the interval [t0, t1]:
-            dt = position_next.at - t_i
-
-            if abs(dt) < 1e-10:
-                v0 = self.velocities[i]
-                return Velocity(
-                    at=t_i,
-                    vx=v0.vx,
-                    vy=v0.vy,
-                    vz=v0.vz,
-                )
+            for weight, j in zip(weights, neighbors):
+                vx += weight * x[j]
+                vy += weight * y[j]
+                vz += weight * z[j]
 
-            # If exactly at a knot, return the corresponding sample velocity:
-            if at == t_i:
-                v0 = self.velocities[i]
-                return Velocity(
-                    at=t_i,
-                    vx=v0.vx,
-                    vy=v0.vy,
-                    vz=v0.vz,
-                )
+            velocities.append(Velocity(at=at, vx=vx, vy=vy, vz=vz))
 
-            if at == t_j:
-                v1 = self.velocities[i + 1]
-                return Velocity(
-                    at=t_j,
-                    vx=v1.vx,
-                    vy=v1.vy,
-                    vz=v1.vz,
-                )
+        return velocities
 
-            τ = (at - t_i) / dt
 
-            # Calculate derivatives of the Hermite basis functions with respect to tau:
-            h00 = 6.0 * τ * τ - 6.0 * τ
-            h10 = 3.0 * τ * τ - 4.0 * τ + 1.0
-            h01 = -6.0 * τ * τ + 6.0 * τ
-            h11 = 3.0 * τ * τ - 2.0 * τ
+# **************************************************************************************
 
-            # Apply the chain rule to convert derivatives from tau to time:
-            idt = 1.0 / dt
 
-            v0 = self.velocities[i]
-            v1 = self.velocities[i + 1]
+class Hermite3DKinematicInterpolator(BaseHermite3DInterpolator):
+    """
+    Cubic Hermite interpolation for 3D positions and velocities.
 
-            # Interpolate the velocity components using the Hermite derivative form:
-            vx = idt * (
-                h00 * position.x
-                + h10 * (dt * v0.vx)
-                + h01 * position_next.x
-                + h11 * (dt * v1.vx)
-            )
-            vy = idt * (
-                h00 * position.y
-                + h10 * (dt * v0.vy)
-                + h01 * position_next.y
-                + h11 * (dt * v1.vy)
-            )
-            vz = idt * (
-                h00 * position.z
-                + h10 * (dt * v0.vz)
-                + h01 * position_next.z
-                + h11 * (dt * v1.vz)
-            )
-            break
+    This class implements cubic Hermite interpolation for 3D positions represented
+    by the `Position` and `Velocity` classes, which includes x, y, z vector coordinates
+    and a time attribute `at`.
+    """
 
-        return Velocity(at=at, vx=vx, vy=vy, vz=vz)
+    def __init__(
+        self,
+        positions: List[Position],
+        velocities: List[Velocity],
+    ):
+        super().__init__(positions, velocities)
 
 
 # **************************************************************************************
@@ -5,21 +5,79 @@
 
 # **************************************************************************************
 
-from math import atan2, cos, degrees, pi, radians, sin, sqrt
-from typing import Optional
+from functools import lru_cache
+from math import (
+    atan2,
+    cbrt,
+    copysign,
+    cos,
+    degrees,
+    nan,
+    pi,
+    radians,
+    remainder,
+    sin,
+    sqrt,
+    ulp,
+)
+from typing import Iterable, List, Literal, Optional, Tuple
 
 from .constants import GRAVITATIONAL_CONSTANT
 from .earth import EARTH_MASS
 
 # **************************************************************************************
 
+# The maximum number of Newton-Raphson iterations when solving Kepler's Equation:
+MAXIMUM_KEPLER_ITERATIONS = 64
+
+# The conversion factor from revolutions per day to radians per second:
+REVOLUTIONS_PER_DAY_TO_RADIANS_PER_SECOND = 2 * pi / 86400
+
+# The standard gravitational parameter (μ ≈ GM) of the Earth, for a point mass satellite:
+EARTH_GRAVITATIONAL_PARAMETER = GRAVITATIONAL_CONSTANT * EARTH_MASS
+
+# **************************************************************************************
+
+
+@lru_cache(maxsize=4096)
+def _get_semi_major_axis(mean_motion: float, mass: float) -> float:
+    """
+    Calculate the semi-major axis of the satellite's orbit in meters, caching the
+    result for repeated (mean motion, mass) pairs.
+
+    Args:
+        mean_motion: The mean motion of the satellite in revolutions per day.
+        mass: The mass of the satellite in kilograms.
+
+    Returns:
+        The semi-major axis (in SI meters).
+    """
+    # Calculate the standard gravitational parameter (μ) using the gravitational constant
+    # and the mass of the Earth, and the mass of the satellite (if provided), using the
+    # precomputed value for the common point mass case:
+    μ = (
+        GRAVITATIONAL_CONSTANT * (EARTH_MASS + mass)
+        if mass
+        else EARTH_GRAVITATIONAL_PARAMETER
+    )  # μ ≈ GM
+
+    # Convert the mean motion from revolutions per day to radians per second:
+    n = mean_motion * REVOLUTIONS_PER_DAY_TO_RADIANS_PER_SECOND
+
+    # Calculate the semi-major axis using the formula (in meters):
+    return cbrt(μ / (n * n))
+
+
+# **************************************************************************************
+
 
 def get_semi_major_axis(mean_motion: float, mass: Optional[float] = 0.0) -> float:
     """
     Calculate the semi-major axis of the satellite's orbit in meters.
 
     The semi-major axis is calculated using the mean motion and the gravitational
-    constant of the Earth.
+    constant of the Earth. Results are cached, as the same satellite is typically
+    propagated repeatedly with the same mean motion and mass.
 
     Args:
         mean_motion: The mean motion of the satellite in revolutions per day.
@@ -28,18 +86,12 @@ def get_semi_major_axis(mean_motion: float, mass: Optional[float] = 0.0) -> floa
     Returns:
         The semi-major axis (in SI meters).
     """
+    # Normalise the mass before it forms part of the cache key, so None and 0.0 share
+    # the same cache entry:
     if mass is None:
         mass = 0.0
 
-    # Calculate the standard gravitational parameter (μ) using the gravitational constant
-    # and the mass of the Earth, and the mass of the satellite (if provided):
-    μ = GRAVITATIONAL_CONSTANT * (EARTH_MASS + mass)  # μ ≈ GM
-
-    # Convert the mean motion from revolutions per day to radians per second:
-    n = (mean_motion * 2 * pi) / 86400
-
-    # Calculate the semi-major axis using the formula (in meters):
-    return (μ / n**2) ** (1 / 3)
+    return _get_semi_major_axis(mean_motion, mass)
 
 
 # **************************************************************************************
@@ -66,85 +118,324 @@ def get_semi_latus_rectum(semi_major_axis: float, eccentricity: float) -> float:
 # **************************************************************************************
 
 
-def get_eccentric_anomaly(
-    mean_anomaly: float, eccentricity: float, tolerance: float = 1e-8
+def _get_keplers_equation_starter(M: float, eccentricity: float) -> float:
+    """
+    Get a starting estimate of the eccentric anomaly for the Newton-Raphson solver.
+
+    For low eccentricities, E = atan2(sin(M), cos(M) - e) agrees with the series
+    solution of Kepler's Equation to second order in e. Otherwise, Danby's starter
+    E = M + 0.85 * e * sign(sin(M)) is used, which keeps the iteration convergent for
+    eccentricities approaching one.
+
+    Args:
+        M: The mean anomaly (M) (in radians).
+        eccentricity: The orbital eccentricity (e), (unitless).
+
+    Returns:
+        float: The starting estimate of the eccentric anomaly (E) (in radians).
+    """
+    # Reduce the mean anomaly to the range [-π, π], keeping the whole revolutions to
+    # add back on to the estimate:
+    m = remainder(M, 2 * pi)
+
+    if eccentricity < 0.3:
+        return (M - m) + atan2(sin(m), cos(m) - eccentricity)
+
+    return M + 0.85 * eccentricity * copysign(1.0, sin(m))
+
+
+# **************************************************************************************
+
+
+def _solve_keplers_equation(
+    M: float, eccentricity: float, E: float, tolerance: float
 ) -> float:
     """
-    Solve Kepler's Equation for the eccentric anomaly using the Newton-Raphson method.
+    Solve Kepler's Equation for the eccentric anomaly using Newton-Raphson iteration
+    from the given starting estimate.
 
-    This function computes the eccentric anomaly (E) for a given mean anomaly (M) and
-    orbital eccentricity (e). It iteratively refines the estimate using Newton-Raphson until
-    the update is smaller than the specified tolerance.
+    Iteration stops once the update is smaller than the tolerance, or once the estimate
+    stops changing in floating point (i.e., it repeats the previous estimate or settles
+    into a two-cycle, following Danby), or once the residual of Kepler's Equation is
+    within a few units in the last place of M. A tolerance tighter than machine
+    precision therefore cannot cause the solver to spin.
 
     Args:
-        mean_anomaly: The mean anomaly (M) (in degrees)
+        M: The mean anomaly (M) (in radians).
         eccentricity: The orbital eccentricity (e), (unitless).
-        tolerance: Convergence tolerance. Defaults to 1e-8.
+        E: The initial estimate of the eccentric anomaly (E) (in radians).
+        tolerance: Convergence tolerance.
+
+    Note: the eccentricity must be validated to be in [0, 1) by the caller, so the
+    derivative f'(E) = 1 - e*cos(E) >= 1 - e is bounded away from zero.
 
     Raises:
-        ValueError: If the derivative is zero, indicating no solution found.
         ValueError: If the maximum number of iterations is reached without convergence.
 
     Returns:
-        float: The eccentric anomaly (E) (in degrees).
+        float: The eccentric anomaly (E) (in radians).
     """
-    # Start with an initial guess for the eccentric anomaly equal to the mean anomaly:
-    E = radians(mean_anomaly)
+    E_previous = E_previous_2 = nan
 
-    M = E
+    # The smallest residual of f(E) = E - e*sin(E) - M that can be resolved in floating
+    # point, given the magnitude of M:
+    residual_floor = 4 * ulp(abs(M) + pi)
 
-    iteration = 0
-
-    while iteration < 1_000_000:
+    for _ in range(MAXIMUM_KEPLER_ITERATIONS):
         # Compute the value of Kepler's function: f(E) = E - e*sin(E) - M:
         f_value = E - eccentricity * sin(E) - M
 
         # Compute the derivative: f'(E) = 1 - e*cos(E):
         f_derivative = 1 - eccentricity * cos(E)
 
-        # Check if the derivative is close to zero to avoid division by zero:
-        if abs(f_derivative) < 1e-12:
-            raise ValueError("Derivative is close to zero; no solution found.")
-
         # Calculate the Newton-Raphson correction term:
         delta_E = -f_value / f_derivative
 
+        E_previous_2, E_previous = E_previous, E
+
         # Update the estimate for the eccentric anomaly:
         E += delta_E
 
-        # Check for convergence by comparing the absolute value of the correction
-        # term to the tolerance:
-        if abs(delta_E) < tolerance:
-            break
+        # Check for convergence, either by comparing the absolute value of the
+        # correction term to the tolerance, or by the estimate repeating itself, or by
+        # the residual reaching machine precision:
+        if (
+            abs(delta_E) < tolerance
+            or E == E_previous
+            or E == E_previous_2
+            or abs(f_value) <= residual_floor
+        ):
+            return E
+
+    # The maximum number of iterations was reached without convergence:
+    raise ValueError(
+        f"Failed to converge to the desired tolerance after "
+        f"{MAXIMUM_KEPLER_ITERATIONS} iterations."
+    )
+
+
+# **************************************************************************************
+
+
+def _solve_keplers_equation_markley(M: float, eccentricity: float) -> float:
+    """
+    Solve Kepler's Equation for the eccentric anomaly using Markley's (1995)
+    non-iterative method.
+
+    A starting estimate is obtained in closed form from a cubic approximation of
+    Kepler's Equation, and is then refined by a single fifth-order correction, giving
+    close to machine precision for all elliptical orbits without iteration.
+
+    See: F. L. Markley, "Kepler Equation Solver", Celestial Mechanics and Dynamical
+    Astronomy 63, 101-111 (1995).
+
+    Args:
+        M: The mean anomaly (M) (in radians).
+        eccentricity: The orbital eccentricity (e), (unitless).
+
+    Returns:
+        float: The eccentric anomaly (E) (in radians).
+    """
+    e = eccentricity
+
+    # Reduce the mean anomaly to the range [-π, π], keeping the whole revolutions to
+    # add back on to the solution:
+    m = remainder(M, 2 * pi)
+
+    revolutions = M - m
+
+    # Compute the closed form starting estimate from the cubic approximation:
+    α = (3 * pi * pi + 1.6 * pi * (pi - abs(m)) / (1 + e)) / (pi * pi - 6)
+
+    d = 3 * (1 - e) + α * e
+
+    q = 2 * α * d * (1 - e) - m * m
+
+    r = 3 * α * d * (d - 1 + e) * m + m * m * m
+
+    w = (abs(r) + sqrt(q * q * q + r * r)) ** (2 / 3)
+
+    E = (2 * r * w / (w * w + w * q + q * q) + m) / d
+
+    # Refine the starting estimate with a single fifth-order correction:
+    s = e * sin(E)
+
+    c = e * cos(E)
+
+    f0 = E - s - m
+    f1 = 1 - c
+    f2 = s
+    f3 = c
+    f4 = -s
+
+    δ3 = -f0 / (f1 - 0.5 * f0 * f2 / f1)
+
+    δ4 = -f0 / (f1 + 0.5 * δ3 * f2 + δ3 * δ3 * f3 / 6)
+
+    δ5 = -f0 / (f1 + 0.5 * δ4 * f2 + δ4 * δ4 * f3 / 6 + δ4 * δ4 * δ4 * f4 / 24)
+
+    return E + δ5 + revolutions
+
+
+# **************************************************************************************
+
+
+def get_eccentric_anomaly(
+    mean_anomaly: float,
+    eccentricity: float,
+    tolerance: float = 1e-8,
+    solver: Literal["markley", "newton"] = "markley",
+) -> float:
+    """
+    Solve Kepler's Equation for the eccentric anomaly (E) for a given mean anomaly (M)
+    and orbital eccentricity (e).
+
+    By default, Markley's (1995) non-iterative method is used, which reaches close to
+    machine precision with a fixed amount of work. The Newton-Raphson method, which
+    iteratively refines the estimate until the update is smaller than the specified
+    tolerance, remains available via solver="newton".
+
+    Args:
+        mean_anomaly: The mean anomaly (M) (in degrees)
+        eccentricity: The orbital eccentricity (e), (unitless).
+        tolerance: Convergence tolerance for the Newton-Raphson solver. Defaults to 1e-8.
+        solver: The solver to use, either "markley" or "newton". Defaults to "markley".
 
-        # Increment the iteration count:
-        iteration += 1
+    Raises:
+        ValueError: If the eccentricity is not within the range [0, 1) for an elliptical orbit.
+        ValueError: If the maximum number of iterations is reached without convergence.
+        ValueError: If the solver is not one of "markley" or "newton".
+
+    Returns:
+        float: The eccentric anomaly (E) (in degrees).
+    """
+    M = radians(mean_anomaly)
+
+    # Validate input eccentricity for an elliptical orbit, for which both solvers are
+    # valid and the derivative of Kepler's Equation can never vanish:
+    if not (0 <= eccentricity < 1):
+        raise ValueError(
+            "Eccentricity must be in the range [0, 1) for elliptical orbits."
+        )
+
+    if solver == "markley":
+        return degrees(_solve_keplers_equation_markley(M, eccentricity))
+
+    if solver == "newton":
+        E = _get_keplers_equation_starter(M, eccentricity)
+
+        return degrees(_solve_keplers_equation(M, eccentricity, E, tolerance))
+
+    raise ValueError("Solver must be one of 'markley' or 'newton'.")
+
+
+# **************************************************************************************
+
+
+def get_eccentric_anomalies(
+    mean_anomalies: Iterable[float],
+    eccentricity: float,
+    tolerance: float = 1e-8,
+    solver: Literal["markley", "newton"] = "markley",
+) -> List[float]:
+    """
+    Solve Kepler's Equation for the eccentric anomaly across an ensemble of mean
+    anomalies sharing the same orbital eccentricity.
+
+    By default, each mean anomaly is solved with Markley's (1995) non-iterative method,
+    so every element costs the same fixed amount of work regardless of ordering.
+
+    With solver="newton", each solve is instead seeded from the previous solution,
+    advanced to the next mean anomaly by a first-order step along Kepler's Equation
+    (dE/dM = 1 / (1 - e*cos(E))). For ordered, closely spaced mean anomalies (e.g.,
+    propagating an orbit across a series of epochs), this starts every Newton-Raphson
+    solve next to the root, so far fewer iterations are needed than when starting from
+    E = M.
+
+    Args:
+        mean_anomalies: The mean anomalies (M) (in degrees).
+        eccentricity: The orbital eccentricity (e), (unitless).
+        tolerance: Convergence tolerance for the Newton-Raphson solver. Defaults to 1e-8.
+        solver: The solver to use, either "markley" or "newton". Defaults to "markley".
+
+    Raises:
+        ValueError: If the eccentricity is not within the range [0, 1) for an elliptical orbit.
+        ValueError: If the maximum number of iterations is reached without convergence.
+        ValueError: If the solver is not one of "markley" or "newton".
 
-    # Check if the maximum number of iterations was reached without convergence:
-    else:
+    Returns:
+        List[float]: The eccentric anomalies (E) (in degrees), in the input order.
+    """
+    # Validate input eccentricity for an elliptical orbit:
+    if not (0 <= eccentricity < 1):
         raise ValueError(
-            "Failed to converge to the desired tolerance after 1,000,000 iterations."
+            "Eccentricity must be in the range [0, 1) for elliptical orbits."
         )
 
-    return degrees(E)
+    if solver == "markley":
+        return [
+            degrees(_solve_keplers_equation_markley(radians(M), eccentricity))
+            for M in mean_anomalies
+        ]
+
+    if solver != "newton":
+        raise ValueError("Solver must be one of 'markley' or 'newton'.")
+
+    anomalies: List[float] = []
+
+    previous: Optional[Tuple[float, float]] = None
+
+    for mean_anomaly in mean_anomalies:
+        M = radians(mean_anomaly)
+
+        # Seed from the starter for the first solve, otherwise advance the previous
+        # solution by the change in mean anomaly:
+        if previous is None:
+            E = _get_keplers_equation_starter(M, eccentricity)
+        else:
+            M_previous, E_previous = previous
+            E = E_previous + (M - M_previous) / (1 - eccentricity * cos(E_previous))
+
+            # The root always satisfies |E - M| = e * |sin(E)| <= e, and the first-order
+            # step is only reliable while it is small, so a step that overshoots either
+            # (e.g., a large step near pericenter of a highly eccentric orbit) is
+            # replaced by the starter:
+            if abs(E - M) > eccentricity or abs(E - E_previous) > 0.1:
+                E = _get_keplers_equation_starter(M, eccentricity)
+
+        E = _solve_keplers_equation(M, eccentricity, E, tolerance)
+
+        previous = (M, E)
+
+        anomalies.append(degrees(E))
+
+    return anomalies
 
 
 # **************************************************************************************
 
 
 def get_true_anomaly(
-    mean_anomaly: float, eccentricity: float, tolerance: float = 1e-8
+    mean_anomaly: float,
+    eccentricity: float,
+    tolerance: float = 1e-8,
+    solver: Literal["markley", "newton"] = "markley",
 ) -> float:
     """
     Calculate the true anomaly (ν) from the mean anomaly (M) and eccentricity (e).
 
+    Kepler's Equation is solved with the same solver as get_eccentric_anomaly, so the
+    tolerance only has an effect when solver="newton".
+
     Args:
         mean_anomaly: The mean anomaly (M) (in degrees)
         eccentricity: The orbital eccentricity (e).
-        tolerance: Convergence tolerance. Defaults to 1e-8.
+        tolerance: Convergence tolerance for the Newton-Raphson solver. Defaults to 1e-8.
+        solver: The solver to use, either "markley" or "newton". Defaults to "markley".
 
     Raises:
         ValueError: If the eccentricity is not within the range [0, 1) for an elliptical orbit.
+        ValueError: If the solver is not one of "markley" or "newton".
 
     Returns:
         The true anomaly (ν) (in degrees).
@@ -156,7 +447,40 @@ def get_true_anomaly(
         )
 
     # Compute the eccentric anomaly (E):
-    E = radians(get_eccentric_anomaly(mean_anomaly, eccentricity, tolerance))
+    E = get_eccentric_anomaly(mean_anomaly, eccentricity, tolerance, solver)
+
+    return get_true_anomaly_from_eccentric_anomaly(E, eccentricity)
+
+
+# **************************************************************************************
+
+
+def get_true_anomaly_from_eccentric_anomaly(
+    eccentric_anomaly: float, eccentricity: float
+) -> float:
+    """
+    Calculate the true anomaly (ν) from the eccentric anomaly (E) and eccentricity (e).
+
+    This allows callers that already hold the eccentric anomaly, e.g., to also compute
+    the orbital radius, to avoid solving Kepler's Equation a second time.
+
+    Args:
+        eccentric_anomaly: The eccentric anomaly (E) (in degrees).
+        eccentricity: The orbital eccentricity (e).
+
+    Raises:
+        ValueError: If the eccentricity is not within the range [0, 1) for an elliptical orbit.
+
+    Returns:
+        The true anomaly (ν) (in degrees).
+    """
+    # Validate input eccentricity for an elliptical orbit.
+    if not (0 <= eccentricity < 1):
+        raise ValueError(
+            "Eccentricity must be in the range [0, 1) for elliptical orbits."
+        )
+
+    E = radians(eccentric_anomaly)
 
     # Compute the true anomaly (ν) using the formula from Kepler's laws:
     ν = degrees(
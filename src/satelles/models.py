@@ -5,74 +5,55 @@
 
 # **************************************************************************************
 
-from typing import Annotated
-
-from pydantic import BaseModel, Field
+from dataclasses import dataclass
 
 # **************************************************************************************
 
 
-class Position(BaseModel):
-    x: Annotated[
-        float,
-        Field(
-            description="Geocentric X coordinate in meters; used for precise position calculations"
-        ),
-    ]
-
-    y: Annotated[
-        float,
-        Field(
-            description="Geocentric Y coordinate in meters; used for precise position calculations"
-        ),
-    ]
-
-    z: Annotated[
-        float,
-        Field(
-            description="Geocentric Z coordinate in meters; used for precise position calculations"
-        ),
-    ]
-
-    at: Annotated[
-        float,
-        Field(
-            description="Modified Julian Date (MJD) of the position; used for precise time-based calculations"
-        ),
-    ]
+@dataclass(frozen=True, slots=True)
+class Position:
+    """
+    A geocentric position sample at a given time.
+
+    Note: positions are constructed per interpolation sample, so they are kept as a
+    lightweight frozen dataclass rather than a validated model.
+    """
+
+    # Geocentric X coordinate in meters; used for precise position calculations:
+    x: float
+
+    # Geocentric Y coordinate in meters; used for precise position calculations:
+    y: float
+
+    # Geocentric Z coordinate in meters; used for precise position calculations:
+    z: float
+
+    # Modified Julian Date (MJD) of the position; used for precise time-based
+    # calculations:
+    at: float
 
 
 # **************************************************************************************
 
 
-class Velocity(BaseModel):
-    vx: Annotated[
-        float,
-        Field(
-            description="Geocentric X velocity in meters/second; required for orbit interpolation"
-        ),
-    ]
-
-    vy: Annotated[
-        float,
-        Field(
-            description="Geocentric Y velocity in meters/second; required for orbit interpolation"
-        ),
-    ]
-
-    vz: Annotated[
-        float,
-        Field(
-            description="Geocentric Z velocity in meters/second; required for orbit interpolation"
-        ),
-    ]
-
-    at: Annotated[
-        float,
-        Field(
-            description="Modified Julian Date (MJD) of the velocity; used for precise time-based calculations"
-        ),
-    ]
+@dataclass(frozen=True, slots=True)
+class Velocity:
+    """
+    A geocentric velocity sample at a given time.
+    """
+
+    # Geocentric X velocity in meters/second; required for orbit interpolation:
+    vx: float
+
+    # Geocentric Y velocity in meters/second; required for orbit interpolation:
+    vy: float
+
+    # Geocentric Z velocity in meters/second; required for orbit interpolation:
+    vz: float
+
+    # Modified Julian Date (MJD) of the velocity; used for precise time-based
+    # calculations:
+    at: float
 
 
 # **************************************************************************************
@@ -64,7 +64,7 @@ class QuaternionEulerKind(Enum):
 # **************************************************************************************
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Quaternion:
     """
     A class representing a quaternion for 3D rotations.
@@ -156,6 +156,32 @@ class Quaternion:
     def __matmul__(self, other: "Quaternion") -> "Quaternion":
         return self.multiply(other)
 
+    def to_rotation_matrix(self) -> Matrix3x3:
+        """
+        Returns the 3x3 rotation matrix equivalent to this quaternion.
+
+        The quaternion is normalised first, so the matrix is a proper rotation that
+        applies the same active rotation as rotate_vector.
+
+        Returns:
+            Matrix3x3: The rotation matrix.
+        """
+        normalised = self.normalise()
+
+        w, x, y, z = normalised.w, normalised.x, normalised.y, normalised.z
+
+        xx, yy, zz = x * x, y * y, z * z
+
+        xy, xz, yz = x * y, x * z, y * z
+
+        wx, wy, wz = w * x, w * y, w * z
+
+        return (
+            (1.0 - 2.0 * (yy + zz), 2.0 * (xy - wz), 2.0 * (xz + wy)),
+            (2.0 * (xy + wz), 1.0 - 2.0 * (xx + zz), 2.0 * (yz - wx)),
+            (2.0 * (xz - wy), 2.0 * (yz + wx), 1.0 - 2.0 * (xx + yy)),
+        )
+
     def rotate_vector(self, vector: CartesianCoordinate) -> CartesianCoordinate:
         """
         Rotates a 3D vector using this quaternion.
@@ -166,16 +192,16 @@ class Quaternion:
         Returns:
             CartesianCoordinate: The rotated vector.
         """
-        normalised = self.normalise()
-
-        q = Quaternion(0.0, vector["x"], vector["y"], vector["z"])
+        # Apply the equivalent rotation matrix, which avoids building the intermediate
+        # quaternions of the q * v * q̄ sandwich product:
+        (r00, r01, r02), (r10, r11, r12), (r20, r21, r22) = self.to_rotation_matrix()
 
-        rotated = normalised @ q @ normalised.conjugate()
+        x, y, z = vector["x"], vector["y"], vector["z"]
 
         return CartesianCoordinate(
-            x=rotated.x,
-            y=rotated.y,
-            z=rotated.z,
+            x=r00 * x + r01 * y + r02 * z,
+            y=r10 * x + r11 * y + r12 * z,
+            z=r20 * x + r21 * y + r22 * z,
         )
 
     @classmethod
@@ -186,6 +212,11 @@ class Quaternion:
         Returns:
             Quaternion: The identity quaternion.
         """
+        # Quaternions are immutable, so the identity is shared rather than rebuilt on
+        # every call (subclasses still construct their own instance):
+        if cls is Quaternion:
+            return QUATERNION_IDENTITY
+
         return cls(1.0, 0.0, 0.0, 0.0)
 
     @staticmethod
@@ -350,3 +381,8 @@ class Quaternion:
 
 
 # **************************************************************************************
+
+# The shared identity quaternion, returned by Quaternion.identity():
+QUATERNION_IDENTITY = Quaternion(1.0, 0.0, 0.0, 0.0)
+
+# **************************************************************************************
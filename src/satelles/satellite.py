@@ -6,6 +6,7 @@
 # **************************************************************************************
 
 from datetime import datetime, timezone
+from math import cos, radians, sin
 from typing import Annotated, Optional
 
 from celerity.coordinates import EquatorialCoordinate
@@ -17,15 +18,24 @@ from .constants import GRAVITATIONAL_CONSTANT
 from .coordinates import (
     convert_eci_to_equatorial,
     convert_perifocal_to_eci,
-    get_perifocal_coordinate,
 )
 from .covariance import Covariance
 from .earth import EARTH_MASS
-from .kepler import get_semi_major_axis, get_true_anomaly
+from .kepler import (
+    get_eccentric_anomaly,
+    get_semi_major_axis,
+    get_true_anomaly,
+    get_true_anomaly_from_eccentric_anomaly,
+)
 from .velocity import get_perifocal_velocity
 
 # **************************************************************************************
 
+# The satellite classification codes, and their descriptive names:
+CLASSIFICATIONS = {"U": "Unclassified", "C": "Classified", "S": "Secret"}
+
+# **************************************************************************************
+
 
 class ID(BaseModel):
     id: Annotated[
@@ -99,10 +109,12 @@ class ID(BaseModel):
 
     @field_validator("classification")
     def validate_classification(cls, value: str) -> str:
-        mapping = {"U": "Unclassified", "C": "Classified", "S": "Secret"}
-        if value not in mapping.keys():
-            raise ValueError(f"Classification must be one of {list(mapping.keys())}")
-        return mapping[value]
+        classification = CLASSIFICATIONS.get(value)
+        if classification is None:
+            raise ValueError(
+                f"Classification must be one of {list(CLASSIFICATIONS.keys())}"
+            )
+        return classification
 
 
 # **************************************************************************************
@@ -336,20 +348,25 @@ class Satellite(ID, OrbitalElements):
         # the epoch:
         M = self.mean_anomaly + self.mean_motion * 360 * (JD - self.jd)
 
-        # Get the true anomaly (in degrees) for the TLE given the mean anomaly at
-        # the epoch:
-        ν = get_true_anomaly(
-            mean_anomaly=M,
-            eccentricity=self.eccentricity,
-        )
+        e = self.eccentricity
 
-        return get_perifocal_coordinate(
-            semi_major_axis=a,
+        # Solve Kepler's Equation once for the eccentric anomaly (in degrees), and
+        # derive both the true anomaly and the orbital radius from it:
+        E = get_eccentric_anomaly(
             mean_anomaly=M,
-            true_anomaly=ν,
-            eccentricity=self.eccentricity,
+            eccentricity=e,
         )
 
+        # Get the true anomaly (in degrees) for the TLE given the eccentric anomaly at
+        # the epoch:
+        ν = radians(get_true_anomaly_from_eccentric_anomaly(E, e))
+
+        # Calculate the orbital radius (r) (in meters):
+        r = a * (1 - e * cos(radians(E)))
+
+        # The z-coordinate is always zero in the perifocal frame:
+        return CartesianCoordinate(x=r * cos(ν), y=r * sin(ν), z=0.0)
+
     @property
     def perifocal_velocity(self) -> Velocity:
         """
@@ -6,8 +6,7 @@
 # **************************************************************************************
 
 import re
-from datetime import datetime, timedelta, timezone
-from typing import Any, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
 
 from .constants import GRAVITATIONAL_CONSTANT
 from .earth import EARTH_MASS
@@ -44,6 +43,55 @@ line2_regex = re.compile(
 
 # **************************************************************************************
 
+# The formats of the TLE fields shared between the fixed columns of both lines:
+catalog_number_regex = re.compile(r"[0-9A-Z]{5}")
+
+angle_regex = re.compile(r"\d+\.\d+")
+
+integer_regex = re.compile(r"\d+")
+
+# The pattern for the ±DDDDD±D assumed decimal point scientific notation used in TLEs:
+scientific_notation_regex = re.compile(r"([+-]?)(\d{5})([+-]\d)")
+
+# **************************************************************************************
+
+# The fixed column layout of a TLE line, as (field, start, stop, format) entries, where
+# each stripped field must fully match its format:
+line1_columns: Tuple[Tuple[str, int, int, re.Pattern[str]], ...] = (
+    ("id", 2, 7, catalog_number_regex),
+    ("classification", 7, 8, re.compile(r"[A-Z]")),
+    ("designator", 9, 17, re.compile(r"\d{2}\d{3}[A-Z]{1,3}")),
+    ("year", 18, 20, re.compile(r"\d{2}")),
+    ("day", 20, 32, re.compile(r"\d{3}\.\d{8}")),
+    ("first_derivative_of_mean_motion", 33, 43, re.compile(r"[+-]?\.\d{8}")),
+    ("second_derivative_of_mean_motion", 44, 52, scientific_notation_regex),
+    ("drag", 53, 61, scientific_notation_regex),
+    ("ephemeris", 62, 63, re.compile(r"\d")),
+    ("set", 64, 69, integer_regex),
+)
+
+# **************************************************************************************
+
+line2_columns: Tuple[Tuple[str, int, int, re.Pattern[str]], ...] = (
+    ("id", 2, 7, catalog_number_regex),
+    ("inclination", 8, 16, angle_regex),
+    ("raan", 17, 25, angle_regex),
+    ("eccentricity", 26, 33, re.compile(r"\d{7}")),
+    ("argument_of_perigee", 34, 42, angle_regex),
+    ("mean_anomaly", 43, 51, angle_regex),
+    ("mean_motion", 52, 63, re.compile(r"\d+\.\d{8}")),
+    ("number_of_revolutions", 63, 69, integer_regex),
+)
+
+# **************************************************************************************
+
+# The columns that must be blank between the fields of a fixed column TLE line:
+line1_separators: Tuple[int, ...] = (1, 8, 17, 32, 43, 52, 61, 63)
+
+line2_separators: Tuple[int, ...] = (1, 7, 16, 25, 33, 42, 51)
+
+# **************************************************************************************
+
 
 def parse_scientific_notation(value: str) -> float:
     """
@@ -56,9 +104,7 @@ def parse_scientific_notation(value: str) -> float:
     Returns:
         The value as a float.
     """
-    pattern = re.compile(r"^([+-]?)(\d{5})([+-]\d)$")
-
-    match = pattern.match(value)
+    match = scientific_notation_regex.fullmatch(value)
 
     if not match:
         return 0.0
@@ -87,13 +133,22 @@ def parse_id_field(value: Any) -> Optional[int]:
     """
     if not isinstance(value, str):
         return None
-    try:
-        if value and value[0].isalpha():
-            return int(value, 36)
-        else:
-            return int(value, 10)
-    except ValueError:
-        return None
+
+    # Validate the characters up front, so that the integer parse cannot fail and no
+    # exception needs to be raised and caught for an invalid value:
+    if value.isdecimal():
+        return int(value, 10)
+
+    v = value.strip()
+
+    if v.isdecimal():
+        return int(v, 10)
+
+    # Alpha-5 catalog numbers lead with a letter, and are parsed as base-36:
+    if v.isascii() and v.isalnum() and v[:1].isalpha():
+        return int(v, 36)
+
+    return None
 
 
 # **************************************************************************************
@@ -160,11 +215,13 @@ def parse_epoch_field(value: Any) -> Optional[Tuple[int, float, float]]:
     except ValueError:
         return None
 
-    # Compute the date corresponding to the day of year (note: day 1 is January 1):
-    dt = datetime(year, 1, 1, tzinfo=timezone.utc) + timedelta(days=day - 1)
+    # Compute the Julian date of 0h UTC on January 1 of the (proleptic Gregorian) year:
+    y = year - 1
 
-    # Convert Unix timestamp to Julian date:
-    jd = dt.timestamp() / 86400 + 2440587.5
+    jd_january_1 = 1721425.5 + 365 * y + y // 4 - y // 100 + y // 400
+
+    # Offset by the fractional day of year (note: day 1 is January 1):
+    jd = jd_january_1 + (day - 1)
 
     return (year, day, jd)
 
@@ -311,6 +368,86 @@ def parse_number_of_revolutions_field(value: Any) -> Optional[int]:
 # **************************************************************************************
 
 
+def slice_tle_line(
+    line: str,
+    number: str,
+    columns: Tuple[Tuple[str, int, int, re.Pattern[str]], ...],
+    separators: Tuple[int, ...],
+) -> Optional[Dict[str, str]]:
+    """
+    Slice a TLE line into its fields using the fixed column offsets of the format.
+
+    Args:
+        line: The TLE line to slice.
+        number: The expected line number, e.g., either "1" or "2".
+        columns: The (field, start, stop, format) entries of each field.
+        separators: The columns that must be blank between the fields.
+
+    Returns:
+        The stripped fields keyed by name, or None if the line does not follow the
+        fixed column layout (e.g., it has non-standard spacing), or if any field does
+        not match its format (e.g., a corrupted column).
+    """
+    if len(line) != 69 or line[0] != number:
+        return None
+
+    for column in separators:
+        if line[column] != " ":
+            return None
+
+    fields: Dict[str, str] = {}
+
+    for name, start, stop, pattern in columns:
+        value = line[start:stop].strip()
+
+        # Check the field against its own format, so a corrupted column is rejected
+        # rather than parsed to a wrong value:
+        if not pattern.fullmatch(value):
+            return None
+
+        fields[name] = value
+
+    return fields
+
+
+# **************************************************************************************
+
+
+def get_tle_line_fields(
+    line: str,
+    number: str,
+    columns: Tuple[Tuple[str, int, int, re.Pattern[str]], ...],
+    separators: Tuple[int, ...],
+    regex: re.Pattern[str],
+) -> Optional[Dict[str, str]]:
+    """
+    Get the fields of a TLE line, slicing on the fixed column offsets where the line
+    follows the standard layout, and otherwise falling back to the line's regular
+    expression, which tolerates non-standard spacing.
+
+    Args:
+        line: The TLE line to parse.
+        number: The expected line number, e.g., either "1" or "2".
+        columns: The (field, start, stop, format) entries of each field.
+        separators: The columns that must be blank between the fields.
+        regex: The regular expression to fall back to.
+
+    Returns:
+        The fields keyed by name, or None if the line is not a valid TLE line.
+    """
+    fields = slice_tle_line(line, number, columns, separators)
+
+    if fields is not None:
+        return fields
+
+    match = regex.fullmatch(line)
+
+    return match.groupdict() if match else None
+
+
+# **************************************************************************************
+
+
 def parse_tle(tle: str) -> Satellite:
     """
     Parse a TLE string and return a Satellite instance if successful, otherwise raise a
@@ -341,32 +478,118 @@ def parse_tle(tle: str) -> Satellite:
     else:
         raise ValueError("Invalid TLE format")
 
-    # Match the TLE to the line 1 regular expression:
-    m1 = line1_regex.match(line1)
+    return parse_tle_lines(name, line1, line2)
+
+
+# **************************************************************************************
+
+
+def parse_tles(tles: Union[str, Iterable[str]]) -> Iterator[Satellite]:
+    """
+    Parse a catalog of TLEs, yielding a Satellite instance for each TLE in turn.
+
+    The catalog may freely mix three-line sets (name, line1, line2) and two-line sets
+    (line1, line2), and is consumed line by line, so a file object can be streamed
+    without reading the whole catalog into memory.
+
+    Args:
+        tles: The catalog as a string, or an iterable of lines (e.g., a file object).
+
+    Raises:
+        ValueError: If any TLE is not in a valid format or if any of its fields are
+        invalid, or if the catalog ends part way through a TLE.
+
+    Returns:
+        An iterator of Satellite instances, in catalog order.
+    """
+    lines = tles.splitlines() if isinstance(tles, str) else tles
+
+    name: Optional[str] = None
+
+    line1: Optional[str] = None
+
+    for line in lines:
+        line = line.strip()
+
+        if not line:
+            continue
+
+        # The line following line 1 is always line 2 (which is validated on parsing):
+        if line1 is not None:
+            yield parse_tle_lines(name or "", line1, line)
+            name, line1 = None, None
+            continue
+
+        # Otherwise, the line is either line 1 or the name line of a three-line set:
+        if line[0] == "1" and line[1:2] in (" ", "\t"):
+            line1 = line
+            continue
+
+        # A name line must be followed by line 1, and can never be an orphaned line 2:
+        if name is not None or (line[0] == "2" and line[1:2] in (" ", "\t")):
+            raise ValueError("Invalid TLE format")
+
+        name = line.removeprefix("0 ")
+
+    if name is not None or line1 is not None:
+        raise ValueError("Invalid TLE format")
+
+
+# **************************************************************************************
+
+
+def parse_tle_lines(name: str, line1: str, line2: str) -> Satellite:
+    """
+    Parse the name and the two lines of a TLE and return a Satellite instance if
+    successful, otherwise raise a ValueError.
+
+    Args:
+        name: The satellite name, or an empty string for a two-line set.
+        line1: The first line of the TLE, stripped of surrounding whitespace.
+        line2: The second line of the TLE, stripped of surrounding whitespace.
+
+    Raises:
+        ValueError: If the TLE lines are not in a valid format or if any of the fields
+        are invalid.
+
+    Returns:
+        A Satellite instance if parsing is successful.
+    """
+    # Short-circuit on the line numbers before any slicing or regex matching, e.g., for
+    # truncated, empty or misaligned line sets:
+    if line1[:1] != "1" or line2[:1] != "2":
+        raise ValueError("Invalid TLE format")
+
+    # Get the fields of line 1, by fixed column slicing or the line 1 regex:
+    f1 = get_tle_line_fields(line1, "1", line1_columns, line1_separators, line1_regex)
 
-    # Match the TLE to the line 2 regular expression:
-    m2 = line2_regex.match(line2)
+    # Get the fields of line 2, by fixed column slicing or the line 2 regex:
+    f2 = get_tle_line_fields(line2, "2", line2_columns, line2_separators, line2_regex)
 
-    if not m1 or not m2:
+    if not f1 or not f2:
         raise ValueError("Invalid TLE format")
 
-    id_field = m1.group("id")
-    classification_field = m1.group("classification")
-    designator_field = m1.group("designator")
-    year_field = m1.group("year")
-    day_field = m1.group("day")
-    fdmm_field = m1.group("first_derivative_of_mean_motion")
-    sdmm_field = m1.group("second_derivative_of_mean_motion")
-    drag_field = m1.group("drag")
-    ephemeris_field = m1.group("ephemeris")
-    set_field = m1.group("set")
-    inclination_field = m2.group("inclination")
-    raan_field = m2.group("raan")
-    eccentricity_field = m2.group("eccentricity")
-    argument_of_perigee_field = m2.group("argument_of_perigee")
-    mean_anomaly_field = m2.group("mean_anomaly")
-    mean_motion_field = m2.group("mean_motion")
-    number_of_revolutions_field = m2.group("number_of_revolutions")
+    # Ensure both lines describe the same satellite before parsing the fields:
+    if f1["id"] != f2["id"]:
+        raise ValueError("Mismatched catalog numbers between TLE lines")
+
+    id_field = f1["id"]
+    classification_field = f1["classification"]
+    designator_field = f1["designator"]
+    year_field = f1["year"]
+    day_field = f1["day"]
+    fdmm_field = f1["first_derivative_of_mean_motion"]
+    sdmm_field = f1["second_derivative_of_mean_motion"]
+    drag_field = f1["drag"]
+    ephemeris_field = f1["ephemeris"]
+    set_field = f1["set"]
+    inclination_field = f2["inclination"]
+    raan_field = f2["raan"]
+    eccentricity_field = f2["eccentricity"]
+    argument_of_perigee_field = f2["argument_of_perigee"]
+    mean_anomaly_field = f2["mean_anomaly"]
+    mean_motion_field = f2["mean_motion"]
+    number_of_revolutions_field = f2["number_of_revolutions"]
 
     id = parse_id_field(id_field)
 
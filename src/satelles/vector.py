@@ -6,9 +6,11 @@
 # **************************************************************************************
 
 from dataclasses import dataclass
-from math import acos, cos, degrees, isclose, radians, sin, sqrt
+from enum import IntEnum
+from functools import lru_cache
+from math import acos, cos, degrees, hypot, isclose, radians, sin
 from sys import float_info
-from typing import Literal
+from typing import Callable, Dict, Literal, Tuple, Union
 
 from .common import CartesianCoordinate
 
@@ -19,6 +21,19 @@ TOLERANCE = float_info.epsilon
 # **************************************************************************************
 
 
+class Axis(IntEnum):
+    """
+    Enumeration for the principal axes a vector can be rotated around.
+    """
+
+    X = 0
+    Y = 1
+    Z = 2
+
+
+# **************************************************************************************
+
+
 def add(vector: CartesianCoordinate, delta: CartesianCoordinate) -> CartesianCoordinate:
     """
     Add two 3D vectors (x, y, z) component-wise.
@@ -102,13 +117,17 @@ def normalise(
     # Compute the vector's magnitude (length):
     r = magnitude(vector)
 
-    if isclose(r, 0.0, abs_tol=TOLERANCE):
+    # Magnitudes are nonnegative, so a direct comparison suffices for the zero check:
+    if r <= TOLERANCE:
         raise ValueError("Cannot convert a zero-length vector to a unit vector.")
 
+    # Divide once and scale each component by the reciprocal magnitude:
+    inverse = 1.0 / r
+
     return CartesianCoordinate(
-        x=vector["x"] / r,
-        y=vector["y"] / r,
-        z=vector["z"] / r,
+        x=vector["x"] * inverse,
+        y=vector["y"] * inverse,
+        z=vector["z"] * inverse,
     )
 
 
@@ -125,9 +144,7 @@ def magnitude(vector: CartesianCoordinate) -> float:
     Returns:
         float: The magnitude of the vector.
     """
-    x, y, z = vector["x"], vector["y"], vector["z"]
-
-    return sqrt(x**2 + y**2 + z**2)
+    return hypot(vector["x"], vector["y"], vector["z"])
 
 
 # **************************************************************************************
@@ -144,7 +161,8 @@ def distance(i: CartesianCoordinate, j: CartesianCoordinate) -> float:
     Returns:
         float: The distance between the two points.
     """
-    return magnitude(subtract(j, i))
+    # Compute the component differences directly, avoiding an intermediate vector:
+    return hypot(j["x"] - i["x"], j["y"] - i["y"], j["z"] - i["z"])
 
 
 # **************************************************************************************
@@ -178,42 +196,54 @@ def cross(i: CartesianCoordinate, j: CartesianCoordinate) -> CartesianCoordinate
     Returns:
         CartesianCoordinate: The cross product of the two vectors.
     """
+    # Read each component once, as each is used twice in the cross product:
+    ix, iy, iz = i["x"], i["y"], i["z"]
+
+    jx, jy, jz = j["x"], j["y"], j["z"]
+
     return CartesianCoordinate(
-        x=i["y"] * j["z"] - i["z"] * j["y"],
-        y=i["z"] * j["x"] - i["x"] * j["z"],
-        z=i["x"] * j["y"] - i["y"] * j["x"],
+        x=iy * jz - iz * jy,
+        y=iz * jx - ix * jz,
+        z=ix * jy - iy * jx,
     )
 
 
 # **************************************************************************************
 
 
-def angle(i: CartesianCoordinate, j: CartesianCoordinate) -> float:
+def _angle3(ix: float, iy: float, iz: float, jx: float, jy: float, jz: float) -> float:
     """
-    Compute the angle in degrees between two 3D vectors.
+    Compute the angle in degrees between two 3D vectors given as components.
 
     Args:
-        i (CartesianCoordinate): The first vector.
-        j (CartesianCoordinate): The second vector.
+        ix, iy, iz (float): The components of the first vector.
+        jx, jy, jz (float): The components of the second vector.
 
     Returns:
         float: The angle between the two vectors in degrees.
+
+    Raises:
+        ValueError: If either vector has zero length.
     """
     # Compute the magnitude of vector i:
-    im = magnitude(i)
+    im = hypot(ix, iy, iz)
 
     # Compute the magnitude of vector j:
-    jm = magnitude(j)
+    jm = hypot(jx, jy, jz)
 
     # Check for zero-length vectors to avoid division by zero:
-    if isclose(im, 0.0, abs_tol=TOLERANCE) or isclose(jm, 0.0, abs_tol=TOLERANCE):
+    if im <= TOLERANCE or jm <= TOLERANCE:
         raise ValueError("Cannot compute the angle with a zero-length vector.")
 
     # Compute the cosine of the angle using the dot product formula:
-    angle = dot(i, j) / (im * jm)
+    angle = (ix * jx + iy * jy + iz * jz) / (im * jm)
 
-    # Clamp the cosine value to the valid range [-1, 1] to avoid numerical issues:
-    angle = max(-1.0, min(1.0, angle))
+    # Clamp the cosine value to the valid range [-1, 1] to avoid numerical issues (the
+    # negated upper comparison also maps NaN to 1.0, as the previous clamp did):
+    if not angle <= 1.0:
+        angle = 1.0
+    elif angle < -1.0:
+        angle = -1.0
 
     # Compute the angle in radians and then convert to degrees:
     return degrees(acos(angle))
@@ -222,8 +252,131 @@ def angle(i: CartesianCoordinate, j: CartesianCoordinate) -> float:
 # **************************************************************************************
 
 
+def angle(i: CartesianCoordinate, j: CartesianCoordinate) -> float:
+    """
+    Compute the angle in degrees between two 3D vectors.
+
+    Args:
+        i (CartesianCoordinate): The first vector.
+        j (CartesianCoordinate): The second vector.
+
+    Returns:
+        float: The angle between the two vectors in degrees.
+    """
+    return _angle3(i["x"], i["y"], i["z"], j["x"], j["y"], j["z"])
+
+
+# **************************************************************************************
+
+
+@lru_cache(maxsize=128)
+def _get_rotation_terms(angle: float) -> Tuple[float, float]:
+    """
+    Compute the cosine and sine of a rotation angle given in degrees.
+
+    Args:
+        angle (float): The rotation angle (in degrees).
+
+    Returns:
+        Tuple[float, float]: The cosine and sine of the angle.
+    """
+    A = radians(angle)
+
+    return cos(A), sin(A)
+
+
+# **************************************************************************************
+
+
+def _rotate_x(
+    x: float, y: float, z: float, c: float, s: float
+) -> Tuple[float, float, float]:
+    # Rotate the vector around the x-axis:
+    return x, y * c - z * s, y * s + z * c
+
+
+# **************************************************************************************
+
+
+def _rotate_y(
+    x: float, y: float, z: float, c: float, s: float
+) -> Tuple[float, float, float]:
+    # Rotate the vector around the y-axis:
+    return x * c + z * s, y, -x * s + z * c
+
+
+# **************************************************************************************
+
+
+def _rotate_z(
+    x: float, y: float, z: float, c: float, s: float
+) -> Tuple[float, float, float]:
+    # Rotate the vector around the z-axis:
+    return x * c - y * s, x * s + y * c, z
+
+
+# **************************************************************************************
+
+# The rotation formulae, indexed by the integer value of the Axis enumeration:
+ROTATIONS: Tuple[
+    Callable[[float, float, float, float, float], Tuple[float, float, float]], ...
+] = (_rotate_x, _rotate_y, _rotate_z)
+
+# The Axis for each accepted axis name:
+AXES: Dict[str, Axis] = {
+    "x": Axis.X,
+    "y": Axis.Y,
+    "z": Axis.Z,
+}
+
+# **************************************************************************************
+
+
+def _rotate3(
+    x: float,
+    y: float,
+    z: float,
+    angle: float,
+    axis: Union[Axis, Literal["x", "y", "z"]],
+) -> Tuple[float, float, float]:
+    """
+    Rotate a 3D vector given as components by a given angle (in degrees) around the
+    specified axis.
+
+    Args:
+        x, y, z (float): The components of the vector to rotate.
+        angle (float): The rotation angle (in degrees).
+        axis (Axis | Literal['x', 'y', 'z']): The axis to rotate around.
+
+    Returns:
+        Tuple[float, float, float]: The rotated (x, y, z) components.
+
+    Raises:
+        ValueError: If the provided axis is not one of 'x', 'y', or 'z'.
+    """
+    # Axis members are matched by type rather than by value, as plain integers and
+    # booleans hash equal to the members of an IntEnum and must not be accepted:
+    if isinstance(axis, Axis):
+        index = axis
+    elif isinstance(axis, str) and axis in AXES:
+        index = AXES[axis]
+    else:
+        raise ValueError("Axis must be 'x', 'y', or 'z'.")
+
+    # Look up the trigonometric terms, which are cached as the same angle is commonly
+    # applied to many vectors in turn:
+    c, s = _get_rotation_terms(angle)
+
+    return ROTATIONS[index](x, y, z, c, s)
+
+
+# **************************************************************************************
+
+
 def rotate(
-    vector: CartesianCoordinate, angle: float, axis: Literal["x", "y", "z"]
+    vector: CartesianCoordinate,
+    angle: float,
+    axis: Union[Axis, Literal["x", "y", "z"]],
 ) -> CartesianCoordinate:
     """
     Rotate a 3D vector (x, y, z) by a given angle (in degrees) around the specified axis.
@@ -231,7 +384,8 @@ def rotate(
     Args:
         vector (CartesianCoordinate): The vector to rotate.
         angle (float): The rotation angle (in degrees).
-        axis (Literal['x', 'y', 'z']): The axis to rotate around ('x', 'y', or 'z').
+        axis (Axis | Literal['x', 'y', 'z']): The axis to rotate around, either as an
+            Axis member or as 'x', 'y', or 'z'.
 
     Returns:
         CartesianCoordinate: The rotated vector as a CartesianCoordinate object.
@@ -239,35 +393,41 @@ def rotate(
     Raises:
         ValueError: If the provided axis is not one of 'x', 'y', or 'z'.
     """
-    x, y, z = vector["x"], vector["y"], vector["z"]
+    x, y, z = _rotate3(vector["x"], vector["y"], vector["z"], angle, axis)
 
-    A = radians(angle)
+    return CartesianCoordinate(x=x, y=y, z=z)
 
-    # Rotate the vector around the z-axis:
-    if axis == "z":
-        return CartesianCoordinate(
-            x=x * cos(A) - y * sin(A),
-            y=x * sin(A) + y * cos(A),
-            z=z,
-        )
 
-    # Rotate the vector around the x-axis:
-    if axis == "x":
-        return CartesianCoordinate(
-            x=x,
-            y=y * cos(A) - z * sin(A),
-            z=y * sin(A) + z * cos(A),
-        )
+# **************************************************************************************
 
-    # Rotate the vector around the y-axis:
-    if axis == "y":
-        return CartesianCoordinate(
-            x=x * cos(A) + z * sin(A),
-            y=y,
-            z=-x * sin(A) + z * cos(A),
-        )
 
-    raise ValueError("Axis must be 'x', 'y', or 'z'.")
+def _project3(
+    x: float, y: float, z: float, ox: float, oy: float, oz: float
+) -> Tuple[float, float, float]:
+    """
+    Project one 3D vector onto another, both given as components.
+
+    Args:
+        x, y, z (float): The components of the vector to be projected.
+        ox, oy, oz (float): The components of the vector to project onto.
+
+    Returns:
+        Tuple[float, float, float]: The projected (x, y, z) components.
+
+    Raises:
+        ValueError: If the vector to project onto has zero length.
+    """
+    # Compute the dot product of 'onto' with itself:
+    oo = ox * ox + oy * oy + oz * oz
+
+    # Check for zero-length 'onto' vector to avoid division by zero:
+    if oo <= TOLERANCE:
+        raise ValueError("Cannot project onto a zero-length vector.")
+
+    # Compute the scaling factor for the projection:
+    scale = (x * ox + y * oy + z * oz) / oo
+
+    return ox * scale, oy * scale, oz * scale
 
 
 # **************************************************************************************
@@ -286,18 +446,11 @@ def project(
     Returns:
         CartesianCoordinate: The projected vector.
     """
-    # Compute the dot product of 'onto' with itself:
-    oo = dot(onto, onto)
-
-    # Check for zero-length 'onto' vector to avoid division by zero:
-    if isclose(oo, 0.0, abs_tol=TOLERANCE):
-        raise ValueError("Cannot project onto a zero-length vector.")
-
-    # Compute the scaling factor for the projection:
-    scale = dot(vector, onto) / oo
+    x, y, z = _project3(
+        vector["x"], vector["y"], vector["z"], onto["x"], onto["y"], onto["z"]
+    )
 
-    # Return the projected vector:
-    return dilate(onto, scale)
+    return CartesianCoordinate(x=x, y=y, z=z)
 
 
 # **************************************************************************************
@@ -316,14 +469,18 @@ def reject(
     Returns:
         CartesianCoordinate: The rejection vector.
     """
+    x, y, z = vector["x"], vector["y"], vector["z"]
+
+    px, py, pz = _project3(x, y, z, base["x"], base["y"], base["z"])
+
     # Compute the rejection by subtracting the projection from the original vector:
-    return subtract(vector, project(vector, base))
+    return CartesianCoordinate(x=x - px, y=y - py, z=z - pz)
 
 
 # **************************************************************************************
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Vector:
     """
     A class representing a 3D vector with x, y, z components.
@@ -393,13 +550,15 @@ class Vector:
         """
         r = self.magnitude()
 
-        if isclose(r, 0.0, abs_tol=TOLERANCE):
+        if r <= TOLERANCE:
             raise ValueError("Cannot convert a zero-length vector to a unit vector.")
 
+        inverse = 1.0 / r
+
         return Vector(
-            x=self.x / r,
-            y=self.y / r,
-            z=self.z / r,
+            x=self.x * inverse,
+            y=self.y * inverse,
+            z=self.z * inverse,
         )
 
     def magnitude(self) -> float:
@@ -409,7 +568,7 @@ class Vector:
         Returns:
             float: The magnitude of the vector.
         """
-        return sqrt(self.x**2 + self.y**2 + self.z**2)
+        return hypot(self.x, self.y, self.z)
 
     def distance(self, other: "Vector") -> float:
         """
@@ -421,7 +580,7 @@ class Vector:
         Returns:
             float: The distance between the two vectors.
         """
-        return self.subtract(other).magnitude()
+        return hypot(self.x - other.x, self.y - other.y, self.z - other.z)
 
     def dot(self, other: "Vector") -> float:
         """
@@ -461,29 +620,25 @@ class Vector:
         Returns:
             float: The angle between the two vectors in degrees.
         """
-        return angle(
-            i=CartesianCoordinate(x=self.x, y=self.y, z=self.z),
-            j=CartesianCoordinate(x=other.x, y=other.y, z=other.z),
-        )
+        return _angle3(self.x, self.y, self.z, other.x, other.y, other.z)
 
-    def rotate(self, angle: float, axis: Literal["x", "y", "z"]) -> "Vector":
+    def rotate(
+        self, angle: float, axis: Union[Axis, Literal["x", "y", "z"]]
+    ) -> "Vector":
         """
         Rotate this Vector by a given angle (in degrees) around the specified axis.
 
         Args:
             angle (float): The rotation angle (in degrees).
-            axis (Literal['x', 'y', 'z']): The axis to rotate around ('x', 'y', or 'z').
+            axis (Axis | Literal['x', 'y', 'z']): The axis to rotate around, either as
+                an Axis member or as 'x', 'y', or 'z'.
 
         Returns:
             Vector: The rotated vector.
         """
-        rotated = rotate(
-            vector=CartesianCoordinate(x=self.x, y=self.y, z=self.z),
-            angle=angle,
-            axis=axis,
-        )
+        x, y, z = _rotate3(self.x, self.y, self.z, angle, axis)
 
-        return Vector(x=rotated["x"], y=rotated["y"], z=rotated["z"])
+        return Vector(x=x, y=y, z=z)
 
     def project(self, onto: "Vector") -> "Vector":
         """
@@ -495,12 +650,9 @@ class Vector:
         Returns:
             Vector: The projected vector.
         """
-        projected = project(
-            vector=CartesianCoordinate(x=self.x, y=self.y, z=self.z),
-            onto=CartesianCoordinate(x=onto.x, y=onto.y, z=onto.z),
-        )
+        x, y, z = _project3(self.x, self.y, self.z, onto.x, onto.y, onto.z)
 
-        return Vector(x=projected["x"], y=projected["y"], z=projected["z"])
+        return Vector(x=x, y=y, z=z)
 
     def reject(self, base: "Vector") -> "Vector":
         """
@@ -512,12 +664,9 @@ class Vector:
         Returns:
             Vector: The rejection vector.
         """
-        rejected = reject(
-            vector=CartesianCoordinate(x=self.x, y=self.y, z=self.z),
-            base=CartesianCoordinate(x=base.x, y=base.y, z=base.z),
-        )
+        px, py, pz = _project3(self.x, self.y, self.z, base.x, base.y, base.z)
 
-        return Vector(x=rejected["x"], y=rejected["y"], z=rejected["z"])
+        return Vector(x=self.x - px, y=self.y - py, z=self.z - pz)
 
     def __add__(self, other: "Vector") -> "Vector":
         return self.add(other)
@@ -34,7 +34,10 @@ from satelles import (
     convert_lla_to_ecef,
     convert_perifocal_to_eci,
     get_eccentric_anomaly,
+    get_eci_coordinate,
     get_perifocal_coordinate,
+    get_perifocal_coordinates,
+    get_true_anomaly,
 )
 
 # **************************************************************************************
@@ -120,6 +123,42 @@ class TestGetPerifocalPosition(unittest.TestCase):
 # **************************************************************************************
 
 
+class TestGetPerifocalPositions(unittest.TestCase):
+    def test_matches_scalar_perifocal_coordinate(self):
+        """
+        Test that each ensemble position matches the scalar perifocal coordinate.
+        """
+        semi_major_axis = 7_000_000.0
+        eccentricity = 0.1
+
+        mean_anomalies = [0.0, 30.0, 60.0, 90.0, 180.0, 270.0, 359.0]
+
+        results = get_perifocal_coordinates(
+            semi_major_axis,
+            mean_anomalies,
+            eccentricity,
+        )
+
+        self.assertEqual(len(results), len(mean_anomalies))
+
+        for M, result in zip(mean_anomalies, results):
+            ν = get_true_anomaly(M, eccentricity)
+            expected = get_perifocal_coordinate(semi_major_axis, M, ν, eccentricity)
+            self.assertAlmostEqual(result["x"], expected["x"], places=6)
+            self.assertAlmostEqual(result["y"], expected["y"], places=6)
+            self.assertAlmostEqual(result["z"], expected["z"], places=6)
+
+    def test_invalid_eccentricity_raises_value_error(self):
+        """
+        Test that a non-elliptical eccentricity raises a ValueError.
+        """
+        with self.assertRaises(ValueError):
+            get_perifocal_coordinates(7_000_000.0, [0.0, 10.0], 1.0)
+
+
+# **************************************************************************************
+
+
 class TestConvertPerifocalToECI(unittest.TestCase):
     def assertCoordinatesAlmostEqual(
         self, coord1: CartesianCoordinate, coord2: CartesianCoordinate, places: int = 6
@@ -175,6 +214,31 @@ class TestConvertPerifocalToECI(unittest.TestCase):
 # **************************************************************************************
 
 
+class TestGetECICoordinate(unittest.TestCase):
+    def test_matches_composed_conversion(self) -> None:
+        """
+        The fused conversion should match converting the perifocal coordinate to ECI.
+        """
+        a, e = 7_000_000.0, 0.1
+
+        for M, ν, ω, i, Ω in [
+            (0.0, 0.0, 0.0, 0.0, 0.0),
+            (45.0, 55.0, 90.0, 51.6, 120.0),
+            (200.0, 190.0, 270.0, 98.7, 300.0),
+        ]:
+            with self.subTest(M=M, ν=ν, ω=ω, i=i, Ω=Ω):
+                expected = convert_perifocal_to_eci(
+                    get_perifocal_coordinate(a, M, ν, e), ω, i, Ω
+                )
+                result = get_eci_coordinate(a, M, ν, e, ω, i, Ω)
+                self.assertAlmostEqual(result["x"], expected["x"], places=6)
+                self.assertAlmostEqual(result["y"], expected["y"], places=6)
+                self.assertAlmostEqual(result["z"], expected["z"], places=6)
+
+
+# **************************************************************************************
+
+
 class TestConvertECEFToECI(unittest.TestCase):
     def assertCoordinatesAlmostEqual(
         self, coord1: CartesianCoordinate, coord2: CartesianCoordinate, places: int = 4
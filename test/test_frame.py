@@ -6,17 +6,20 @@
 # **************************************************************************************
 
 import unittest
+from dataclasses import asdict, fields
 from datetime import datetime
 
 from satelles.body import Body
 from satelles.common import CartesianCoordinate
-from satelles.frame import Frame, Reference, Transform
+from satelles.frame import Frame, Reference, Transform, cache_transform_provider
 from satelles.quaternion import Quaternion
 
+from .utils import SatellesTestCase
+
 # **************************************************************************************
 
 
-class TestReference(unittest.TestCase):
+class TestReference(SatellesTestCase):
     def test_is_inertial(self):
         self.assertTrue(Reference.ECI.is_inertial)
         self.assertTrue(Reference.ICRF.is_inertial)
@@ -39,31 +42,34 @@ class TestReference(unittest.TestCase):
 # **************************************************************************************
 
 
-class TestTransform(unittest.TestCase):
-    def test_identity_transform_leaves_vector_unchanged(self) -> None:
-        """
-        Test that the identity transform leaves a vector unchanged.
-        """
-        identity = Transform(
+class TestTransform(SatellesTestCase):
+    def setUp(self) -> None:
+        self.z = CartesianCoordinate(x=0.0, y=0.0, z=1.0)
+
+        self.origin = CartesianCoordinate(x=0.0, y=0.0, z=0.0)
+
+        self.identity = Transform(
             rotation=Quaternion.identity(),
             translation=CartesianCoordinate(x=0.0, y=0.0, z=0.0),
         )
 
+    def test_identity_transform_leaves_vector_unchanged(self) -> None:
+        """
+        Test that the identity transform leaves a vector unchanged.
+        """
         vector = CartesianCoordinate(x=1.0, y=-2.0, z=3.5)
 
-        result = identity.apply_to_position(vector)
+        result = self.identity.apply_to_position(vector)
 
-        self.assertAlmostEqual(result["x"], 1.0, places=12)
-        self.assertAlmostEqual(result["y"], -2.0, places=12)
-        self.assertAlmostEqual(result["z"], 3.5, places=12)
+        self.assertIsClose(result["x"], 1.0, places=12)
+        self.assertIsClose(result["y"], -2.0, places=12)
+        self.assertIsClose(result["z"], 3.5, places=12)
 
     def test_inverse_transform_round_trip(self) -> None:
         """
         Test 90° rotation about +Z, plus a translation
         """
-        z = CartesianCoordinate(x=0.0, y=0.0, z=1.0)
-
-        rotation = Quaternion.from_axis_angle(axis=z, angle=90.0)
+        rotation = Quaternion.from_axis_angle(axis=self.z, angle=90.0)
 
         translation = CartesianCoordinate(x=1.0, y=2.0, z=3.0)
 
@@ -81,42 +87,219 @@ class TestTransform(unittest.TestCase):
 
         original = inverse.apply_to_position(forward)
 
-        self.assertAlmostEqual(original["x"], origin["x"], places=10)
-        self.assertAlmostEqual(original["y"], origin["y"], places=10)
-        self.assertAlmostEqual(original["z"], origin["z"], places=10)
+        self.assertIsClose(original["x"], origin["x"], places=10)
+        self.assertIsClose(original["y"], origin["y"], places=10)
+        self.assertIsClose(original["z"], origin["z"], places=10)
 
     def test_compose_matches_sequential_application(self) -> None:
         """
         Test that composing two transforms matches applying them sequentially.
         """
         AB = Transform(
-            rotation=Quaternion.identity(),
+            rotation=self.identity.rotation,
             translation=CartesianCoordinate(x=1.0, y=0.0, z=0.0),
         )  # A -> B
 
         BC = Transform(
-            rotation=Quaternion.identity(),
+            rotation=self.identity.rotation,
             translation=CartesianCoordinate(x=0.0, y=2.0, z=0.0),
         )  # B -> C
 
         # (B->C) ∘ (A->B) = A->C:
         composed = BC.compose(AB)
 
-        origin = CartesianCoordinate(x=0.0, y=0.0, z=0.0)
+        sequential = BC.apply_to_position(AB.apply_to_position(self.origin))
+
+        original = composed.apply_to_position(self.origin)
+
+        self.assertIsClose(original["x"], sequential["x"], places=12)
+        self.assertIsClose(original["y"], sequential["y"], places=12)
+        self.assertIsClose(original["z"], sequential["z"], places=12)
+
+    def test_rotation_matrix_is_cached_and_matches_rotation(self) -> None:
+        """
+        Test that the rotation matrix is derived once and agrees with the quaternion.
+        """
+        axis = CartesianCoordinate(x=1.0, y=1.0, z=0.0)
+
+        transform = Transform(
+            rotation=Quaternion.from_axis_angle(axis=axis, angle=30.0),
+            translation=CartesianCoordinate(x=0.5, y=-1.0, z=2.0),
+        )
+
+        self.assertIs(transform.rotation_matrix, transform.rotation_matrix)
+
+        position = CartesianCoordinate(x=4.0, y=0.0, z=-1.0)
+
+        rotated = transform.rotation.rotate_vector(position)
 
-        sequential = BC.apply_to_position(AB.apply_to_position(origin))
+        result = transform.apply_to_position(position)
+
+        self.assertIsClose(result["x"], rotated["x"] + 0.5, places=12)
+        self.assertIsClose(result["y"], rotated["y"] - 1.0, places=12)
+        self.assertIsClose(result["z"], rotated["z"] + 2.0, places=12)
+
+    def test_apply_to_positions_matches_apply_to_position(self) -> None:
+        """
+        Test that the batch transform matches transforming each position in turn.
+        """
+        axis = CartesianCoordinate(x=0.0, y=1.0, z=1.0)
+
+        transform = Transform(
+            rotation=Quaternion.from_axis_angle(axis=axis, angle=60.0),
+            translation=CartesianCoordinate(x=-1.0, y=0.5, z=2.0),
+        )
+
+        positions = [
+            CartesianCoordinate(x=1.0, y=0.0, z=0.0),
+            CartesianCoordinate(x=0.0, y=-2.0, z=3.0),
+            CartesianCoordinate(x=7.0, y=1.5, z=-4.0),
+        ]
+
+        results = transform.apply_to_positions(positions)
+
+        self.assertEqual(len(results), len(positions))
+
+        for position, result in zip(positions, results):
+            expected = transform.apply_to_position(position)
+            self.assertIsClose(result["x"], expected["x"], places=12)
+            self.assertIsClose(result["y"], expected["y"], places=12)
+            self.assertIsClose(result["z"], expected["z"], places=12)
+
+        self.assertEqual(transform.apply_to_positions([]), [])
+
+    def test_compose_seeds_rotation_matrix_from_operands(self) -> None:
+        """
+        Test that composing transforms with derived matrices seeds the composed matrix.
+        """
+        AB = Transform(
+            rotation=Quaternion.from_axis_angle(axis=self.z, angle=30.0),
+            translation=CartesianCoordinate(x=1.0, y=0.0, z=0.0),
+        )
+
+        BC = Transform(
+            rotation=Quaternion.from_axis_angle(
+                axis=CartesianCoordinate(x=1.0, y=0.0, z=0.0), angle=60.0
+            ),
+            translation=CartesianCoordinate(x=0.0, y=2.0, z=0.0),
+        )
 
-        original = composed.apply_to_position(origin)
+        self.assertIsNone(getattr(BC.compose(AB), "_rotation_matrix", None))
 
-        self.assertAlmostEqual(original["x"], sequential["x"], places=12)
-        self.assertAlmostEqual(original["y"], sequential["y"], places=12)
-        self.assertAlmostEqual(original["z"], sequential["z"], places=12)
+        # Derive both rotation matrices before composing:
+        self.assertIsNotNone(AB.rotation_matrix)
+        self.assertIsNotNone(BC.rotation_matrix)
+
+        composed = BC.compose(AB)
+
+        self.assertIsNotNone(getattr(composed, "_rotation_matrix", None))
+
+        expected = composed.rotation.to_rotation_matrix()
+
+        for row, expected_row in zip(composed.rotation_matrix, expected):
+            for value, expected_value in zip(row, expected_row):
+                self.assertIsClose(value, expected_value, places=12)
+
+    def test_inverse_reflects_the_current_translation(self) -> None:
+        """
+        Test that the inverse is not memoised over the mutable translation.
+        """
+        transform = Transform(
+            rotation=Quaternion.from_axis_angle(axis=self.z, angle=45.0),
+            translation=CartesianCoordinate(x=1.0, y=2.0, z=3.0),
+        )
+
+        before = transform.inverse()
+
+        transform.translation["x"] = 5.0
+
+        after = transform.inverse()
+
+        self.assertNotEqual(before.translation, after.translation)
+
+        position = CartesianCoordinate(x=1.0, y=-2.0, z=0.5)
+
+        result = after.apply_to_position(transform.apply_to_position(position))
+
+        self.assertIsClose(result["x"], position["x"], places=12)
+        self.assertIsClose(result["y"], position["y"], places=12)
+        self.assertIsClose(result["z"], position["z"], places=12)
+
+    def test_memoised_values_are_not_dataclass_fields(self) -> None:
+        """
+        Test that the memoised rotation matrix is kept out of the dataclass fields.
+        """
+        transform = Transform(
+            rotation=Quaternion.from_axis_angle(axis=self.z, angle=45.0),
+            translation=CartesianCoordinate(x=1.0, y=2.0, z=3.0),
+        )
+
+        inverse = transform.inverse()
+
+        self.assertEqual(
+            [f.name for f in fields(Transform)], ["rotation", "translation"]
+        )
+
+        self.assertEqual(
+            asdict(transform),
+            {
+                "rotation": asdict(transform.rotation),
+                "translation": {"x": 1.0, "y": 2.0, "z": 3.0},
+            },
+        )
+
+        self.assertEqual(asdict(inverse)["rotation"], asdict(inverse.rotation))
+
+    def test_cache_transform_provider_reuses_transforms(self) -> None:
+        """
+        Test that a cached provider only computes each epoch's transform once.
+        """
+        calls = []
+
+        def provider(when: datetime) -> Transform:
+            calls.append(when)
+            return Transform(
+                rotation=Quaternion.identity(),
+                translation=CartesianCoordinate(x=0.0, y=0.0, z=0.0),
+            )
+
+        cached = cache_transform_provider(provider)
+
+        when = datetime(2025, 1, 1)
+
+        first = cached(when)
+
+        self.assertEqual(cached(when), first)
+        self.assertIs(cached(when).rotation_matrix, first.rotation_matrix)
+        cached(datetime(2025, 1, 2))
+        self.assertEqual(len(calls), 2)
+
+    def test_cache_transform_provider_isolates_translations(self) -> None:
+        """
+        Test that mutating a cached transform's translation does not affect later lookups.
+        """
+        cached = cache_transform_provider(
+            lambda when: Transform(
+                rotation=Quaternion.identity(),
+                translation=CartesianCoordinate(x=1.0, y=2.0, z=3.0),
+            )
+        )
+
+        when = datetime(2025, 1, 1)
+
+        first = cached(when)
+
+        first.translation["x"] = 5.0
+
+        self.assertEqual(
+            cached(when).translation, CartesianCoordinate(x=1.0, y=2.0, z=3.0)
+        )
 
 
 # **************************************************************************************
 
 
-class TestFrame(unittest.TestCase):
+class TestFrame(SatellesTestCase):
     def test_same_frame_identity(self) -> None:
         """Transform to the same frame should be identity."""
         time = datetime(2025, 1, 1)
@@ -7,6 +7,8 @@
 
 
 import unittest
+from dataclasses import asdict
+from typing import ClassVar
 
 from satelles import (
     HohmannTransferParameters,
@@ -16,6 +18,8 @@ from satelles import (
     get_hohmann_transfer_semi_major_axis,
 )
 
+from .utils import SatellesTestCase
+
 # **************************************************************************************
 
 # The approximate radii for LEO orbits (in meters):
@@ -29,7 +33,7 @@ GEO_RADIUS_IN_METERS = 35_786_000  # (approx. 35,786 km altitude)
 # **************************************************************************************
 
 
-class TestGetHohmannTransferSemiMajorAxis(unittest.TestCase):
+class TestGetHohmannTransferSemiMajorAxis(SatellesTestCase):
     def test_semi_major_axis_leo_to_geo(self) -> None:
         """
         Test semi-major axis calculation for a LEO to GEO transfer.
@@ -39,7 +43,7 @@ class TestGetHohmannTransferSemiMajorAxis(unittest.TestCase):
             r2=GEO_RADIUS_IN_METERS,
         )
 
-        self.assertAlmostEqual(
+        self.assertIsClose(
             a,
             (LEO_RADIUS_IN_METERS + GEO_RADIUS_IN_METERS) / 2,
             places=6,
@@ -54,7 +58,7 @@ class TestGetHohmannTransferSemiMajorAxis(unittest.TestCase):
             r2=LEO_RADIUS_IN_METERS,
         )
 
-        self.assertAlmostEqual(
+        self.assertIsClose(
             a,
             (GEO_RADIUS_IN_METERS + LEO_RADIUS_IN_METERS) / 2,
             places=6,
@@ -64,7 +68,7 @@ class TestGetHohmannTransferSemiMajorAxis(unittest.TestCase):
 # **************************************************************************************
 
 
-class TestGetHohmannTransferEccentricity(unittest.TestCase):
+class TestGetHohmannTransferEccentricity(SatellesTestCase):
     def test_eccentricity_leo_to_geo(self) -> None:
         """
         Test eccentricity calculation for a LEO to GEO transfer.
@@ -74,7 +78,7 @@ class TestGetHohmannTransferEccentricity(unittest.TestCase):
             r2=GEO_RADIUS_IN_METERS,
         )
 
-        self.assertAlmostEqual(e, 0.845305, places=6)
+        self.assertIsClose(e, 0.845305, places=6)
         self.assertTrue(0 < e < 1)
 
     def test_eccentricity_geo_to_leo(self) -> None:
@@ -86,7 +90,7 @@ class TestGetHohmannTransferEccentricity(unittest.TestCase):
             r2=LEO_RADIUS_IN_METERS,
         )
 
-        self.assertAlmostEqual(e, 0.845305, places=6)
+        self.assertIsClose(e, 0.845305, places=6)
         self.assertTrue(0 < e < 1)
 
     def test_eccentricity_circular_orbit(self) -> None:
@@ -113,11 +117,18 @@ class TestGetHohmannTransferEccentricity(unittest.TestCase):
         with self.assertRaises(ValueError):
             get_hohmann_transfer_eccentricity(r1=r1, r2=r2)
 
+    def test_zero_radii_raise_value_error(self) -> None:
+        """
+        Test that identical zero radii raise ValueError rather than returning zero.
+        """
+        with self.assertRaises(ValueError):
+            get_hohmann_transfer_eccentricity(r1=0, r2=0)
+
 
 # **************************************************************************************
 
 
-class TestGetHohmannTransferPhaseAngle(unittest.TestCase):
+class TestGetHohmannTransferPhaseAngle(SatellesTestCase):
     def test_phase_angle_ascent_leo_to_geo(self) -> None:
         """
         Test phase angle for a LEO to GEO transfer (ascent).
@@ -161,7 +172,7 @@ class TestGetHohmannTransferPhaseAngle(unittest.TestCase):
             r2=7_000_000,
         )
 
-        self.assertAlmostEqual(φ_ascent, -φ_descent, places=9)
+        self.assertIsClose(φ_ascent, -φ_descent, places=9)
 
     def test_phase_angle_small_transfer(self) -> None:
         """
@@ -243,223 +254,140 @@ class TestGetHohmannTransferPhaseAngle(unittest.TestCase):
 # **************************************************************************************
 
 
-class TestGetHohmannTransferParameters(unittest.TestCase):
+class TestGetHohmannTransferParameters(SatellesTestCase):
     """
     Tests for the get_hohmann_transfer_parameters function.
     """
 
-    def test_leo_to_geo_returns_correct_semi_major_axis(self) -> None:
-        """
-        Test that LEO to GEO transfer returns correct semi-major axis.
-        """
-        result = get_hohmann_transfer_parameters(
+    ascent: ClassVar[HohmannTransferParameters]
+
+    descent: ClassVar[HohmannTransferParameters]
+
+    two_to_one: ClassVar[HohmannTransferParameters]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # The parameters are immutable, so each transfer is computed once and shared:
+        cls.ascent = get_hohmann_transfer_parameters(
             r1=LEO_RADIUS_IN_METERS,
             r2=GEO_RADIUS_IN_METERS,
         )
 
-        self.assertEqual(result.a, 19_393_000)
+        cls.descent = get_hohmann_transfer_parameters(
+            r1=GEO_RADIUS_IN_METERS,
+            r2=LEO_RADIUS_IN_METERS,
+        )
+
+        cls.two_to_one = get_hohmann_transfer_parameters(
+            r1=10_000_000,
+            r2=20_000_000,
+        )
+
+    def test_leo_to_geo_returns_correct_semi_major_axis(self) -> None:
+        """
+        Test that LEO to GEO transfer returns correct semi-major axis.
+        """
+        self.assertEqual(self.ascent.a, 19_393_000)
 
     def test_leo_to_geo_returns_correct_eccentricity(self) -> None:
         """
         Test that LEO to GEO transfer returns correct eccentricity.
         """
-        result = get_hohmann_transfer_parameters(
-            r1=LEO_RADIUS_IN_METERS,
-            r2=GEO_RADIUS_IN_METERS,
-        )
-
-        self.assertAlmostEqual(result.e, 0.8453, delta=0.0001)
+        self.assertAlmostEqual(self.ascent.e, 0.8453, delta=0.0001)
 
     def test_leo_to_geo_returns_correct_delta_v1(self) -> None:
         """
         Test that LEO to GEO transfer returns correct Δv1 (departure burn).
         """
-        result = get_hohmann_transfer_parameters(
-            r1=LEO_RADIUS_IN_METERS,
-            r2=GEO_RADIUS_IN_METERS,
-        )
-
-        self.assertAlmostEqual(result.Δv1, -4131.43, delta=1.0)
+        self.assertAlmostEqual(self.ascent.Δv1, -4131.43, delta=1.0)
 
     def test_leo_to_geo_returns_correct_delta_v2(self) -> None:
         """
         Test that LEO to GEO transfer returns correct Δv2 (arrival burn).
         """
-        result = get_hohmann_transfer_parameters(
-            r1=LEO_RADIUS_IN_METERS,
-            r2=GEO_RADIUS_IN_METERS,
-        )
-
-        self.assertAlmostEqual(result.Δv2, 2024.77, delta=1.0)
+        self.assertAlmostEqual(self.ascent.Δv2, 2024.77, delta=1.0)
 
     def test_leo_to_geo_returns_correct_total_delta_v(self) -> None:
         """
         Test that LEO to GEO transfer returns correct total Δv.
         """
-        result = get_hohmann_transfer_parameters(
-            r1=LEO_RADIUS_IN_METERS,
-            r2=GEO_RADIUS_IN_METERS,
-        )
-
-        self.assertAlmostEqual(result.Δv, 6156.2077, delta=1.0)
+        self.assertAlmostEqual(self.ascent.Δv, 6156.2077, delta=1.0)
 
     def test_leo_to_geo_returns_correct_transfer_time(self) -> None:
         """
         Test that LEO to GEO transfer returns correct transfer time.
         """
-        result = get_hohmann_transfer_parameters(
-            r1=LEO_RADIUS_IN_METERS,
-            r2=GEO_RADIUS_IN_METERS,
-        )
-
-        self.assertAlmostEqual(result.T, 13438.4289, delta=1.0)
+        self.assertAlmostEqual(self.ascent.T, 13438.4289, delta=1.0)
 
     def test_leo_to_geo_returns_correct_phase_angle(self) -> None:
         """
         Test that LEO to GEO transfer returns correct phase angle.
         """
-        result = get_hohmann_transfer_parameters(
-            r1=LEO_RADIUS_IN_METERS,
-            r2=GEO_RADIUS_IN_METERS,
-        )
-
-        self.assertAlmostEqual(result.φ, 108.19, delta=0.1)
+        self.assertAlmostEqual(self.ascent.φ, 108.19, delta=0.1)
 
     def test_geo_to_leo_returns_correct_semi_major_axis(self) -> None:
         """
         Test that GEO to LEO transfer returns same semi-major axis as ascent.
         """
-        result = get_hohmann_transfer_parameters(
-            r1=GEO_RADIUS_IN_METERS,
-            r2=LEO_RADIUS_IN_METERS,
-        )
-
-        self.assertEqual(result.a, 19_393_000)
+        self.assertEqual(self.descent.a, 19_393_000)
 
     def test_geo_to_leo_returns_correct_eccentricity(self) -> None:
         """
         Test that GEO to LEO transfer returns same eccentricity as ascent.
         """
-        result = get_hohmann_transfer_parameters(
-            r1=GEO_RADIUS_IN_METERS,
-            r2=LEO_RADIUS_IN_METERS,
-        )
-
-        self.assertAlmostEqual(result.e, 0.8453, delta=0.0001)
+        self.assertAlmostEqual(self.descent.e, 0.8453, delta=0.0001)
 
     def test_geo_to_leo_returns_correct_total_delta_v(self) -> None:
         """
         Test that GEO to LEO transfer returns same total Δv as ascent.
         """
-        result = get_hohmann_transfer_parameters(
-            r1=GEO_RADIUS_IN_METERS,
-            r2=LEO_RADIUS_IN_METERS,
-        )
-
-        self.assertAlmostEqual(result.Δv, 6156.2077, delta=1.0)
+        self.assertAlmostEqual(self.descent.Δv, 6156.2077, delta=1.0)
 
     def test_geo_to_leo_returns_correct_transfer_time(self) -> None:
         """
         Test that GEO to LEO transfer returns same transfer time as ascent.
         """
-        result = get_hohmann_transfer_parameters(
-            r1=GEO_RADIUS_IN_METERS,
-            r2=LEO_RADIUS_IN_METERS,
-        )
-
-        self.assertAlmostEqual(result.T, 13438.4289, delta=1.0)
+        self.assertAlmostEqual(self.descent.T, 13438.4289, delta=1.0)
 
     def test_geo_to_leo_returns_negative_phase_angle(self) -> None:
         """
         Test that GEO to LEO transfer returns negative phase angle.
         """
-        result = get_hohmann_transfer_parameters(
-            r1=GEO_RADIUS_IN_METERS,
-            r2=LEO_RADIUS_IN_METERS,
-        )
-
-        self.assertAlmostEqual(result.φ, -108.19, delta=0.1)
+        self.assertAlmostEqual(self.descent.φ, -108.19, delta=0.1)
 
     def test_2_to_1_ratio_returns_correct_semi_major_axis(self) -> None:
         """
         Test semi-major axis for a 2:1 orbital radius ratio.
         """
-        result = get_hohmann_transfer_parameters(
-            r1=10_000_000,
-            r2=20_000_000,
-        )
-
-        self.assertEqual(result.a, 15_000_000)
+        self.assertEqual(self.two_to_one.a, 15_000_000)
 
     def test_2_to_1_ratio_returns_correct_eccentricity(self) -> None:
         """
         Test eccentricity for a 2:1 orbital radius ratio.
         """
-        result = get_hohmann_transfer_parameters(
-            r1=10_000_000,
-            r2=20_000_000,
-        )
-
-        self.assertAlmostEqual(result.e, 0.3333, delta=0.0001)
+        self.assertAlmostEqual(self.two_to_one.e, 0.3333, delta=0.0001)
 
     def test_2_to_1_ratio_returns_correct_phase_angle(self) -> None:
         """
         Test phase angle for a 2:1 orbital radius ratio.
         """
-        result = get_hohmann_transfer_parameters(
-            r1=10_000_000,
-            r2=20_000_000,
-        )
-
-        self.assertAlmostEqual(result.φ, 63.1, delta=0.5)
-
-    def test_raises_error_for_zero_r1(self) -> None:
-        """
-        Test that function raises ValueError for zero initial radius.
-        """
-        with self.assertRaises(ValueError) as context:
-            get_hohmann_transfer_parameters(
-                r1=0,
-                r2=10_000_000,
-            )
-
-        self.assertIn("r1 must be positive", str(context.exception))
-
-    def test_raises_error_for_negative_r1(self) -> None:
-        """
-        Test that function raises ValueError for negative initial radius.
-        """
-        with self.assertRaises(ValueError) as context:
-            get_hohmann_transfer_parameters(
-                r1=-5_000_000,
-                r2=10_000_000,
-            )
-
-        self.assertIn("r1 must be positive", str(context.exception))
-
-    def test_raises_error_for_zero_r2(self) -> None:
-        """
-        Test that function raises ValueError for zero final radius.
-        """
-        with self.assertRaises(ValueError) as context:
-            get_hohmann_transfer_parameters(
-                r1=10_000_000,
-                r2=0,
-            )
-
-        self.assertIn("r2 must be positive", str(context.exception))
+        self.assertAlmostEqual(self.two_to_one.φ, 63.1, delta=0.5)
 
-    def test_raises_error_for_negative_r2(self) -> None:
+    def test_raises_error_for_non_positive_radii(self) -> None:
         """
-        Test that function raises ValueError for negative final radius.
+        Test that function raises ValueError for zero or negative radii.
         """
-        with self.assertRaises(ValueError) as context:
-            get_hohmann_transfer_parameters(
-                r1=10_000_000,
-                r2=-5_000_000,
-            )
+        for r1, r2, message in [
+            (0, 10_000_000, "r1 must be positive"),
+            (-5_000_000, 10_000_000, "r1 must be positive"),
+            (10_000_000, 0, "r2 must be positive"),
+            (10_000_000, -5_000_000, "r2 must be positive"),
+        ]:
+            with self.subTest(r1=r1, r2=r2):
+                with self.assertRaises(ValueError) as context:
+                    get_hohmann_transfer_parameters(r1=r1, r2=r2)
 
-        self.assertIn("r2 must be positive", str(context.exception))
+                self.assertIn(message, str(context.exception))
 
     def test_raises_error_for_equal_radii(self) -> None:
         """
@@ -477,150 +405,70 @@ class TestGetHohmannTransferParameters(unittest.TestCase):
         """
         Test that function returns a HohmannTransferParameters instance.
         """
-        result = get_hohmann_transfer_parameters(
-            r1=LEO_RADIUS_IN_METERS,
-            r2=GEO_RADIUS_IN_METERS,
-        )
-
-        self.assertIsInstance(result, HohmannTransferParameters)
+        self.assertIsInstance(self.ascent, HohmannTransferParameters)
 
     def test_result_contains_input_radii(self) -> None:
         """
         Test that result contains the input radii.
         """
-        result = get_hohmann_transfer_parameters(
-            r1=LEO_RADIUS_IN_METERS,
-            r2=GEO_RADIUS_IN_METERS,
-        )
-
-        self.assertEqual(result.r1, LEO_RADIUS_IN_METERS)
-        self.assertEqual(result.r2, GEO_RADIUS_IN_METERS)
+        self.assertEqual(self.ascent.r1, LEO_RADIUS_IN_METERS)
+        self.assertEqual(self.ascent.r2, GEO_RADIUS_IN_METERS)
 
     def test_semi_major_axis_symmetric(self) -> None:
         """
         Test that semi-major axis is the same for ascent and descent.
         """
-        ascent = get_hohmann_transfer_parameters(
-            r1=LEO_RADIUS_IN_METERS,
-            r2=GEO_RADIUS_IN_METERS,
-        )
-
-        descent = get_hohmann_transfer_parameters(
-            r1=GEO_RADIUS_IN_METERS,
-            r2=LEO_RADIUS_IN_METERS,
-        )
-
-        self.assertEqual(ascent.a, descent.a)
+        self.assertEqual(self.ascent.a, self.descent.a)
 
     def test_eccentricity_symmetric(self) -> None:
         """
         Test that eccentricity is the same for ascent and descent.
         """
-        ascent = get_hohmann_transfer_parameters(
-            r1=LEO_RADIUS_IN_METERS,
-            r2=GEO_RADIUS_IN_METERS,
-        )
-
-        descent = get_hohmann_transfer_parameters(
-            r1=GEO_RADIUS_IN_METERS,
-            r2=LEO_RADIUS_IN_METERS,
-        )
-
-        self.assertEqual(ascent.e, descent.e)
+        self.assertEqual(self.ascent.e, self.descent.e)
 
     def test_total_delta_v_symmetric(self) -> None:
         """
         Test that total Δv is the same for ascent and descent.
         """
-        ascent = get_hohmann_transfer_parameters(
-            r1=LEO_RADIUS_IN_METERS,
-            r2=GEO_RADIUS_IN_METERS,
-        )
-
-        descent = get_hohmann_transfer_parameters(
-            r1=GEO_RADIUS_IN_METERS,
-            r2=LEO_RADIUS_IN_METERS,
-        )
-
-        self.assertAlmostEqual(ascent.Δv, descent.Δv, places=6)
+        self.assertIsClose(self.ascent.Δv, self.descent.Δv, places=6)
 
     def test_transfer_time_symmetric(self) -> None:
         """
         Test that transfer time is the same for ascent and descent.
         """
-        ascent = get_hohmann_transfer_parameters(
-            r1=LEO_RADIUS_IN_METERS,
-            r2=GEO_RADIUS_IN_METERS,
-        )
-
-        descent = get_hohmann_transfer_parameters(
-            r1=GEO_RADIUS_IN_METERS,
-            r2=LEO_RADIUS_IN_METERS,
-        )
-
-        self.assertEqual(ascent.T, descent.T)
+        self.assertEqual(self.ascent.T, self.descent.T)
 
     def test_phase_angle_antisymmetric(self) -> None:
         """
         Test that phase angle has opposite sign for ascent and descent.
         """
-        ascent = get_hohmann_transfer_parameters(
-            r1=LEO_RADIUS_IN_METERS,
-            r2=GEO_RADIUS_IN_METERS,
-        )
-
-        descent = get_hohmann_transfer_parameters(
-            r1=GEO_RADIUS_IN_METERS,
-            r2=LEO_RADIUS_IN_METERS,
-        )
-
-        self.assertAlmostEqual(ascent.φ, -descent.φ, places=9)
+        self.assertIsClose(self.ascent.φ, -self.descent.φ, places=9)
 
     def test_total_delta_v_is_positive(self) -> None:
         """
         Test that total Δv is always positive.
         """
-        result = get_hohmann_transfer_parameters(
-            r1=LEO_RADIUS_IN_METERS,
-            r2=GEO_RADIUS_IN_METERS,
-        )
-
-        self.assertGreater(result.Δv, 0)
+        self.assertGreater(self.ascent.Δv, 0)
 
     def test_transfer_time_is_positive(self) -> None:
         """
         Test that transfer time is always positive.
         """
-        result = get_hohmann_transfer_parameters(
-            r1=LEO_RADIUS_IN_METERS,
-            r2=GEO_RADIUS_IN_METERS,
-        )
-
-        self.assertGreater(result.T, 0)
+        self.assertGreater(self.ascent.T, 0)
 
     def test_eccentricity_less_than_one(self) -> None:
         """
         Test that eccentricity is always less than 1 for valid transfers.
         """
-        result = get_hohmann_transfer_parameters(
-            r1=LEO_RADIUS_IN_METERS,
-            r2=GEO_RADIUS_IN_METERS,
-        )
-
-        self.assertLess(result.e, 1)
-        self.assertGreaterEqual(result.e, 0)
+        self.assertLess(self.ascent.e, 1)
+        self.assertGreaterEqual(self.ascent.e, 0)
 
     def test_semi_major_axis_between_radii(self) -> None:
         """
         Test that semi-major axis is between the two radii.
         """
-        result = get_hohmann_transfer_parameters(
-            r1=LEO_RADIUS_IN_METERS,
-            r2=GEO_RADIUS_IN_METERS,
-        )
-
         self.assertGreater(
-            result.a,
+            self.ascent.a,
             min(
                 LEO_RADIUS_IN_METERS,
                 GEO_RADIUS_IN_METERS,
@@ -628,7 +476,7 @@ class TestGetHohmannTransferParameters(unittest.TestCase):
         )
 
         self.assertLess(
-            result.a,
+            self.ascent.a,
             max(
                 LEO_RADIUS_IN_METERS,
                 GEO_RADIUS_IN_METERS,
@@ -639,13 +487,115 @@ class TestGetHohmannTransferParameters(unittest.TestCase):
         """
         Test that phase angle is within [-180, 180] degrees.
         """
+        self.assertGreaterEqual(self.ascent.φ, -180)
+        self.assertLessEqual(self.ascent.φ, 180)
+
+
+# **************************************************************************************
+
+
+class TestHohmannTransferParameters(SatellesTestCase):
+    def test_parameters_are_immutable(self) -> None:
+        """
+        Test that the transfer parameters cannot be modified after construction.
+        """
+        result = get_hohmann_transfer_parameters(
+            r1=LEO_RADIUS_IN_METERS,
+            r2=GEO_RADIUS_IN_METERS,
+        )
+
+        with self.assertRaises(AttributeError):
+            result.r1 = 1.0  # type: ignore[misc]
+
+    def test_out_of_range_parameters_raise_value_error(self) -> None:
+        """
+        Test that out of range parameters raise ValueError on construction.
+        """
+        valid = {
+            "r1": 7_000_000.0,
+            "r2": 42_164_000.0,
+            "a": 24_582_000.0,
+            "e": 0.7152,
+            "Δv1": 2_425.0,
+            "Δv2": 1_466.0,
+            "Δv": 3_891.0,
+            "T": 19_179.0,
+            "φ": 103.5,
+        }
+
+        HohmannTransferParameters(**valid)
+
+        for field, value in [
+            ("r1", 0.0),
+            ("r2", -1.0),
+            ("a", 0.0),
+            ("e", 1.0),
+            ("e", -0.1),
+            ("Δv", -1.0),
+            ("T", 0.0),
+            ("φ", 180.5),
+        ]:
+            with self.subTest(field=field, value=value):
+                with self.assertRaises(ValueError):
+                    HohmannTransferParameters(**{**valid, field: value})
+
+    def test_from_dict(self) -> None:
+        """
+        Test that the transfer parameters round trip through a mapping.
+        """
         result = get_hohmann_transfer_parameters(
             r1=LEO_RADIUS_IN_METERS,
             r2=GEO_RADIUS_IN_METERS,
         )
 
-        self.assertGreaterEqual(result.φ, -180)
-        self.assertLessEqual(result.φ, 180)
+        self.assertEqual(HohmannTransferParameters.from_dict(asdict(result)), result)
+
+    def test_from_dict_coerces_values_and_ignores_extra_keys(self) -> None:
+        """
+        Test that numeric strings are coerced and unknown keys are ignored.
+        """
+        data = {
+            "r1": "7000000",
+            "r2": 42_164_000,
+            "a": 24_582_000.0,
+            "e": "0.7152",
+            "Δv1": 2_425.0,
+            "Δv2": 1_466.0,
+            "Δv": 3_891.0,
+            "T": 19_179.0,
+            "φ": 103.5,
+            "name": "LEO to GEO",
+        }
+
+        result = HohmannTransferParameters.from_dict(data)
+
+        self.assertEqual(result.r1, 7_000_000.0)
+        self.assertIsInstance(result.r2, float)
+        self.assertEqual(result.e, 0.7152)
+
+    def test_from_dict_invalid_data_raises_value_error(self) -> None:
+        """
+        Test that missing, non-numeric or out of range values raise ValueError.
+        """
+        valid = asdict(
+            get_hohmann_transfer_parameters(
+                r1=LEO_RADIUS_IN_METERS,
+                r2=GEO_RADIUS_IN_METERS,
+            )
+        )
+
+        missing = {key: value for key, value in valid.items() if key != "T"}
+
+        for data in [
+            missing,
+            {**valid, "a": "wide"},
+            {**valid, "a": None},
+            {**valid, "e": 1.5},
+            {**valid, "T": -1.0},
+        ]:
+            with self.subTest(data=data):
+                with self.assertRaises(ValueError):
+                    HohmannTransferParameters.from_dict(data)
 
 
 # **************************************************************************************
@@ -109,6 +109,10 @@ class TestBarycentricLagrange3DPositionInterpolator(unittest.TestCase):
         interpolator = BarycentricLagrange3DPositionInterpolator(positions)
 
         position = interpolator.get_interpolated_position(5.0)
+
+        # The two point stencil is interpolated directly, without barycentric weights:
+        self.assertEqual(interpolator._local_weights, {})
+
         self.assertEqual(position.at, 5.0)
         self.assertAlmostEqual(position.x, 5.0, places=9)
         self.assertAlmostEqual(position.y, 10.0, places=9)
@@ -308,6 +312,27 @@ class TestBarycentricLagrange3DPositionInterpolator(unittest.TestCase):
                 analytic.vz, (p_plus.z - p_minus.z) / (2 * h), places=3
             )
 
+    def test_local_weights_are_reused_for_the_same_stencil(self) -> None:
+        """
+        Queries resolving to the same stencil should share its barycentric weights.
+        """
+        interpolator = BarycentricLagrange3DPositionInterpolator(
+            self.positions, stencil_size=4
+        )
+
+        stencil = interpolator._get_local_stencil(150.0)
+
+        self.assertEqual(stencil, interpolator._get_local_stencil(170.0))
+
+        weights = interpolator._compute_local_weights(stencil)
+
+        self.assertIs(interpolator._compute_local_weights(stencil), weights)
+
+        position = interpolator.get_interpolated_position(170.0)
+
+        self.assertGreater(position.x, self.positions[2].x)
+        self.assertLess(position.x, self.positions[3].x)
+
 
 # **************************************************************************************
 
@@ -668,6 +693,80 @@ class TestHermite3DPositionInterpolator(unittest.TestCase):
         with self.assertRaises(ValueError):
             interpolator.get_interpolated_velocity(600.0)
 
+    def test_get_interpolated_positions_matches_scalar_queries(self) -> None:
+        """
+        The batch API returns the same positions as querying each time in turn.
+        """
+        interpolator = Hermite3DPositionInterpolator(self.positions)
+
+        ats = [0.0, 30.0, 150.0, 420.0, 540.0]
+
+        positions = interpolator.get_interpolated_positions(ats)
+
+        self.assertEqual(len(positions), len(ats))
+
+        for at, position in zip(ats, positions):
+            expected = interpolator.get_interpolated_position(at)
+            self.assertEqual(position, expected)
+
+    def test_get_interpolated_velocities_matches_scalar_queries(self) -> None:
+        """
+        The batch API returns the same velocities as querying each time in turn.
+        """
+        interpolator = Hermite3DPositionInterpolator(self.positions)
+
+        ats = [float(at) for at in range(0, 541, 15)]
+
+        velocities = interpolator.get_interpolated_velocities(ats)
+
+        self.assertEqual(len(velocities), len(ats))
+
+        for at, velocity in zip(ats, velocities):
+            expected = interpolator.get_interpolated_velocity(at)
+            self.assertEqual(velocity, expected)
+
+    def test_repeated_query_returns_cached_result(self) -> None:
+        """
+        Repeating the last query returns the cached result without recomputing it.
+        """
+        interpolator = Hermite3DPositionInterpolator(self.positions)
+
+        position = interpolator.get_interpolated_position(150.0)
+        self.assertIs(interpolator.get_interpolated_position(150.0), position)
+
+        velocity = interpolator.get_interpolated_velocity(150.0)
+        self.assertIs(interpolator.get_interpolated_velocity(150.0), velocity)
+
+        # A different query time is recomputed:
+        other = interpolator.get_interpolated_position(210.0)
+        self.assertEqual(other.at, 210.0)
+        self.assertIsNot(other, position)
+
+    def test_interval_is_reused_across_queries(self) -> None:
+        """
+        The last bracketed interval is reused, and jumps in time fall back to bisection.
+        """
+        interpolator = Hermite3DPositionInterpolator(self.positions)
+
+        for at, expected in (
+            (130.0, 2),
+            (170.0, 2),
+            (180.0, 2),
+            (200.0, 3),
+            (30.0, 0),
+            (420.0, 6),
+        ):
+            self.assertEqual(interpolator._get_interval(at), expected)
+            self.assertEqual(interpolator._last_i, expected)
+
+        # Out of order queries match those of a fresh interpolator:
+        fresh = Hermite3DPositionInterpolator(self.positions)
+
+        self.assertEqual(
+            interpolator.get_interpolated_position(150.0),
+            fresh.get_interpolated_position(150.0),
+        )
+
 
 # **************************************************************************************
 
@@ -1160,6 +1259,32 @@ class TestHermite3DKinematicInterpolator(unittest.TestCase):
         with self.assertRaises(ValueError):
             interpolator.get_interpolated_velocity(1140.0)
 
+    def test_repeated_sample_time_resolves_to_first_sample(self) -> None:
+        """
+        A query at a repeated sample time returns the first sample at that time.
+        """
+        positions = [
+            Position(x=0.0, y=0.0, z=0.0, at=0.0),
+            Position(x=1.0, y=2.0, z=3.0, at=60.0),
+            Position(x=4.0, y=5.0, z=6.0, at=60.0),
+            Position(x=7.0, y=8.0, z=9.0, at=120.0),
+        ]
+
+        velocities = [
+            Velocity(vx=0.0, vy=0.0, vz=0.0, at=0.0),
+            Velocity(vx=1.0, vy=1.0, vz=1.0, at=60.0),
+            Velocity(vx=2.0, vy=2.0, vz=2.0, at=60.0),
+            Velocity(vx=3.0, vy=3.0, vz=3.0, at=120.0),
+        ]
+
+        interpolator = Hermite3DKinematicInterpolator(positions, velocities)
+
+        position = interpolator.get_interpolated_position(60.0)
+        self.assertEqual((position.x, position.y, position.z), (1.0, 2.0, 3.0))
+
+        velocity = interpolator.get_interpolated_velocity(60.0)
+        self.assertEqual((velocity.vx, velocity.vy, velocity.vz), (1.0, 1.0, 1.0))
+
 
 # **************************************************************************************
 
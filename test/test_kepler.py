@@ -11,10 +11,12 @@ from math import atan2, cos, degrees, pi, radians, sin, sqrt
 from satelles import (
     EARTH_MASS,
     GRAVITATIONAL_CONSTANT,
+    get_eccentric_anomalies,
     get_eccentric_anomaly,
     get_semi_latus_rectum,
     get_semi_major_axis,
     get_true_anomaly,
+    get_true_anomaly_from_eccentric_anomaly,
 )
 
 # **************************************************************************************
@@ -63,6 +65,19 @@ class TestSemiMajorAxis(unittest.TestCase):
 
         self.assertAlmostEqual(result, expected, places=5)
 
+    def test_repeated_calls_are_consistent(self):
+        """
+        Test that repeated (cached) calls return the same semi-major axis, and that a
+        mass of None shares the result for a mass of 0.0.
+        """
+        mean_motion = 15.48908877  # in revolutions per day
+
+        first = get_semi_major_axis(mean_motion, 0.0)
+
+        self.assertEqual(get_semi_major_axis(mean_motion, 0.0), first)
+        self.assertEqual(get_semi_major_axis(mean_motion, None), first)
+        self.assertEqual(get_semi_major_axis(mean_motion), first)
+
 
 # **************************************************************************************
 
@@ -165,6 +180,126 @@ class TestEccentricAnomaly(unittest.TestCase):
         residual = E - e * sin(E) - M
         self.assertAlmostEqual(residual, 0.0, places=8)
 
+    def test_newton_converges_at_machine_precision(self):
+        """
+        Check that the Newton-Raphson solver terminates at machine precision when the
+        tolerance cannot be reached, e.g., for a zero tolerance.
+        """
+        for e in [0.0, 0.1, 0.5, 0.9, 0.9999]:
+            for M in [-3600.0, -1.0, 0.0, 1e-6, 45.0, 180.0, 36000.5]:
+                with self.subTest(eccentricity=e, mean_anomaly=M):
+                    E = get_eccentric_anomaly(M, e, tolerance=0.0, solver="newton")
+                    self.assertAlmostEqual(E, get_eccentric_anomaly(M, e), places=8)
+
+
+# **************************************************************************************
+
+
+class TestEccentricAnomalyMarkley(unittest.TestCase):
+    def test_matches_newton_solver(self):
+        """
+        Check that the default Markley solver agrees with the Newton-Raphson solver.
+        """
+        for e in [0.0, 0.001, 0.1, 0.5, 0.9, 0.99]:
+            for M in [-400.0, -180.0, -1.0, 0.0, 1e-6, 45.0, 179.9, 180.0, 720.5]:
+                with self.subTest(eccentricity=e, mean_anomaly=M):
+                    self.assertAlmostEqual(
+                        get_eccentric_anomaly(M, e),
+                        get_eccentric_anomaly(M, e, tolerance=1e-14, solver="newton"),
+                        places=9,
+                    )
+
+    def test_convergence_residual_high_eccentricity(self):
+        """
+        Check that the Markley solver satisfies Kepler's Equation to near machine
+        precision, even for highly eccentric orbits.
+        """
+        e = 0.999
+        for M in [1e-4, 0.01, 0.5, pi / 2, pi - 1e-4]:
+            with self.subTest(mean_anomaly=M):
+                E = radians(get_eccentric_anomaly(degrees(M), e))
+                residual = E - e * sin(E) - M
+                self.assertAlmostEqual(residual, 0.0, places=12)
+
+    def test_invalid_eccentricity(self):
+        """
+        Check that a ValueError is raised for an eccentricity outside [0, 1).
+        """
+        for e in [-0.1, 1.0, 1.5]:
+            with self.subTest(eccentricity=e):
+                with self.assertRaises(ValueError):
+                    get_eccentric_anomaly(30.0, e)
+
+                with self.assertRaises(ValueError):
+                    get_eccentric_anomaly(30.0, e, solver="newton")
+
+                with self.assertRaises(ValueError):
+                    get_eccentric_anomalies([30.0, 60.0], e)
+
+    def test_invalid_solver(self):
+        """
+        Check that a ValueError is raised for an unknown solver.
+        """
+        with self.assertRaises(ValueError):
+            get_eccentric_anomaly(30.0, 0.1, solver="halley")  # type: ignore[arg-type]
+
+
+# **************************************************************************************
+
+
+class TestEccentricAnomalies(unittest.TestCase):
+    def test_matches_scalar_solver(self):
+        """
+        Check that the ensemble solver agrees with the scalar solver for each mean
+        anomaly, including unordered and wrapped inputs.
+        """
+        mean_anomalies = [0.0, 10.0, 45.0, 90.0, 180.0, 359.0, 725.0, -30.0, 5.0]
+
+        for e in [0.0, 0.1, 0.5, 0.9]:
+            with self.subTest(eccentricity=e):
+                anomalies = get_eccentric_anomalies(mean_anomalies, e)
+
+                self.assertEqual(len(anomalies), len(mean_anomalies))
+
+                for M, E in zip(mean_anomalies, anomalies):
+                    self.assertAlmostEqual(E, get_eccentric_anomaly(M, e), places=6)
+
+    def test_convergence_residual(self):
+        """
+        Check that every computed eccentric anomaly satisfies Kepler's Equation
+        within the convergence tolerance.
+        """
+        e = 0.7
+        mean_anomalies = [degrees(i * 2 * pi / 360) for i in range(361)]
+        for M, E in zip(mean_anomalies, get_eccentric_anomalies(mean_anomalies, e)):
+            with self.subTest(mean_anomaly=M):
+                residual = radians(E) - e * sin(radians(E)) - radians(M)
+                self.assertAlmostEqual(residual, 0.0, places=8)
+
+    def test_newton_solver_matches_markley_solver(self):
+        """
+        Check that the warm-started Newton-Raphson ensemble solver agrees with the
+        default Markley ensemble solver.
+        """
+        mean_anomalies = [0.0, 10.0, 45.0, 90.0, 180.0, 359.0, 725.0, -30.0, 5.0]
+
+        for e in [0.0, 0.1, 0.5, 0.9]:
+            with self.subTest(eccentricity=e):
+                for E, expected in zip(
+                    get_eccentric_anomalies(mean_anomalies, e, solver="newton"),
+                    get_eccentric_anomalies(mean_anomalies, e),
+                ):
+                    self.assertAlmostEqual(E, expected, places=6)
+
+        with self.assertRaises(ValueError):
+            get_eccentric_anomalies(mean_anomalies, 0.1, solver="halley")  # type: ignore[arg-type]
+
+    def test_empty(self):
+        """
+        Check that an empty ensemble returns an empty list.
+        """
+        self.assertEqual(get_eccentric_anomalies([], 0.5), [])
+
 
 # **************************************************************************************
 
@@ -218,6 +353,28 @@ class TestTrueAnomaly(unittest.TestCase):
         with self.assertRaises(ValueError):
             get_true_anomaly(1.0, 1.0)  # e = 1.0 is not allowed for elliptical orbits
 
+    def test_solver_is_passed_through(self):
+        """
+        Check that the solver and tolerance are passed through to Kepler's Equation.
+        """
+        for solver in ("markley", "newton"):
+            with self.subTest(solver=solver):
+                E = get_eccentric_anomaly(30.0, 0.5, tolerance=1e-1, solver=solver)
+
+                self.assertEqual(
+                    get_true_anomaly(30.0, 0.5, tolerance=1e-1, solver=solver),
+                    get_true_anomaly_from_eccentric_anomaly(E, 0.5),
+                )
+
+        # A loose tolerance for the Newton-Raphson solver must be honoured:
+        self.assertNotEqual(
+            get_true_anomaly(30.0, 0.5, tolerance=1e-1, solver="newton"),
+            get_true_anomaly(30.0, 0.5, tolerance=1e-14, solver="newton"),
+        )
+
+        with self.assertRaises(ValueError):
+            get_true_anomaly(30.0, 0.5, solver="halley")  # type: ignore[arg-type]
+
     def test_known_value(self):
         """
         Test a known value: Compute the expected true anomaly using the same formulas
@@ -239,6 +396,31 @@ class TestTrueAnomaly(unittest.TestCase):
         self.assertAlmostEqual(ν, degrees(expected), places=8)
 
 
+# **************************************************************************************
+
+
+class TestTrueAnomalyFromEccentricAnomaly(unittest.TestCase):
+    def test_matches_true_anomaly_from_mean_anomaly(self):
+        """
+        Check that converting a solved eccentric anomaly matches get_true_anomaly.
+        """
+        for e in [0.0, 0.1, 0.5, 0.9]:
+            for M in [0.0, 30.0, 180.0, 300.0]:
+                with self.subTest(eccentricity=e, mean_anomaly=M):
+                    E = get_eccentric_anomaly(M, e)
+                    self.assertEqual(
+                        get_true_anomaly_from_eccentric_anomaly(E, e),
+                        get_true_anomaly(M, e),
+                    )
+
+    def test_invalid_eccentricity(self):
+        """
+        Check that a ValueError is raised for an eccentricity outside [0, 1).
+        """
+        with self.assertRaises(ValueError):
+            get_true_anomaly_from_eccentric_anomaly(1.0, 1.0)
+
+
 # **************************************************************************************
 
 if __name__ == "__main__":
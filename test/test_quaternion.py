@@ -35,6 +35,13 @@ class TestQuaternionCore(unittest.TestCase):
         self.assertAlmostEqual(r["y"], v["y"], places=6)
         self.assertAlmostEqual(r["z"], v["z"], places=6)
 
+    def test_identity_is_shared(self) -> None:
+        """
+        The identity quaternion is immutable, so repeated calls return the same object.
+        """
+        self.assertIs(Quaternion.identity(), Quaternion.identity())
+        self.assertEqual(Quaternion.identity(), Quaternion(1.0, 0.0, 0.0, 0.0))
+
     def test_normalise_zero_raises(self):
         """
         Normalising a zero quaternion raises ValueError.
@@ -215,6 +222,50 @@ class TestQuaternionFromRotationMatrix(unittest.TestCase):
 # **************************************************************************************
 
 
+class TestQuaternionToRotationMatrix(unittest.TestCase):
+    def test_to_rotation_matrix_identity(self) -> None:
+        """
+        Identity quaternion produces the identity matrix.
+        """
+        self.assertEqual(
+            Quaternion.identity().to_rotation_matrix(),
+            (
+                (1.0, 0.0, 0.0),
+                (0.0, 1.0, 0.0),
+                (0.0, 0.0, 1.0),
+            ),
+        )
+
+    def test_to_rotation_matrix_round_trip(self) -> None:
+        """
+        Converting to a rotation matrix and back recovers the same rotation.
+        """
+        q = Quaternion(w=0.3, x=-0.4, y=0.5, z=0.7)
+        r = Quaternion.from_rotation_matrix(q.to_rotation_matrix())
+        n = q.normalise()
+        sign = 1.0 if r.w * n.w >= 0 else -1.0
+        self.assertAlmostEqual(r.w, sign * n.w, places=12)
+        self.assertAlmostEqual(r.x, sign * n.x, places=12)
+        self.assertAlmostEqual(r.y, sign * n.y, places=12)
+        self.assertAlmostEqual(r.z, sign * n.z, places=12)
+
+    def test_to_rotation_matrix_matches_sandwich_product(self) -> None:
+        """
+        The matrix form applies the same rotation as q * v * q̄.
+        """
+        q = Quaternion(w=0.9, x=0.1, y=-0.3, z=0.2)
+        v = CartesianCoordinate(x=1.0, y=-2.0, z=3.0)
+        n = q.normalise()
+        expected = n @ Quaternion(0.0, v["x"], v["y"], v["z"]) @ n.conjugate()
+        r = q.rotate_vector(v)
+        self.assertAlmostEqual(r["x"], expected.x, places=12)
+        self.assertAlmostEqual(r["y"], expected.y, places=12)
+        self.assertAlmostEqual(r["z"], expected.z, places=12)
+
+
+# **************************************************************************************
+
+
 class TestQuaternionFromEulerAngles(unittest.TestCase):
     def test_zero_angles_is_identity(self) -> None:
         """
@@ -13,9 +13,18 @@ from typing import Dict, Optional, Tuple
 
 from satelles import TLE
 from satelles.tle import (
+    line1_columns,
     line1_regex,
+    line1_separators,
+    line2_columns,
     line2_regex,
+    line2_separators,
+    parse_epoch_field,
+    parse_id_field,
     parse_tle,
+    parse_tle_lines,
+    parse_tles,
+    slice_tle_line,
 )
 
 # **************************************************************************************
@@ -72,29 +81,58 @@ starlink5833: str = """
 # **************************************************************************************
 
 
-class TestTLERegex(unittest.TestCase):
-    def extract_lines(self, tle: str) -> Tuple[str, str]:
-        """
-        Extracts and returns the TLE line1 and line2 from a multi-line string.
-        """
-        lines = [line.strip() for line in tle.splitlines() if line.strip()]
-        # TLE lines start with "1" or "2"
-        tle_lines = [
-            line for line in lines if line.startswith("1") or line.startswith("2")
-        ]
+def extract_lines(tle: str) -> Tuple[str, str]:
+    """
+    Extracts and returns the TLE line1 and line2 from a multi-line string.
+    """
+    lines = [line.strip() for line in tle.splitlines() if line.strip()]
+    # TLE lines start with "1" or "2"
+    tle_lines = [line for line in lines if line.startswith("1") or line.startswith("2")]
+
+    if len(tle_lines) < 2:
+        raise ValueError("Not enough TLE lines found")
+
+    return tle_lines[0], tle_lines[1]
+
+
+# **************************************************************************************
+
 
-        if len(tle_lines) < 2:
-            raise ValueError("Not enough TLE lines found")
+# The expected line 1 fields shared by the ISS TLE fixtures:
+ISS_LINE1: Dict[str, str] = {
+    "id": "25544",
+    "classification": "U",
+    "designator": "98067A",
+    "year": "20",
+    "day": "062.59097222",
+    "first_derivative_of_mean_motion": ".00016717",
+    "second_derivative_of_mean_motion": "00000-0",
+    "drag": "10270-3",
+    "ephemeris": "0",
+    "set": "9006",
+}
+
+# The expected line 2 fields shared by the ISS TLE fixtures:
+ISS_LINE2: Dict[str, str] = {
+    "id": "25544",
+    "inclination": "51.6442",
+    "raan": "147.1064",
+    "eccentricity": "0004607",
+    "argument_of_perigee": "95.6506",
+    "mean_anomaly": "329.8285",
+    "mean_motion": "15.49249062",
+    "number_of_revolutions": "2423",
+}
+
+# **************************************************************************************
 
-        return tle_lines[0], tle_lines[1]
 
+class TestTLERegex(unittest.TestCase):
     def check_line1(self, line: str, expected: Dict[str, str]) -> None:
         match: Optional[re.Match] = line1_regex.match(line)
 
-        self.assertIsNotNone(match, "Line1 regex did not match")
-
-        if not match or match is None:
-            self.fail()
+        if match is None:
+            self.fail("Line1 regex did not match")
 
         groups: Dict[str, str] = match.groupdict()
 
@@ -108,10 +146,8 @@ class TestTLERegex(unittest.TestCase):
     def check_line2(self, line: str, expected: Dict[str, str]) -> None:
         match: Optional[re.Match] = line2_regex.match(line)
 
-        self.assertIsNotNone(match, "Line2 regex did not match")
-
-        if not match or match is None:
-            self.fail()
+        if match is None:
+            self.fail("Line2 regex did not match")
 
         groups: Dict[str, str] = match.groupdict()
 
@@ -122,171 +158,41 @@ class TestTLERegex(unittest.TestCase):
                 f"Mismatch for {key}: expected {value}, got {groups[key]}",
             )
 
-    def test_iss2LE(self) -> None:
-        line1, line2 = self.extract_lines(iss2LE)
-        expected_line1 = {
-            "id": "25544",
-            "classification": "U",
-            "designator": "98067A",
-            "year": "20",
-            "day": "062.59097222",
-            "first_derivative_of_mean_motion": ".00016717",
-            "second_derivative_of_mean_motion": "00000-0",
-            "drag": "10270-3",
-            "ephemeris": "0",
-            "set": "9006",
-        }
-        expected_line2 = {
-            "id": "25544",
-            "inclination": "51.6442",
-            "raan": "147.1064",
-            "eccentricity": "0004607",
-            "argument_of_perigee": "95.6506",
-            "mean_anomaly": "329.8285",
-            "mean_motion": "15.49249062",
-            "number_of_revolutions": "2423",
-        }
-        self.check_line1(line1, expected_line1)
-        self.check_line2(line2, expected_line2)
-
-    def test_iss3LE(self) -> None:
-        line1, line2 = self.extract_lines(iss3LE)
-        # For iss3LE, the TLE lines are identical to iss2LE.
-        expected_line1 = {
-            "id": "25544",
-            "classification": "U",
-            "designator": "98067A",
-            "year": "20",
-            "day": "062.59097222",
-            "first_derivative_of_mean_motion": ".00016717",
-            "second_derivative_of_mean_motion": "00000-0",
-            "drag": "10270-3",
-            "ephemeris": "0",
-            "set": "9006",
-        }
-        expected_line2 = {
-            "id": "25544",
-            "inclination": "51.6442",
-            "raan": "147.1064",
-            "eccentricity": "0004607",
-            "argument_of_perigee": "95.6506",
-            "mean_anomaly": "329.8285",
-            "mean_motion": "15.49249062",
-            "number_of_revolutions": "2423",
-        }
-        self.check_line1(line1, expected_line1)
-        self.check_line2(line2, expected_line2)
+    def test_iss_variants(self) -> None:
+        # Each ISS fixture differs from the shared expectations only in the overridden
+        # fields of line 1 and line 2:
+        cases = [
+            ("iss2LE", iss2LE, {}, {}),
+            ("iss3LE", iss3LE, {}, {}),
+            ("iss3LEClassified", iss3LEClassified, {"classification": "C"}, {}),
+            ("iss3LESecret", iss3LESecret, {"classification": "S"}, {}),
+            ("iss3LEWithAlpha5", iss3LEWithAlpha5, {"id": "E5544"}, {"id": "E5544"}),
+            (
+                "iss3LEWithAlpha5Zeroth",
+                iss3LEWithAlpha5Zeroth,
+                {"id": "E5544"},
+                {"id": "E5544"},
+            ),
+        ]
 
-    def test_iss3LEClassified(self) -> None:
-        line1, line2 = self.extract_lines(iss3LEClassified)
-        expected_line1 = {
-            "id": "25544",
-            "classification": "C",
-            "designator": "98067A",
-            "year": "20",
-            "day": "062.59097222",
-            "first_derivative_of_mean_motion": ".00016717",
-            "second_derivative_of_mean_motion": "00000-0",
-            "drag": "10270-3",
-            "ephemeris": "0",
-            "set": "9006",
-        }
-        expected_line2 = {
-            "id": "25544",
-            "inclination": "51.6442",
-            "raan": "147.1064",
-            "eccentricity": "0004607",
-            "argument_of_perigee": "95.6506",
-            "mean_anomaly": "329.8285",
-            "mean_motion": "15.49249062",
-            "number_of_revolutions": "2423",
-        }
-        self.check_line1(line1, expected_line1)
-        self.check_line2(line2, expected_line2)
+        for name, tle, line1_overrides, line2_overrides in cases:
+            with self.subTest(tle=name):
+                line1, line2 = extract_lines(tle)
+                self.check_line1(line1, {**ISS_LINE1, **line1_overrides})
+                self.check_line2(line2, {**ISS_LINE2, **line2_overrides})
 
-    def test_iss3LESecret(self) -> None:
-        line1, line2 = self.extract_lines(iss3LESecret)
-        expected_line1 = {
-            "id": "25544",
-            "classification": "S",
-            "designator": "98067A",
-            "year": "20",
-            "day": "062.59097222",
-            "first_derivative_of_mean_motion": ".00016717",
-            "second_derivative_of_mean_motion": "00000-0",
-            "drag": "10270-3",
-            "ephemeris": "0",
-            "set": "9006",
-        }
-        expected_line2 = {
-            "id": "25544",
-            "inclination": "51.6442",
-            "raan": "147.1064",
-            "eccentricity": "0004607",
-            "argument_of_perigee": "95.6506",
-            "mean_anomaly": "329.8285",
-            "mean_motion": "15.49249062",
-            "number_of_revolutions": "2423",
-        }
-        self.check_line1(line1, expected_line1)
-        self.check_line2(line2, expected_line2)
+    def test_regex_rejects_trailing_garbage(self) -> None:
+        line1, line2 = extract_lines(iss2LE)
 
-    def test_iss3LEWithAlpha5(self) -> None:
-        line1, line2 = self.extract_lines(iss3LEWithAlpha5)
-        expected_line1 = {
-            "id": "E5544",
-            "classification": "U",
-            "designator": "98067A",
-            "year": "20",
-            "day": "062.59097222",
-            "first_derivative_of_mean_motion": ".00016717",
-            "second_derivative_of_mean_motion": "00000-0",
-            "drag": "10270-3",
-            "ephemeris": "0",
-            "set": "9006",
-        }
-        expected_line2 = {
-            "id": "E5544",
-            "inclination": "51.6442",
-            "raan": "147.1064",
-            "eccentricity": "0004607",
-            "argument_of_perigee": "95.6506",
-            "mean_anomaly": "329.8285",
-            "mean_motion": "15.49249062",
-            "number_of_revolutions": "2423",
-        }
-        self.check_line1(line1, expected_line1)
-        self.check_line2(line2, expected_line2)
+        # The line patterns are anchored, so match() rejects anything after the line:
+        self.assertIsNone(line1_regex.match(f"{line1} garbage"))
+        self.assertIsNone(line2_regex.match(f"{line2} garbage"))
 
-    def test_iss3LEWithAlpha5Zeroth(self) -> None:
-        line1, line2 = self.extract_lines(iss3LEWithAlpha5Zeroth)
-        expected_line1 = {
-            "id": "E5544",
-            "classification": "U",
-            "designator": "98067A",
-            "year": "20",
-            "day": "062.59097222",
-            "first_derivative_of_mean_motion": ".00016717",
-            "second_derivative_of_mean_motion": "00000-0",
-            "drag": "10270-3",
-            "ephemeris": "0",
-            "set": "9006",
-        }
-        expected_line2 = {
-            "id": "E5544",
-            "inclination": "51.6442",
-            "raan": "147.1064",
-            "eccentricity": "0004607",
-            "argument_of_perigee": "95.6506",
-            "mean_anomaly": "329.8285",
-            "mean_motion": "15.49249062",
-            "number_of_revolutions": "2423",
-        }
-        self.check_line1(line1, expected_line1)
-        self.check_line2(line2, expected_line2)
+        self.assertIsNotNone(line1_regex.match(line1))
+        self.assertIsNotNone(line2_regex.match(line2))
 
     def test_iss3LEWithIncorrectSpacing(self) -> None:
-        line1, line2 = self.extract_lines(iss3LEWithIncorrectSpacing)
+        line1, line2 = extract_lines(iss3LEWithIncorrectSpacing)
         expected_line1 = {
             "id": "25544",
             "classification": "U",
@@ -347,6 +253,110 @@ class TestTLERegex(unittest.TestCase):
 # **************************************************************************************
 
 
+class TestSliceTLELine(unittest.TestCase):
+    def test_slices_match_regex_groups(self) -> None:
+        for tle in (iss2LE, iss3LEWithAlpha5, iss3LEWithIncorrectSpacing, starlink5833):
+            lines = [line.strip() for line in tle.splitlines() if line.strip()]
+
+            line1, line2 = lines[-2], lines[-1]
+
+            with self.subTest(line=line1):
+                match = line1_regex.fullmatch(line1)
+                self.assertIsNotNone(match)
+                assert match is not None
+                self.assertEqual(
+                    slice_tle_line(line1, "1", line1_columns, line1_separators),
+                    match.groupdict(),
+                )
+
+            with self.subTest(line=line2):
+                match = line2_regex.fullmatch(line2)
+                self.assertIsNotNone(match)
+                assert match is not None
+                self.assertEqual(
+                    slice_tle_line(line2, "2", line2_columns, line2_separators),
+                    match.groupdict(),
+                )
+
+    def test_non_standard_layout_returns_none(self) -> None:
+        line1 = "1 25544U 98067A   08264.51782528 -.00002182  00000-0 -11606-4 0  2927"
+
+        # Wrong line number:
+        self.assertIsNone(slice_tle_line(line1, "2", line1_columns, line1_separators))
+
+        # Wrong length:
+        self.assertIsNone(
+            slice_tle_line(line1 + " ", "1", line1_columns, line1_separators)
+        )
+
+        # Shifted columns:
+        self.assertIsNone(
+            slice_tle_line(
+                line1.replace("98067A   ", "98067A  ") + " ",
+                "1",
+                line1_columns,
+                line1_separators,
+            )
+        )
+
+    def test_parse_tle_falls_back_to_regex(self) -> None:
+        tle = """
+        ISS (ZARYA)
+        1 25544U 98067A  20062.59097222  .00016717  00000-0  10270-3 0  9006
+        2 25544  51.6442 147.1064 0004607  95.6506 329.8285 15.49249062  2423
+        """
+
+        satellite = parse_tle(tle)
+
+        self.assertEqual(satellite.id, 25544)
+        self.assertEqual(satellite.designator, "98067A")
+        self.assertEqual(satellite.set, 9006)
+        self.assertEqual(satellite.number_of_revolutions, 2423)
+
+    def test_corrupted_columns_raise_value_error(self) -> None:
+        line1 = "1 25544U 98067A   20062.59097222  .00016717  00000-0  10270-3 0  9006"
+        line2 = "2 25544  51.6442 147.1064 0004607  95.6506 329.8285 15.49249062  2423"
+
+        def replace(line: str, start: int, value: str) -> str:
+            return line[:start] + value + line[start + len(value) :]
+
+        cases = [
+            # The decimal point of the inclination (line 2, column 11):
+            ("inclination", line1, replace(line2, 11, "3")),
+            # The leading digit of the eccentricity (line 2, column 26):
+            ("eccentricity", line1, replace(line2, 26, " ")),
+            # The second derivative of mean motion (line 1, columns 44-52):
+            ("second_derivative", replace(line1, 44, " ABCDE-0"), line2),
+            # The B* drag term (line 1, columns 53-61):
+            ("drag", replace(line1, 53, " 1O27O-3"), line2),
+            # The international designator (line 1, columns 9-17):
+            ("designator", replace(line1, 9, "98#67A  "), line2),
+        ]
+
+        for name, corrupted_line1, corrupted_line2 in cases:
+            with self.subTest(field=name):
+                self.assertEqual(len(corrupted_line1), 69)
+                self.assertEqual(len(corrupted_line2), 69)
+
+                # The corrupted line is rejected by its column formats:
+                self.assertTrue(
+                    slice_tle_line(
+                        corrupted_line1, "1", line1_columns, line1_separators
+                    )
+                    is None
+                    or slice_tle_line(
+                        corrupted_line2, "2", line2_columns, line2_separators
+                    )
+                    is None
+                )
+
+                with self.assertRaises(ValueError):
+                    parse_tle(f"{corrupted_line1}\n{corrupted_line2}")
+
+
+# **************************************************************************************
+
+
 class TestTLEParser(unittest.TestCase):
     def test_parse_tle_defined(self):
         # Simply verify that parse_tle is defined and callable:
@@ -443,6 +453,140 @@ class TestTLEParser(unittest.TestCase):
         with self.assertRaises(ValueError, msg="Invalid TLE format"):
             parse_tle("")
 
+    def test_swapped_lines_are_invalid(self):
+        line1, line2 = iss2LE.strip().splitlines()
+
+        with self.assertRaises(ValueError, msg="Invalid TLE format"):
+            parse_tle(f"{line2}\n{line1}")
+
+    def test_mismatched_catalog_numbers_are_invalid(self):
+        tle = iss2LE.replace("2 25544", "2 25545")
+
+        with self.assertRaises(ValueError, msg="Mismatched catalog numbers"):
+            parse_tle(tle)
+
+    def test_empty_lines_are_invalid(self):
+        line1, line2 = iss2LE.strip().splitlines()
+
+        for lines in (("", line2.strip()), (line1.strip(), ""), ("", "")):
+            with self.subTest(lines=lines):
+                with self.assertRaises(ValueError, msg="Invalid TLE format"):
+                    parse_tle_lines("", *lines)
+
+
+# **************************************************************************************
+
+
+class TestParseIDField(unittest.TestCase):
+    def test_parse_numeric_id(self):
+        self.assertEqual(parse_id_field("25544"), 25544)
+        self.assertEqual(parse_id_field(" 5544"), 5544)
+
+    def test_parse_alpha5_id(self):
+        self.assertEqual(parse_id_field("E5544"), 23754532)
+
+    def test_invalid_id_returns_none(self):
+        for value in ["", "12A4", "-1", "+12", "1_000", "²", "A 12", None, 25544]:
+            with self.subTest(value=value):
+                self.assertIsNone(parse_id_field(value))
+
+
+# **************************************************************************************
+
+
+class TestParseEpochField(unittest.TestCase):
+    def test_julian_dates_of_known_epochs(self):
+        cases = [
+            # J2000.0 day, 2000-01-01T00:00:00 UTC:
+            ("00001.00000000", 2000, 1.0, 2451544.5),
+            # 2020-03-01T00:00:00 UTC, day 61 of a leap year:
+            ("20061.00000000", 2020, 61.0, 2458909.5),
+            # 2024-12-31T12:00:00 UTC, day 366 of a leap year:
+            ("24366.50000000", 2024, 366.5, 2460676.0),
+            # 1957-01-01T00:00:00 UTC, the first year of the two digit year window:
+            ("57001.00000000", 1957, 1.0, 2435839.5),
+            # 2056-01-01T00:00:00 UTC, the last year of the two digit year window:
+            ("56001.00000000", 2056, 1.0, 2471998.5),
+        ]
+
+        for value, year, day, jd in cases:
+            with self.subTest(epoch=value):
+                self.assertEqual(parse_epoch_field(value), (year, day, jd))
+
+    def test_invalid_epoch_returns_none(self):
+        for value in ["", "2O061.0", None]:
+            with self.subTest(value=value):
+                self.assertIsNone(parse_epoch_field(value))
+
+
+# **************************************************************************************
+
+
+class TestParseTLEs(unittest.TestCase):
+    def test_parse_mixed_catalog(self):
+        catalog = iss2LE + iss3LE + iss3LEWithAlpha5Zeroth + starlink5833
+
+        satellites = list(parse_tles(catalog))
+
+        self.assertEqual(len(satellites), 4)
+
+        self.assertEqual(
+            [satellite.name for satellite in satellites],
+            ["", "ISS (ZARYA)", "ISS (ZARYA)", "STARLINK-5833"],
+        )
+
+        self.assertEqual(
+            [satellite.id for satellite in satellites],
+            [25544, 25544, 23754532, 55773],
+        )
+
+    def test_matches_parse_tle(self):
+        for tle in (iss2LE, iss3LE, iss3LEClassified, starlink5833):
+            with self.subTest(tle=tle):
+                (satellite,) = parse_tles(tle)
+                self.assertEqual(satellite, parse_tle(tle))
+
+    def test_parse_iterable_of_lines(self):
+        satellites = list(parse_tles(iter((iss3LE + starlink5833).splitlines())))
+
+        self.assertEqual(len(satellites), 2)
+        self.assertEqual(satellites[1].name, "STARLINK-5833")
+
+    def test_parse_empty_catalog(self):
+        self.assertEqual(list(parse_tles("")), [])
+
+    def test_truncated_catalog_is_invalid(self):
+        catalog = iss3LE + "\n".join(starlink5833.strip().splitlines()[:2])
+
+        satellites = parse_tles(catalog)
+
+        self.assertEqual(next(satellites).name, "ISS (ZARYA)")
+
+        with self.assertRaises(ValueError):
+            next(satellites)
+
+    def test_orphaned_line2_is_invalid(self):
+        line2 = iss2LE.strip().splitlines()[1]
+
+        catalog = iss3LE + line2 + "\n" + starlink5833
+
+        satellites = parse_tles(catalog)
+
+        self.assertEqual(next(satellites).name, "ISS (ZARYA)")
+
+        with self.assertRaises(ValueError):
+            next(satellites)
+
+    def test_consecutive_name_lines_are_invalid(self):
+        catalog = "ISS (ZARYA)\n" + starlink5833
+
+        with self.assertRaises(ValueError):
+            list(parse_tles(catalog))
+
+    def test_trailing_name_line_is_invalid(self):
+        with self.assertRaises(ValueError):
+            list(parse_tles(iss3LE + "STARLINK-5833\n"))
+
 
 # **************************************************************************************
 
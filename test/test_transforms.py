@@ -36,11 +36,14 @@ class TestIdentityTransformProvider(unittest.TestCase):
 
         transform = identity_transform_provider(when)
 
-        expected_rotation = Quaternion.identity()
-        self.assertEqual(transform.rotation.w, expected_rotation.w)
-        self.assertEqual(transform.rotation.x, expected_rotation.x)
-        self.assertEqual(transform.rotation.y, expected_rotation.y)
-        self.assertEqual(transform.rotation.z, expected_rotation.z)
+        expected = Quaternion.identity()
+
+        rotation = transform.rotation
+
+        self.assertEqual(
+            (rotation.w, rotation.x, rotation.y, rotation.z),
+            (expected.w, expected.x, expected.y, expected.z),
+        )
 
     def test_returns_zero_translation(self) -> None:
         """
@@ -50,9 +53,7 @@ class TestIdentityTransformProvider(unittest.TestCase):
 
         transform = identity_transform_provider(when)
 
-        self.assertEqual(transform.translation["x"], 0.0)
-        self.assertEqual(transform.translation["y"], 0.0)
-        self.assertEqual(transform.translation["z"], 0.0)
+        self.assertEqual(transform.translation, {"x": 0.0, "y": 0.0, "z": 0.0})
 
     def test_datetime_invariant(self) -> None:
         """
@@ -60,12 +61,14 @@ class TestIdentityTransformProvider(unittest.TestCase):
         """
         when = datetime(2020, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
 
-        transform = identity_transform_provider(when)
+        rotation = identity_transform_provider(when).rotation
 
-        self.assertEqual(transform.rotation.w, 1.0)
-        self.assertEqual(transform.rotation.x, 0.0)
-        self.assertEqual(transform.rotation.y, 0.0)
-        self.assertEqual(transform.rotation.z, 0.0)
+        expected = Quaternion.identity()
+
+        self.assertEqual(
+            (rotation.w, rotation.x, rotation.y, rotation.z),
+            (expected.w, expected.x, expected.y, expected.z),
+        )
 
     def test_accepts_none_parameter(self):
         """
@@ -74,39 +77,43 @@ class TestIdentityTransformProvider(unittest.TestCase):
         transform = identity_transform_provider(None)
 
         self.assertIsNotNone(transform)
-        self.assertEqual(transform.translation["x"], 0.0)
-        self.assertEqual(transform.translation["y"], 0.0)
-        self.assertEqual(transform.translation["z"], 0.0)
+        self.assertEqual(transform.translation, {"x": 0.0, "y": 0.0, "z": 0.0})
 
     def test_identity_transform_preserves_vectors(self) -> None:
         """
         Test that applying the identity transform preserves vectors.
         """
         when = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
         transform = identity_transform_provider(when)
+
         position = CartesianCoordinate(x=100.0, y=200.0, z=300.0)
 
         result = transform.apply_to_position(position)
-        self.assertEqual(result["x"], position["x"])
-        self.assertEqual(result["y"], position["y"])
-        self.assertEqual(result["z"], position["z"])
+        self.assertEqual(
+            (result["x"], result["y"], result["z"]),
+            (position["x"], position["y"], position["z"]),
+        )
 
     def test_identity_transform_inverse_is_identity(self) -> None:
         """
         Test that the inverse of an identity transform is also identity.
         """
         when = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
         transform = identity_transform_provider(when)
 
         inverse = transform.inverse()
 
-        self.assertEqual(inverse.rotation.w, 1.0)
-        self.assertEqual(inverse.rotation.x, 0.0)
-        self.assertEqual(inverse.rotation.y, 0.0)
-        self.assertEqual(inverse.rotation.z, 0.0)
-        self.assertEqual(inverse.translation["x"], 0.0)
-        self.assertEqual(inverse.translation["y"], 0.0)
-        self.assertEqual(inverse.translation["z"], 0.0)
+        expected = Quaternion.identity()
+
+        rotation = inverse.rotation
+
+        self.assertEqual(
+            (rotation.w, rotation.x, rotation.y, rotation.z),
+            (expected.w, expected.x, expected.y, expected.z),
+        )
+        self.assertEqual(inverse.translation, {"x": 0.0, "y": 0.0, "z": 0.0})
 
 
 # **************************************************************************************
@@ -157,17 +164,13 @@ class TestECEFToECITransformProvider(unittest.TestCase):
 
         transform = ecef_to_eci_transform_provider(when)
 
-        self.assertEqual(transform.translation["x"], 0.0)
-        self.assertEqual(transform.translation["y"], 0.0)
-        self.assertEqual(transform.translation["z"], 0.0)
+        self.assertEqual(transform.translation, {"x": 0.0, "y": 0.0, "z": 0.0})
 
         when = datetime(2025, 6, 1, 0, 0, 0, tzinfo=timezone.utc)
 
         transform = ecef_to_eci_transform_provider(when)
 
-        self.assertEqual(transform.translation["x"], 0.0)
-        self.assertEqual(transform.translation["y"], 0.0)
-        self.assertEqual(transform.translation["z"], 0.0)
+        self.assertEqual(transform.translation, {"x": 0.0, "y": 0.0, "z": 0.0})
 
 
 # **************************************************************************************
@@ -218,17 +221,13 @@ class TestECIToECEFTransformProvider(unittest.TestCase):
 
         transform = eci_to_ecef_transform_provider(when)
 
-        self.assertEqual(transform.translation["x"], 0.0)
-        self.assertEqual(transform.translation["y"], 0.0)
-        self.assertEqual(transform.translation["z"], 0.0)
+        self.assertEqual(transform.translation, {"x": 0.0, "y": 0.0, "z": 0.0})
 
         when = datetime(2025, 6, 1, 0, 0, 0, tzinfo=timezone.utc)
 
         transform = eci_to_ecef_transform_provider(when)
 
-        self.assertEqual(transform.translation["x"], 0.0)
-        self.assertEqual(transform.translation["y"], 0.0)
-        self.assertEqual(transform.translation["z"], 0.0)
+        self.assertEqual(transform.translation, {"x": 0.0, "y": 0.0, "z": 0.0})
 
 
 # **************************************************************************************
@@ -358,18 +357,7 @@ class TestEME2000ToECITransformProvider(unittest.TestCase):
             when=when,
         )
 
-        self.assertEqual(
-            transform.translation["x"],
-            0.0,
-        )
-        self.assertEqual(
-            transform.translation["y"],
-            0.0,
-        )
-        self.assertEqual(
-            transform.translation["z"],
-            0.0,
-        )
+        self.assertEqual(transform.translation, {"x": 0.0, "y": 0.0, "z": 0.0})
 
 
 # **************************************************************************************
@@ -386,10 +374,17 @@ class TestITRFToECEFTransformProvider(unittest.TestCase):
 
         expected_rotation = Quaternion.identity()
 
-        self.assertEqual(transform.rotation.w, expected_rotation.w)
-        self.assertEqual(transform.rotation.x, expected_rotation.x)
-        self.assertEqual(transform.rotation.y, expected_rotation.y)
-        self.assertEqual(transform.rotation.z, expected_rotation.z)
+        rotation = transform.rotation
+
+        self.assertEqual(
+            (rotation.w, rotation.x, rotation.y, rotation.z),
+            (
+                expected_rotation.w,
+                expected_rotation.x,
+                expected_rotation.y,
+                expected_rotation.z,
+            ),
+        )
 
     def test_itrf_to_ecef_has_zero_translation(self) -> None:
         """
@@ -399,9 +394,7 @@ class TestITRFToECEFTransformProvider(unittest.TestCase):
 
         transform = itrf_to_ecef_transform_provider(when)
 
-        self.assertEqual(transform.translation["x"], 0.0)
-        self.assertEqual(transform.translation["y"], 0.0)
-        self.assertEqual(transform.translation["z"], 0.0)
+        self.assertEqual(transform.translation, {"x": 0.0, "y": 0.0, "z": 0.0})
 
 
 # **************************************************************************************
@@ -484,9 +477,7 @@ class TestTEMEToECITransformProvider(unittest.TestCase):
 
         transform = teme_to_eci_transform_provider(when)
 
-        self.assertEqual(transform.translation["x"], 0.0)
-        self.assertEqual(transform.translation["y"], 0.0)
-        self.assertEqual(transform.translation["z"], 0.0)
+        self.assertEqual(transform.translation, {"x": 0.0, "y": 0.0, "z": 0.0})
 
 
 # **************************************************************************************
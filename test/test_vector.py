@@ -9,6 +9,7 @@ import math
 import unittest
 
 from satelles import (
+    Axis,
     CartesianCoordinate,
     add,
     angle,
@@ -454,6 +455,26 @@ class TestRotateFunction(unittest.TestCase):
         with self.assertRaises(ValueError):
             rotate(vector, 45, "a")  # "a" is not a valid axis
 
+    def test_integer_axis_is_invalid(self):
+        """
+        Verify that integers and booleans are not accepted in place of an Axis member.
+        """
+        vector = CartesianCoordinate(x=1, y=0, z=0)
+
+        for axis in (0, 1, 2, True, False, 1.0):
+            with self.subTest(axis=axis):
+                with self.assertRaises(ValueError):
+                    rotate(vector, 45, axis)  # type: ignore[arg-type]
+
+    def test_rotate_with_axis_enumeration(self):
+        """
+        Verify that rotating around an Axis member matches the equivalent axis name.
+        """
+        vector = CartesianCoordinate(x=1.0, y=2.0, z=3.0)
+        for axis, name in ((Axis.X, "x"), (Axis.Y, "y"), (Axis.Z, "z")):
+            with self.subTest(axis=axis):
+                self.assertEqual(rotate(vector, 30, axis), rotate(vector, 30, name))
+
 
 # **************************************************************************************
 
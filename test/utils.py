@@ -6,6 +6,7 @@
 # **************************************************************************************
 
 import unittest
+from math import isclose
 
 from satelles.common import CartesianCoordinate
 
@@ -23,5 +24,13 @@ class SatellesTestCase(unittest.TestCase):
         self.assertAlmostEqual(expected["y"], actual["y"], places=places)
         self.assertAlmostEqual(expected["z"], actual["z"], places=places)
 
+    def assertIsClose(self, first: float, second: float, places: int = 7) -> None:
+        # Equivalent to assertAlmostEqual(first, second, places=places), but compared
+        # directly with math.isclose rather than by rounding the difference:
+        tolerance = 0.5 * 10**-places
+
+        if not isclose(first, second, rel_tol=0.0, abs_tol=tolerance):
+            self.fail(f"{first!r} != {second!r} within {places} places")
+
 
 # **************************************************************************************